@@ -1,6 +1,11 @@
 -- BATCHED VERSION: Processes data year-by-year to avoid timeouts
 -- This script should be run with @process_year variable set
 -- Usage: Called by Python script run_batched_processing.py
+--
+-- Stage markers ("-- @stage: <name> [after <stage> ...]") split the script for the pooled
+-- executor in sql_stage_executor.py. Statements before the first marker run at the start of
+-- every stage's session; "after" lists the stages of the same year that must finish first.
+-- The markers are plain comments, so the script still runs unchanged through SOURCE.
 
 #Batter Points
 SET @single = 3;
@@ -25,12 +30,14 @@ SET @cg=2.5;
 SET @cgs=2.5;
 SET @nh=5;
 
+-- @stage: year_started
 SELECT '###################################' AS '';
 SELECT CONCAT('# PROCESSING YEAR: ', @process_year, ' #') AS '';
 SELECT '###################################' AS '';
 SELECT NOW() AS 'Batch Start Time';
 SELECT '' AS '';
 
+-- @stage: at_bat_level after year_started
 -- ========================================
 -- CREATE TABLES (drop on first run only)
 -- ========================================
@@ -203,12 +210,14 @@ SELECT '========================================' AS '';
 -- Delete existing data for this year (in case of re-run)
 DELETE FROM retrosheet.at_bat_level WHERE YEAR_ID = @process_year;
 
--- Insert data for the specified year
+-- Insert data for the specified year.
+-- Generated from the stat lists in generate_at_bat_level_sql.py; edit those, not this block.
+-- BEGIN GENERATED: at_bat_level insert (generate_at_bat_level_sql.py --write)
 INSERT INTO retrosheet.at_bat_level
 	SELECT seq_events,
-	       E.YEAR_ID,
-	       E.GAME_ID,
-	       STR_TO_DATE(SUBSTRING(E.GAME_ID, 4, 8), '%Y%m%d') AS GAME_DATE,
+	       YEAR_ID,
+	       GAME_ID,
+	       GAME_DATE,
 	       bat_id,
 	       PA_BALL_CT,
 	       PA_SWINGMISS_STRIKE_CT,
@@ -243,44 +252,43 @@ INSERT INTO retrosheet.at_bat_level
 	       WIN_PIT_ID,
 	       park_id,
 	       DAYNIGHT_PARK_CD,
-		SUM(CASE WHEN EVENT_CD IN ("20", "21", "22", "23") THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_hits,
-		SUM(CASE WHEN ab_fl= 'T' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_ab,
-		SUM(CASE WHEN EVENT_CD IN ("20", "21", "22", "23") THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT)/NULLIF(SUM(CASE WHEN ab_fl= 'T' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY bat_id, E.GAME_ID, INN_CT), 0) AS game_ba,
-		SUM(CASE WHEN EVENT_CD = '20' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_singles,
-		SUM(CASE WHEN EVENT_CD = '21' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_doubles,
-		SUM(CASE WHEN EVENT_CD = '22' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_triples,
-		SUM(CASE WHEN EVENT_CD = '23' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_hr,
-		SUM(CASE WHEN ab_fl = 'T' OR EVENT_CD IN (14, 15, 16) THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_pa,
-		SUM(CASE WHEN EVENT_CD = '15' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_ibb,
-		SUM(CASE WHEN EVENT_CD = '14' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_ubb,
-		SUM(PA_BALL_CT) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_balls,
-		SUM(PA_SWINGMISS_STRIKE_CT) OVER (PARTITION BY bat_id, GAME_ID ORDER BY E.GAME_ID, bat_id, INN_CT) AS game_swing_strikes,
-		SUM(CASE WHEN EVENT_CD IN ("20", "21", "22", "23") THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_hits,
-		SUM(CASE WHEN ab_fl= 'T' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_ab,
-		SUM(CASE WHEN EVENT_CD IN ("20", "21", "22", "23") THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT)/NULLIF(SUM(CASE WHEN ab_fl= 'T' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT), 0) AS season_ba,
-		SUM(CASE WHEN EVENT_CD = '20' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_singles,
-		SUM(CASE WHEN EVENT_CD = '21' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_doubles,
-		SUM(CASE WHEN EVENT_CD = '22' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_triples,
-		SUM(CASE WHEN EVENT_CD = '23' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_hr,
-		SUM(CASE WHEN ab_fl = 'T' OR EVENT_CD IN (14, 15, 16) THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_pa,
-		SUM(CASE WHEN EVENT_CD = '15' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_ibb,
-		SUM(CASE WHEN EVENT_CD = '14' THEN 1 ELSE 0 END) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_ubb,
-		SUM(PA_BALL_CT) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_balls,
-		SUM(PA_SWINGMISS_STRIKE_CT) OVER (PARTITION BY bat_id, E.YEAR_ID ORDER BY E.GAME_ID, INN_CT) AS season_swing_strikes,
-
-	       CASE WHEN EVENT_CD IN ("20", "21", "22", "23") THEN 1 ELSE 0 END AS hit_fl,
+	       SUM(hits_ind) OVER game_window AS game_hits,
+	       SUM(ab_ind) OVER game_window AS game_ab,
+	       SUM(hits_ind) OVER game_window / NULLIF(SUM(ab_ind) OVER game_window, 0) AS game_ba,
+	       SUM(singles_ind) OVER game_window AS game_singles,
+	       SUM(doubles_ind) OVER game_window AS game_doubles,
+	       SUM(triples_ind) OVER game_window AS game_triples,
+	       SUM(hr_ind) OVER game_window AS game_hr,
+	       SUM(pa_ind) OVER game_window AS game_pa,
+	       SUM(ibb_ind) OVER game_window AS game_ibb,
+	       SUM(ubb_ind) OVER game_window AS game_ubb,
+	       SUM(balls_ind) OVER game_window AS game_balls,
+	       SUM(swing_strikes_ind) OVER game_window AS game_swing_strikes,
+	       SUM(hits_ind) OVER season_window AS season_hits,
+	       SUM(ab_ind) OVER season_window AS season_ab,
+	       SUM(hits_ind) OVER season_window / NULLIF(SUM(ab_ind) OVER season_window, 0) AS season_ba,
+	       SUM(singles_ind) OVER season_window AS season_singles,
+	       SUM(doubles_ind) OVER season_window AS season_doubles,
+	       SUM(triples_ind) OVER season_window AS season_triples,
+	       SUM(hr_ind) OVER season_window AS season_hr,
+	       SUM(pa_ind) OVER season_window AS season_pa,
+	       SUM(ibb_ind) OVER season_window AS season_ibb,
+	       SUM(ubb_ind) OVER season_window AS season_ubb,
+	       SUM(balls_ind) OVER season_window AS season_balls,
+	       SUM(swing_strikes_ind) OVER season_window AS season_swing_strikes,
+	       hits_ind AS hit_fl,
 	       CASE
-		 WHEN EVENT_CD = "3" THEN 2
-		 WHEN EVENT_CD IN ("20", "21", "22", "23") THEN -0.6
-		 WHEN EVENT_CD IN ("14", "16") THEN -0.6
+		 WHEN EVENT_CD = 3 THEN 2
+		 WHEN EVENT_CD IN (20, 21, 22, 23) THEN -0.6
+		 WHEN EVENT_CD IN (14, 16) THEN -0.6
 		 ELSE 0
 	       END AS pitching_points,
-		      CASE
-		 WHEN EVENT_CD = "23" THEN @hr
-		 WHEN EVENT_CD = "20" THEN @single + RBI_CT * @rbi
-		 WHEN EVENT_CD = "21" THEN @double + RBI_CT * @rbi
-		 WHEN EVENT_CD IN ("14", "16") THEN @walk + RBI_CT * @rbi
-		 WHEN EVENT_CD = "22" THEN @triple + RBI_CT * @rbi
+	       CASE
+		 WHEN EVENT_CD = 23 THEN @hr
+		 WHEN EVENT_CD = 20 THEN @single + RBI_CT * @rbi
+		 WHEN EVENT_CD = 21 THEN @double + RBI_CT * @rbi
+		 WHEN EVENT_CD IN (14, 16) THEN @walk + RBI_CT * @rbi
+		 WHEN EVENT_CD = 22 THEN @triple + RBI_CT * @rbi
 		 ELSE 0
 	       END AS batting_points,
 	       CASE
@@ -289,25 +297,77 @@ INSERT INTO retrosheet.at_bat_level
 		 WHEN BAT_HAND_CD = 'L' AND PIT_HAND_CD = 'R' THEN 3
 		 ELSE 4
 	       END AS MATCHUP_IN
-
-	FROM retrosheet.events E
-	LEFT JOIN (
-	  SELECT year_id,
-		 GAME_ID,
-		 TEMP_PARK_CT,
-		 WIND_DIRECTION_PARK_CD,
-		 WIND_SPEED_PARK_CT,
-		 PRECIP_PARK_CD,
-		 SKY_PARK_CD,
-		 WIN_PIT_ID,
-		 park_id,
-		 DAYNIGHT_PARK_CD
-	  FROM retrosheet.games
-	  WHERE year_id = @process_year
-	) G
-	ON E.GAME_ID = G.GAME_ID
-	WHERE E.YEAR_ID = @process_year
+	FROM (
+		SELECT E.seq_events,
+		       E.YEAR_ID,
+		       E.GAME_ID,
+		       STR_TO_DATE(SUBSTRING(E.GAME_ID, 4, 8), '%Y%m%d') AS GAME_DATE,
+		       E.bat_id,
+		       E.PA_BALL_CT,
+		       E.PA_SWINGMISS_STRIKE_CT,
+		       E.BAT_HOME_ID,
+		       E.BAT_FATE_ID,
+		       E.EVENT_CD,
+		       E.RBI_CT,
+		       E.event_tx,
+		       E.BAT_LINEUP_ID,
+		       E.BASE1_RUN_ID,
+		       E.BASE2_RUN_ID,
+		       E.BASE3_RUN_ID,
+		       E.RUN1_SB_FL,
+		       E.RUN2_SB_FL,
+		       E.RUN3_SB_FL,
+		       E.ab_fl,
+		       E.PR_Run1_fl,
+		       E.PR_Run2_fl,
+		       E.PR_Run3_fl,
+		       E.INN_CT,
+		       E.AWAY_SCORE_CT,
+		       E.HOME_SCORE_CT,
+		       E.HOME_TEAM_ID,
+		       E.BAT_HAND_CD,
+		       E.PIT_HAND_CD,
+		       E.PIT_ID,
+		       G.TEMP_PARK_CT,
+		       G.WIND_DIRECTION_PARK_CD,
+		       G.WIND_SPEED_PARK_CT,
+		       G.PRECIP_PARK_CD,
+		       G.SKY_PARK_CD,
+		       G.WIN_PIT_ID,
+		       G.park_id,
+		       G.DAYNIGHT_PARK_CD,
+		       CASE WHEN EVENT_CD IN (20, 21, 22, 23) THEN 1 ELSE 0 END AS hits_ind,
+		       CASE WHEN ab_fl = 'T' THEN 1 ELSE 0 END AS ab_ind,
+		       CASE WHEN EVENT_CD = 20 THEN 1 ELSE 0 END AS singles_ind,
+		       CASE WHEN EVENT_CD = 21 THEN 1 ELSE 0 END AS doubles_ind,
+		       CASE WHEN EVENT_CD = 22 THEN 1 ELSE 0 END AS triples_ind,
+		       CASE WHEN EVENT_CD = 23 THEN 1 ELSE 0 END AS hr_ind,
+		       CASE WHEN ab_fl = 'T' OR EVENT_CD IN (14, 15, 16) THEN 1 ELSE 0 END AS pa_ind,
+		       CASE WHEN EVENT_CD = 15 THEN 1 ELSE 0 END AS ibb_ind,
+		       CASE WHEN EVENT_CD = 14 THEN 1 ELSE 0 END AS ubb_ind,
+		       PA_BALL_CT AS balls_ind,
+		       PA_SWINGMISS_STRIKE_CT AS swing_strikes_ind
+		FROM retrosheet.events E
+		LEFT JOIN (
+		  SELECT GAME_ID,
+			 TEMP_PARK_CT,
+			 WIND_DIRECTION_PARK_CD,
+			 WIND_SPEED_PARK_CT,
+			 PRECIP_PARK_CD,
+			 SKY_PARK_CD,
+			 WIN_PIT_ID,
+			 park_id,
+			 DAYNIGHT_PARK_CD
+		  FROM retrosheet.games
+		  WHERE year_id = @process_year
+		) G
+		ON E.GAME_ID = G.GAME_ID
+		WHERE E.YEAR_ID = @process_year
+	) I
+	WINDOW game_window AS (PARTITION BY bat_id, YEAR_ID, GAME_ID ORDER BY INN_CT),
+	       season_window AS (PARTITION BY bat_id, YEAR_ID ORDER BY GAME_ID, INN_CT)
 ;
+-- END GENERATED: at_bat_level insert
 
 SELECT '========================================' AS '';
 SELECT CONCAT('Year ', @process_year, ' at_bat_level completed') AS '';
@@ -315,6 +375,7 @@ SELECT NOW() AS 'Completion Time';
 SELECT CONCAT('Rows inserted: ', ROW_COUNT()) AS '';
 SELECT '========================================' AS '';
 
+-- @stage: game_matchup_level after at_bat_level
 -- ========================================
 -- game_matchup_level table
 -- ========================================
@@ -499,6 +560,7 @@ SELECT NOW() AS 'Completion Time';
 SELECT CONCAT('Rows inserted: ', ROW_COUNT()) AS '';
 SELECT '========================================' AS '';
 
+-- @stage: stolen_bases after at_bat_level
 -- ========================================
 -- stolen_bases table
 -- ========================================
@@ -520,9 +582,86 @@ CREATE TABLE IF NOT EXISTS retrosheet.stolen_bases (
 	STOLEN_BASE_FL INT,
 	PIT_HAND_CD CHAR(1),
 	STOLEN_BASE_POINTS INT,
-	PRIMARY KEY (GAME_ID, BASE_STL_ID, STOLEN_BASE_FL, PIT_HAND_CD),
+	PRIMARY KEY (GAME_ID, GAME_DATE, BASE_STL_ID, STOLEN_BASE_FL, PIT_HAND_CD),
 	INDEX idx_player_date (BASE_STL_ID, GAME_DATE),
 	INDEX idx_game (GAME_ID)
+)
+PARTITION BY RANGE (YEAR(GAME_DATE)) (
+	PARTITION p1952 VALUES LESS THAN (1953),
+	PARTITION p1953 VALUES LESS THAN (1954),
+	PARTITION p1954 VALUES LESS THAN (1955),
+	PARTITION p1955 VALUES LESS THAN (1956),
+	PARTITION p1956 VALUES LESS THAN (1957),
+	PARTITION p1957 VALUES LESS THAN (1958),
+	PARTITION p1958 VALUES LESS THAN (1959),
+	PARTITION p1959 VALUES LESS THAN (1960),
+	PARTITION p1960 VALUES LESS THAN (1961),
+	PARTITION p1961 VALUES LESS THAN (1962),
+	PARTITION p1962 VALUES LESS THAN (1963),
+	PARTITION p1963 VALUES LESS THAN (1964),
+	PARTITION p1964 VALUES LESS THAN (1965),
+	PARTITION p1965 VALUES LESS THAN (1966),
+	PARTITION p1966 VALUES LESS THAN (1967),
+	PARTITION p1967 VALUES LESS THAN (1968),
+	PARTITION p1968 VALUES LESS THAN (1969),
+	PARTITION p1969 VALUES LESS THAN (1970),
+	PARTITION p1970 VALUES LESS THAN (1971),
+	PARTITION p1971 VALUES LESS THAN (1972),
+	PARTITION p1972 VALUES LESS THAN (1973),
+	PARTITION p1973 VALUES LESS THAN (1974),
+	PARTITION p1974 VALUES LESS THAN (1975),
+	PARTITION p1975 VALUES LESS THAN (1976),
+	PARTITION p1976 VALUES LESS THAN (1977),
+	PARTITION p1977 VALUES LESS THAN (1978),
+	PARTITION p1978 VALUES LESS THAN (1979),
+	PARTITION p1979 VALUES LESS THAN (1980),
+	PARTITION p1980 VALUES LESS THAN (1981),
+	PARTITION p1981 VALUES LESS THAN (1982),
+	PARTITION p1982 VALUES LESS THAN (1983),
+	PARTITION p1983 VALUES LESS THAN (1984),
+	PARTITION p1984 VALUES LESS THAN (1985),
+	PARTITION p1985 VALUES LESS THAN (1986),
+	PARTITION p1986 VALUES LESS THAN (1987),
+	PARTITION p1987 VALUES LESS THAN (1988),
+	PARTITION p1988 VALUES LESS THAN (1989),
+	PARTITION p1989 VALUES LESS THAN (1990),
+	PARTITION p1990 VALUES LESS THAN (1991),
+	PARTITION p1991 VALUES LESS THAN (1992),
+	PARTITION p1992 VALUES LESS THAN (1993),
+	PARTITION p1993 VALUES LESS THAN (1994),
+	PARTITION p1994 VALUES LESS THAN (1995),
+	PARTITION p1995 VALUES LESS THAN (1996),
+	PARTITION p1996 VALUES LESS THAN (1997),
+	PARTITION p1997 VALUES LESS THAN (1998),
+	PARTITION p1998 VALUES LESS THAN (1999),
+	PARTITION p1999 VALUES LESS THAN (2000),
+	PARTITION p2000 VALUES LESS THAN (2001),
+	PARTITION p2001 VALUES LESS THAN (2002),
+	PARTITION p2002 VALUES LESS THAN (2003),
+	PARTITION p2003 VALUES LESS THAN (2004),
+	PARTITION p2004 VALUES LESS THAN (2005),
+	PARTITION p2005 VALUES LESS THAN (2006),
+	PARTITION p2006 VALUES LESS THAN (2007),
+	PARTITION p2007 VALUES LESS THAN (2008),
+	PARTITION p2008 VALUES LESS THAN (2009),
+	PARTITION p2009 VALUES LESS THAN (2010),
+	PARTITION p2010 VALUES LESS THAN (2011),
+	PARTITION p2011 VALUES LESS THAN (2012),
+	PARTITION p2012 VALUES LESS THAN (2013),
+	PARTITION p2013 VALUES LESS THAN (2014),
+	PARTITION p2014 VALUES LESS THAN (2015),
+	PARTITION p2015 VALUES LESS THAN (2016),
+	PARTITION p2016 VALUES LESS THAN (2017),
+	PARTITION p2017 VALUES LESS THAN (2018),
+	PARTITION p2018 VALUES LESS THAN (2019),
+	PARTITION p2019 VALUES LESS THAN (2020),
+	PARTITION p2020 VALUES LESS THAN (2021),
+	PARTITION p2021 VALUES LESS THAN (2022),
+	PARTITION p2022 VALUES LESS THAN (2023),
+	PARTITION p2023 VALUES LESS THAN (2024),
+	PARTITION p2024 VALUES LESS THAN (2025),
+	PARTITION p2025 VALUES LESS THAN (2026),
+	PARTITION p_future VALUES LESS THAN MAXVALUE
 );
 
 SELECT '========================================' AS '';
@@ -534,6 +673,9 @@ SELECT '========================================' AS '';
 DELETE FROM retrosheet.stolen_bases
 WHERE YEAR(GAME_DATE) = @process_year;
 
+-- One pass over this year's at_bat_level rows (already built by the at_bat_level stage)
+-- instead of two scans of retrosheet.events: each stolen-base event is unpivoted to one
+-- row per base whose RUNn_SB_FL is set, so every runner of a double or triple steal counts
 INSERT INTO retrosheet.stolen_bases
 	SELECT GAME_ID
 	      , GAME_DATE
@@ -542,51 +684,25 @@ INSERT INTO retrosheet.stolen_bases
 	      , PIT_HAND_CD
 	      , SUM(STOLEN_BASE_POINTS) AS STOLEN_BASE_POINTS
 	FROM (
-		SELECT GAME_ID
-		, STR_TO_DATE(SUBSTRING(GAME_ID, 4, 8), '%Y%m%d') AS GAME_DATE
-		, RUN1_SB_FL
-		, RUN2_SB_FL
-		, RUN3_SB_FL
-		, BASE1_RUN_ID
-		, BASE2_RUN_ID
-		, BASE3_RUN_ID
-		, PIT_HAND_CD
-		, event_cd
-		, CASE
-		  WHEN RUN1_SB_FL = 'T' AND RUN2_SB_FL = 'T' THEN BASE1_RUN_ID
-		  WHEN RUN1_SB_FL = 'T' AND RUN3_SB_FL = 'T' THEN BASE1_RUN_ID
-		  WHEN RUN2_SB_FL = 'T' AND RUN3_SB_FL = 'T' THEN BASE2_RUN_ID
-		  WHEN RUN1_SB_FL = 'T' THEN BASE1_RUN_ID
-		  WHEN RUN2_SB_FL = 'T' THEN BASE2_RUN_ID
-		  ELSE BASE3_RUN_ID
-		END AS BASE_STL_ID
-		, 3 AS STOLEN_BASE_POINTS
-		, 1 AS STOLEN_BASE_FL
-		FROM retrosheet.events
-		WHERE event_cd='4' AND YEAR_ID = @process_year
-		UNION
-		SELECT GAME_ID
-		, STR_TO_DATE(SUBSTRING(GAME_ID, 4, 8), '%Y%m%d') AS GAME_DATE
-		, RUN1_SB_FL
-		, RUN2_SB_FL
-		, RUN3_SB_FL
-		, BASE1_RUN_ID
-		, BASE2_RUN_ID
-		, BASE3_RUN_ID
-		, PIT_HAND_CD
-		, event_cd
-		, CASE
-		  WHEN RUN1_SB_FL = 'T' AND RUN2_SB_FL = 'T' THEN BASE2_RUN_ID
-		  WHEN RUN1_SB_FL = 'T' AND RUN3_SB_FL = 'T' THEN BASE3_RUN_ID
-		  WHEN RUN2_SB_FL = 'T' AND RUN3_SB_FL = 'T' THEN BASE3_RUN_ID
-		  WHEN RUN1_SB_FL = 'T' THEN BASE1_RUN_ID
-		  WHEN RUN2_SB_FL = 'T' THEN BASE2_RUN_ID
-		  ELSE BASE3_RUN_ID
+		SELECT A.GAME_ID
+		, A.GAME_DATE
+		, A.PIT_HAND_CD
+		, CASE B.BASE_CD
+		  WHEN 1 THEN A.BASE1_RUN_ID
+		  WHEN 2 THEN A.BASE2_RUN_ID
+		  ELSE A.BASE3_RUN_ID
 		  END AS BASE_STL_ID
 		, 3 AS STOLEN_BASE_POINTS
 		, 1 AS STOLEN_BASE_FL
-		FROM retrosheet.events
-		WHERE event_cd='4' AND YEAR_ID = @process_year
+		FROM retrosheet.at_bat_level A
+		CROSS JOIN (SELECT 1 AS BASE_CD UNION ALL SELECT 2 UNION ALL SELECT 3) B
+		WHERE A.YEAR_ID = @process_year
+		  AND A.EVENT_CD = 4
+		  AND CASE B.BASE_CD
+		      WHEN 1 THEN A.RUN1_SB_FL
+		      WHEN 2 THEN A.RUN2_SB_FL
+		      ELSE A.RUN3_SB_FL
+		      END = 'T'
 	) AS sb
 	GROUP BY GAME_ID, GAME_DATE, BASE_STL_ID, STOLEN_BASE_FL, PIT_HAND_CD
 	;
@@ -597,6 +713,7 @@ SELECT NOW() AS 'Completion Time';
 SELECT CONCAT('Rows inserted: ', ROW_COUNT()) AS '';
 SELECT '========================================' AS '';
 
+-- @stage: year_completed after game_matchup_level stolen_bases
 SELECT '' AS '';
 SELECT '###################################' AS '';
 SELECT CONCAT('# YEAR ', @process_year, ' COMPLETED #') AS '';
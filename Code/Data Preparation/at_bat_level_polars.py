@@ -0,0 +1,652 @@
+"""
+Polars engine for the yearly at_bat_level / game_matchup_level / stolen_bases build.
+
+This is an in-memory alternative to the window-function SQL in Data_Processing_DV.sql.
+Instead of ~26 separate SUM(...) OVER (...) windows, the year's events are collapsed once
+to one row per window peer group (bat_id, GAME_ID, INN_CT), sorted once, and every
+game_* / season_* column is a grouped cumulative sum over that sorted frame.
+
+The output reproduces the SQL semantics row for row, including:
+- RANGE framing of the SQL windows: rows of the same batter in the same inning are peers
+  and share one cumulative value
+- season_* windows ordered by GAME_ID as a string (home team first, then date)
+- @walk being redefined to -0.6 in the pitcher points block before batting_points is computed
+
+build_season() plans game_matchup_level and stolen_bases (an unpivot of the stolen-base
+flags) on top of the at_bat_level plan and collects all three together, so each season's
+events are read and processed once.
+
+Events can be read from retrosheet.events or from the year-partitioned files written by
+parse_retrosheet_events.py.
+
+refresh_season_incremental() appends only the games played since the season watermark, continuing
+season_* running totals from each batter's stored state, for daily in-season refreshes.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import polars as pl
+import sqlalchemy
+
+# Add parent directory to path to import Database class
+sys.path.append(str(Path(__file__).parent.parent / 'Production'))
+from create_model_ready import Database
+from sql_stage_executor import exchange_staging_table, prepare_staging_table, year_partition_ready
+import generate_at_bat_level_sql as stat_specs
+from generate_at_bat_level_sql import EVENT_COLUMNS, GAME_COLUMNS, HIT_CODES
+
+
+# Batter points (Data_Processing_DV.sql)
+BATTER_POINTS = {'single': 3, 'double': 5, 'triple': 8, 'hr': 10, 'rbi': 2, 'run': 2, 'walk': 2, 'hbp': 2, 'sb': 5}
+
+# Pitcher points (Data_Processing_DV.sql). Note @walk is reassigned here, and the SQL reads
+# @walk after this block when computing batting_points.
+PITCHER_POINTS = {'ip': 2.25, 'so': 2, 'win': 4, 'era': -2, 'ha': -0.6, 'walk': -0.6, 'hb': -0.6,
+                  'cg': 2.5, 'cgs': 2.5, 'nh': 5}
+
+
+def _indicator(stat):
+    """Polars version of generate_at_bat_level_sql.indicator_sql() for one counting stat."""
+    if 'weight' in stat:
+        return pl.col(stat['weight']).cast(pl.Int64)
+    conditions = []
+    if 'flag' in stat:
+        conditions.append(pl.col(stat['flag']) == 'T')
+    if 'event_codes' in stat:
+        conditions.append(pl.col('EVENT_CD').is_in(stat['event_codes']))
+    return pl.any_horizontal(conditions).fill_null(False).cast(pl.Int64)
+
+
+# Counting stats accumulated into game_* and season_* columns, in table order (shared with the SQL generator)
+COUNTING_STATS = {stat['name']: _indicator(stat) for stat in stat_specs.COUNTING_STATS}
+
+# Counting stats that sum a nullable column; like SQL SUM, their totals stay NULL until a non-NULL value
+WEIGHTED_STATS = {stat['name'] for stat in stat_specs.COUNTING_STATS if 'weight' in stat}
+
+AT_BAT_LEVEL_COLUMNS = (
+    EVENT_COLUMNS[:3] + ['GAME_DATE'] + EVENT_COLUMNS[3:] + GAME_COLUMNS[1:]
+    + [column for scope in stat_specs.WINDOWS for column, _ in stat_specs.stat_columns(scope)]
+    + ['hit_fl', 'pitching_points', 'batting_points', 'MATCHUP_IN']
+)
+
+GAME_MATCHUP_LEVEL_COLUMNS = [
+    'YEAR_ID', 'GAME_ID', 'GAME_DATE', 'BAT_HAND_CD', 'PIT_HAND_CD', 'bat_id', 'BAT_HOME_ID', 'RBI_CT',
+    'BAT_LINEUP_ID', 'AWAY_SCORE_CT', 'HOME_SCORE_CT', 'HOME_TEAM_ID'
+] + GAME_COLUMNS[1:] + [f'game_{stat}' for stat in COUNTING_STATS] + ['pitching_points', 'batting_points']
+
+STOLEN_BASES_COLUMNS = ['GAME_ID', 'GAME_DATE', 'BASE_STL_ID', 'STOLEN_BASE_FL', 'PIT_HAND_CD', 'STOLEN_BASE_POINTS']
+
+# Window peer group: rows of one batter in one inning of one game share a cumulative value
+PEER_KEYS = ['bat_id', 'YEAR_ID', 'GAME_ID', 'INN_CT']
+
+# Last game appended to at_bat_level per season, used by the incremental refresh
+WATERMARK_TABLE = 'retrosheet.at_bat_level_watermark'
+
+# Retrosheet GAME_ID: home team, date, game number (e.g. BOS202304150)
+GAME_ID_PATTERN = re.compile(r'^[A-Z0-9]{3}\d{9}$')
+
+
+def _round_half_up(expr, decimals):
+    """Round non-negative values half up, as MariaDB does when storing into DECIMAL."""
+    scale = 10 ** decimals
+    return (expr * scale + 0.5).floor() / scale
+
+
+def _peer_sum(stat):
+    """Sum of one indicator over a window peer group (NULL if every weight is NULL, as in SQL)."""
+    total = pl.col(f'_{stat}').sum()
+    if stat in WEIGHTED_STATS:
+        total = pl.when(pl.col(f'_{stat}').is_not_null().any()).then(total)
+    return total.alias(f'_{stat}')
+
+
+def _running_sum(stat, partition):
+    """SUM(...) OVER a window partition, over peer groups sorted in window order."""
+    total = pl.col(f'_{stat}').cum_sum()
+    if stat in WEIGHTED_STATS:
+        # cum_sum leaves NULL inputs NULL; SQL carries the running total over them
+        total = total.forward_fill()
+    return total.over(partition)
+
+
+def _game_date():
+    """STR_TO_DATE(SUBSTRING(GAME_ID, 4, 8), '%Y%m%d')"""
+    return pl.col('GAME_ID').str.slice(3, 8).str.strptime(pl.Date, '%Y%m%d', strict=False)
+
+
+def _at_bat_level_plan(events, games, season_offsets=None):
+    """Lazy plan behind build_at_bat_level()."""
+    events = events.lazy().select(EVENT_COLUMNS).with_columns(pl.col('EVENT_CD').cast(pl.Int32, strict=False))
+    games = games.lazy().select(GAME_COLUMNS).unique(subset='GAME_ID', keep='first')
+
+    indicators = events.with_columns([expr.alias(f'_{stat}') for stat, expr in COUNTING_STATS.items()])
+
+    # One row per window peer group, sorted once by (bat_id, YEAR_ID, GAME_ID, INN_CT). Both the game
+    # partition (bat_id, GAME_ID) and the season partition (bat_id, YEAR_ID) are prefixes of this order.
+    peers = (
+        indicators
+        .group_by(PEER_KEYS)
+        .agg([_peer_sum(stat) for stat in COUNTING_STATS])
+        .sort(PEER_KEYS)
+        .with_columns(
+            [_running_sum(stat, ['bat_id', 'GAME_ID']).alias(f'game_{stat}') for stat in COUNTING_STATS]
+            + [_running_sum(stat, ['bat_id', 'YEAR_ID']).alias(f'season_{stat}') for stat in COUNTING_STATS]
+        )
+        .drop([f'_{stat}' for stat in COUNTING_STATS])
+    )
+    if season_offsets is not None:
+        offsets = season_offsets.lazy().select(
+            [pl.col('bat_id')] + [pl.col(f'season_{stat}').cast(pl.Int64).alias(f'_offset_{stat}')
+                                  for stat in COUNTING_STATS])
+        peers = (
+            peers
+            .join(offsets, on='bat_id', how='left')
+            .with_columns([pl.when(pl.col(f'season_{stat}').is_not_null() | pl.col(f'_offset_{stat}').is_not_null())
+                           .then(pl.col(f'season_{stat}').fill_null(0) + pl.col(f'_offset_{stat}').fill_null(0))
+                           .alias(f'season_{stat}') for stat in COUNTING_STATS])
+            .drop([f'_offset_{stat}' for stat in COUNTING_STATS])
+        )
+
+    return (
+        indicators
+        .drop([f'_{stat}' for stat in COUNTING_STATS])
+        .join(peers, on=PEER_KEYS, how='left')
+        .join(games, on='GAME_ID', how='left')
+        .with_columns([
+            _game_date().alias('GAME_DATE'),
+            *[_round_half_up(pl.col(f"{scope}_{rate['numerator']}")
+                             / pl.when(pl.col(f"{scope}_{rate['denominator']}") != 0)
+                             .then(pl.col(f"{scope}_{rate['denominator']}")), 4).alias(f"{scope}_{rate['name']}")
+              for scope in stat_specs.WINDOWS for rate in stat_specs.RATE_STATS],
+            pl.col('EVENT_CD').is_in(HIT_CODES).fill_null(False).cast(pl.Int32).alias('hit_fl'),
+            pl.when(pl.col('EVENT_CD') == 3).then(2.0)
+            .when(pl.col('EVENT_CD').is_in(HIT_CODES)).then(-0.6)
+            .when(pl.col('EVENT_CD').is_in([14, 16])).then(-0.6)
+            .otherwise(0.0)
+            .alias('pitching_points'),
+            pl.when(pl.col('EVENT_CD') == 23).then(pl.lit(BATTER_POINTS['hr'], dtype=pl.Float64))
+            .when(pl.col('EVENT_CD') == 20).then(BATTER_POINTS['single'] + pl.col('RBI_CT') * BATTER_POINTS['rbi'])
+            .when(pl.col('EVENT_CD') == 21).then(BATTER_POINTS['double'] + pl.col('RBI_CT') * BATTER_POINTS['rbi'])
+            .when(pl.col('EVENT_CD').is_in([14, 16]))
+            .then(PITCHER_POINTS['walk'] + pl.col('RBI_CT') * BATTER_POINTS['rbi'])
+            .when(pl.col('EVENT_CD') == 22).then(BATTER_POINTS['triple'] + pl.col('RBI_CT') * BATTER_POINTS['rbi'])
+            .otherwise(0.0)
+            .round(2)
+            .alias('batting_points'),
+            pl.when((pl.col('BAT_HAND_CD') == 'R') & (pl.col('PIT_HAND_CD') == 'R')).then(1)
+            .when((pl.col('BAT_HAND_CD') == 'R') & (pl.col('PIT_HAND_CD') == 'L')).then(2)
+            .when((pl.col('BAT_HAND_CD') == 'L') & (pl.col('PIT_HAND_CD') == 'R')).then(3)
+            .otherwise(4)
+            .cast(pl.Int32)
+            .alias('MATCHUP_IN'),
+        ])
+        .select(AT_BAT_LEVEL_COLUMNS)
+    )
+
+
+def build_at_bat_level(events, games, season_offsets=None):
+    """
+    Build at_bat_level rows for one season.
+
+    Args:
+        events: pl.LazyFrame/pl.DataFrame with the retrosheet.events columns for the season
+        games: pl.LazyFrame/pl.DataFrame with the retrosheet.games columns for the season
+        season_offsets: Optional frame with bat_id and season_* totals already stored for the season
+            (see load_season_offsets()). season_* running totals continue from these values instead
+            of starting at zero, so only the new games need to be passed in events.
+
+    Returns:
+        pl.DataFrame with the at_bat_level columns, in table order
+    """
+    return _at_bat_level_plan(events, games, season_offsets).collect()
+
+
+def build_game_matchup_level(at_bat_level):
+    """
+    Aggregate at_bat_level rows to game_matchup_level.
+
+    Args:
+        at_bat_level: pl.DataFrame/pl.LazyFrame of at_bat_level rows (see build_at_bat_level())
+
+    Returns:
+        pl.DataFrame with the game_matchup_level columns, in table order
+    """
+    return _game_matchup_level_plan(at_bat_level).collect()
+
+
+def _game_matchup_level_plan(at_bat_level):
+    """Lazy plan behind build_game_matchup_level()."""
+    keys = ['YEAR_ID', 'GAME_ID', 'GAME_DATE', 'BAT_HAND_CD', 'PIT_HAND_CD', 'bat_id']
+    return (
+        at_bat_level.lazy()
+        .group_by(keys)
+        .agg([pl.col('RBI_CT').sum()]
+             + [pl.col(column).max() for column in GAME_MATCHUP_LEVEL_COLUMNS if column not in keys + ['RBI_CT']])
+        .select(GAME_MATCHUP_LEVEL_COLUMNS)
+    )
+
+
+def build_stolen_bases(at_bat_level):
+    """
+    Build stolen_bases rows for one season from its at_bat_level rows.
+
+    Stolen-base events (EVENT_CD 4) are unpivoted to one row per base whose RUNn_SB_FL is set,
+    so every runner of a double or triple steal gets credit, and summed per runner, game and
+    pitcher hand.
+
+    Args:
+        at_bat_level: pl.DataFrame/pl.LazyFrame of at_bat_level rows (see build_at_bat_level())
+
+    Returns:
+        pl.DataFrame with the stolen_bases columns, in table order
+    """
+    return _stolen_bases_plan(at_bat_level).collect()
+
+
+def _stolen_bases_plan(at_bat_level):
+    """Lazy plan behind build_stolen_bases()."""
+    bases = pl.concat_list([
+        pl.struct(pl.col(f'RUN{base}_SB_FL').alias('stolen'), pl.col(f'BASE{base}_RUN_ID').alias('BASE_STL_ID'))
+        for base in (1, 2, 3)
+    ])
+    return (
+        at_bat_level.lazy()
+        .filter(pl.col('EVENT_CD') == 4)
+        .select(['GAME_ID', 'GAME_DATE', 'PIT_HAND_CD', bases.alias('_bases')])
+        .explode('_bases')
+        .unnest('_bases')
+        .filter(pl.col('stolen') == 'T')
+        .with_columns([pl.lit(3).alias('STOLEN_BASE_POINTS'), pl.lit(1).alias('STOLEN_BASE_FL')])
+        .group_by(['GAME_ID', 'GAME_DATE', 'BASE_STL_ID', 'STOLEN_BASE_FL', 'PIT_HAND_CD'])
+        .agg(pl.col('STOLEN_BASE_POINTS').sum())
+        .select(STOLEN_BASES_COLUMNS)
+    )
+
+
+def build_season(events, games, season_offsets=None):
+    """
+    Build at_bat_level, game_matchup_level and stolen_bases for one season in one pass.
+
+    game_matchup_level and stolen_bases are planned on top of the at_bat_level plan and the three
+    are collected together, so the events are read, sorted and joined once and the shared
+    at_bat_level result feeds both aggregations.
+
+    Args:
+        events: pl.LazyFrame/pl.DataFrame with the retrosheet.events columns for the season
+        games: pl.LazyFrame/pl.DataFrame with the retrosheet.games columns for the season
+        season_offsets: Optional stored season_* totals, see build_at_bat_level()
+
+    Returns:
+        (at_bat_level, game_matchup_level, stolen_bases) polars DataFrames
+    """
+    at_bat_level = _at_bat_level_plan(events, games, season_offsets).cache()
+    return tuple(pl.collect_all([at_bat_level, _game_matchup_level_plan(at_bat_level),
+                                 _stolen_bases_plan(at_bat_level)]))
+
+
+def load_season_from_database(db_helper, year):
+    """
+    Pull one season of events and games from MariaDB.
+
+    Args:
+        db_helper: Database instance
+        year: Season to pull
+
+    Returns:
+        (events, games) polars DataFrames
+    """
+    uri = db_helper.db_connect_polars()
+    events = db_helper.db_pull(
+        f"SELECT {', '.join(EVENT_COLUMNS)} FROM retrosheet.events WHERE YEAR_ID = {int(year)}", uri)
+    games = db_helper.db_pull(
+        f"SELECT {', '.join(GAME_COLUMNS)} FROM retrosheet.games WHERE year_id = {int(year)}", uri)
+    return events, games
+
+
+def load_season_from_files(events_dir, year):
+    """
+    Scan one season of the columnar files written by parse_retrosheet_events.py.
+
+    Args:
+        events_dir: Output directory of parse_retrosheet_events.py
+        year: Season to scan
+
+    Returns:
+        (events, games) polars LazyFrames
+    """
+    root = Path(events_dir)
+    events = pl.scan_parquet(str(root / 'events' / str(year) / '*.parquet'))
+    games = pl.scan_parquet(str(root / 'games' / str(year) / '*.parquet'))
+    return events, games
+
+
+def create_tables_from_script(engine, sql_script_path, drop_tables=False):
+    """
+    Create the output tables using the DDL in Data_Processing_DV.sql, so both engines share one schema.
+
+    Args:
+        engine: SQLAlchemy engine
+        sql_script_path: Path to Data_Processing_DV.sql
+        drop_tables: Drop the tables first (first year of a full rebuild)
+    """
+    script = Path(sql_script_path).read_text()
+    ddl = re.findall(r'(CREATE TABLE IF NOT EXISTS\s+([\w.]+)\s*\(.*?\n\)[^;]*);', script, flags=re.DOTALL)
+    with engine.begin() as conn:
+        for create_sql, table_name in ddl:
+            if drop_tables:
+                conn.execute(sqlalchemy.text(f'DROP TABLE IF EXISTS {table_name}'))
+            conn.execute(sqlalchemy.text(create_sql))
+
+
+def write_season(db_helper, engine, year, at_bat_level, game_matchup_level, stolen_bases, load_mode='delete'):
+    """
+    Replace one season of the output tables, mirroring the DELETE + INSERT of the SQL engine.
+
+    Args:
+        load_mode: 'delete' deletes the season and appends; 'exchange' writes each partitioned table
+            into a staging table and swaps it in with EXCHANGE PARTITION (see sql_stage_executor.py)
+
+    Returns:
+        Dictionary of rows inserted per table
+    """
+    year_filters = {'at_bat_level': 'YEAR_ID = :year', 'game_matchup_level': 'YEAR_ID = :year',
+                    'stolen_bases': 'YEAR(GAME_DATE) = :year'}
+    for table_name, frame in (('at_bat_level', at_bat_level), ('game_matchup_level', game_matchup_level),
+                              ('stolen_bases', stolen_bases)):
+        table = f'retrosheet.{table_name}'
+        try:
+            with engine.connect() as conn:
+                exchange = load_mode == 'exchange' and year_partition_ready(conn, table, year)
+                if exchange:
+                    staging = prepare_staging_table(conn, table, year)
+                else:
+                    conn.execute(sqlalchemy.text(f'DELETE FROM {table} WHERE {year_filters[table_name]}'),
+                                 {'year': year})
+                conn.commit()
+
+            db_helper.db_insert(frame.to_pandas(), staging.split('.')[-1] if exchange else table_name, engine,
+                                bulk=True, bump_version=False)
+
+            if exchange:
+                with engine.connect() as conn:
+                    exchange_staging_table(conn, table, staging, year)
+        finally:
+            # Also after a failure, since the DELETE may already have removed the season
+            db_helper.bump_table_versions(engine, [table])
+
+    return {'at_bat_level': at_bat_level.height, 'game_matchup_level': game_matchup_level.height,
+            'stolen_bases': stolen_bases.height}
+
+
+def create_watermark_table(engine):
+    """Create the table holding the last game appended to at_bat_level for each season."""
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text(f"""
+            CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+                YEAR_ID INT PRIMARY KEY,
+                last_game_date DATE,
+                last_game_id VARCHAR(12),
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """))
+
+
+def read_watermark(engine, year):
+    """
+    Get the date of the last game stored in at_bat_level for a season.
+
+    Falls back to MAX(GAME_DATE) of the stored rows when the season has no watermark row yet
+    (e.g. it was built by a full rebuild).
+
+    Returns:
+        datetime.date, or None when nothing is stored for the season
+    """
+    with engine.connect() as conn:
+        watermark = conn.execute(
+            sqlalchemy.text(f'SELECT last_game_date FROM {WATERMARK_TABLE} WHERE YEAR_ID = :year'),
+            {'year': year}).scalar()
+        if watermark is None:
+            watermark = conn.execute(
+                sqlalchemy.text('SELECT MAX(GAME_DATE) FROM retrosheet.at_bat_level WHERE YEAR_ID = :year'),
+                {'year': year}).scalar()
+    return watermark
+
+
+def update_watermark(engine, year, at_bat_level):
+    """
+    Move the season watermark to the last game in the appended rows.
+
+    Nothing is written when no rows were appended (games in retrosheet.games whose events are not
+    loaded yet), so those games are picked up again by the next refresh.
+    """
+    if at_bat_level.height == 0:
+        return
+    last = at_bat_level.select(['GAME_DATE', 'GAME_ID']).sort(['GAME_DATE', 'GAME_ID']).row(-1)
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text(f"""
+            INSERT INTO {WATERMARK_TABLE} (YEAR_ID, last_game_date, last_game_id)
+            VALUES (:year, :game_date, :game_id)
+            ON DUPLICATE KEY UPDATE
+                last_game_date = GREATEST(last_game_date, VALUES(last_game_date)),
+                last_game_id = IF(VALUES(last_game_date) >= last_game_date, VALUES(last_game_id), last_game_id)
+        """), {'year': year, 'game_date': last[0], 'game_id': last[1]})
+
+
+def find_new_game_ids(engine, year, watermark, events_dir=None):
+    """
+    Find the season's games on or after the watermark date that are not in at_bat_level yet.
+
+    Games on the watermark date itself are re-checked, so a night game loaded after the rest of
+    its day's slate is still picked up.
+
+    Args:
+        engine: SQLAlchemy engine
+        year: Season to check
+        watermark: Date returned by read_watermark(), or None to take every game of the season
+        events_dir: Read candidate games from parse_retrosheet_events.py output instead of retrosheet.games
+
+    Returns:
+        Sorted list of GAME_IDs
+    """
+    since = watermark.strftime('%Y%m%d') if watermark is not None else '00000000'
+    if events_dir:
+        candidates = set(
+            pl.scan_parquet(str(Path(events_dir) / 'games' / str(year) / '*.parquet'))
+            .select('GAME_ID')
+            .filter(pl.col('GAME_ID').str.slice(3, 8) >= since)
+            .collect()
+            .get_column('GAME_ID')
+            .to_list()
+        )
+    else:
+        with engine.connect() as conn:
+            candidates = set(conn.execute(sqlalchemy.text(
+                'SELECT GAME_ID FROM retrosheet.games WHERE year_id = :year AND SUBSTRING(GAME_ID, 4, 8) >= :since'),
+                {'year': year, 'since': since}).scalars())
+
+    with engine.connect() as conn:
+        stored = set(conn.execute(sqlalchemy.text(
+            'SELECT DISTINCT GAME_ID FROM retrosheet.at_bat_level WHERE YEAR_ID = :year AND GAME_DATE >= :since'),
+            {'year': year, 'since': watermark or '0001-01-01'}).scalars())
+    return sorted(candidates - stored)
+
+
+def load_games_from_database(db_helper, year, game_ids):
+    """
+    Pull the events and games rows for specific games from MariaDB.
+
+    Returns:
+        (events, games) polars DataFrames
+    """
+    bad_ids = [game_id for game_id in game_ids if not GAME_ID_PATTERN.match(game_id)]
+    if bad_ids:
+        raise ValueError(f'Unexpected GAME_ID values: {bad_ids[:5]}')
+    id_list = ', '.join(f"'{game_id}'" for game_id in game_ids)
+
+    uri = db_helper.db_connect_polars()
+    events = db_helper.db_pull(
+        f"SELECT {', '.join(EVENT_COLUMNS)} FROM retrosheet.events "
+        f"WHERE YEAR_ID = {int(year)} AND GAME_ID IN ({id_list})", uri)
+    games = db_helper.db_pull(
+        f"SELECT {', '.join(GAME_COLUMNS)} FROM retrosheet.games "
+        f"WHERE year_id = {int(year)} AND GAME_ID IN ({id_list})", uri)
+    return events, games
+
+
+def load_games_from_files(events_dir, year, game_ids):
+    """
+    Scan specific games from the columnar files written by parse_retrosheet_events.py.
+
+    Returns:
+        (events, games) polars LazyFrames
+    """
+    events, games = load_season_from_files(events_dir, year)
+    return (events.filter(pl.col('GAME_ID').is_in(game_ids)),
+            games.filter(pl.col('GAME_ID').is_in(game_ids)))
+
+
+def load_season_offsets(db_helper, year):
+    """
+    Get each batter's last stored season_* totals for a season.
+
+    The season_* columns are running sums of non-negative counts, so the maximum per batter is
+    the value after the batter's last stored plate appearance.
+
+    Returns:
+        pl.DataFrame with bat_id and one season_* column per counting stat
+    """
+    totals = ', '.join(f'MAX(season_{stat}) AS season_{stat}' for stat in COUNTING_STATS)
+    return db_helper.db_pull(
+        f'SELECT bat_id, {totals} FROM retrosheet.at_bat_level WHERE YEAR_ID = {int(year)} GROUP BY bat_id',
+        db_helper.db_connect_polars())
+
+
+def append_games(db_helper, engine, game_ids, at_bat_level, game_matchup_level, stolen_bases):
+    """
+    Append the rows of newly processed games to the output tables.
+
+    Rows already stored for these games in game_matchup_level / stolen_bases (left by an interrupted
+    run) are removed first. at_bat_level is written last because find_new_game_ids() uses it to
+    decide which games are done.
+
+    Returns:
+        Dictionary of rows inserted per table
+    """
+    delete_params = {'game_ids': game_ids}
+    tables = ('game_matchup_level', 'stolen_bases', 'at_bat_level')
+    try:
+        with engine.begin() as conn:
+            for table_name in tables:
+                conn.execute(
+                    sqlalchemy.text(f'DELETE FROM retrosheet.{table_name} WHERE GAME_ID IN :game_ids')
+                    .bindparams(sqlalchemy.bindparam('game_ids', expanding=True)),
+                    delete_params)
+
+        for table_name, frame in (('game_matchup_level', game_matchup_level), ('stolen_bases', stolen_bases),
+                                  ('at_bat_level', at_bat_level)):
+            db_helper.db_insert(frame.to_pandas(), table_name, engine, bulk=True, bump_version=False)
+    finally:
+        # Also after a failure, since the DELETEs may already have removed rows
+        db_helper.bump_table_versions(engine, [f'retrosheet.{table_name}' for table_name in tables])
+
+    return {'at_bat_level': at_bat_level.height, 'game_matchup_level': game_matchup_level.height,
+            'stolen_bases': stolen_bases.height}
+
+
+def refresh_season_incremental(db_helper, engine, year, events_dir=None):
+    """
+    Append the games played since the season watermark instead of rebuilding the season.
+
+    season_* running totals continue from each batter's stored totals. New games are appended after
+    the stored ones, so the result matches a full rebuild as long as games arrive in date order; a
+    full rebuild orders the season window by GAME_ID string (home team first), which differs when
+    a late-loaded game sorts before games already stored.
+
+    Args:
+        db_helper: Database instance
+        engine: SQLAlchemy engine
+        year: Season to refresh
+        events_dir: Read events from parse_retrosheet_events.py output instead of retrosheet.events
+
+    Returns:
+        Dictionary with the watermark, the number of new games and rows inserted per table
+    """
+    create_watermark_table(engine)
+    watermark = read_watermark(engine, year)
+    game_ids = find_new_game_ids(engine, year, watermark, events_dir)
+    summary = {'watermark': watermark, 'new_games': len(game_ids)}
+    if not game_ids:
+        return summary
+
+    if events_dir:
+        events, games = load_games_from_files(events_dir, year, game_ids)
+    else:
+        events, games = load_games_from_database(db_helper, year, game_ids)
+
+    at_bat_level, game_matchup_level, stolen_bases = build_season(
+        events, games, season_offsets=load_season_offsets(db_helper, year))
+
+    summary.update(append_games(db_helper, engine, game_ids, at_bat_level, game_matchup_level, stolen_bases))
+    update_watermark(engine, year, at_bat_level)
+    return summary
+
+
+def compare_frames(expected, actual, key_columns, tolerance=1e-4):
+    """
+    Compare two frames row for row.
+
+    Args:
+        expected: Reference frame (e.g. rows built by the SQL engine)
+        actual: Frame to check (e.g. rows built by this engine)
+        key_columns: Columns identifying a row
+        tolerance: Absolute tolerance for numeric columns
+
+    Returns:
+        Dictionary with row counts, rows missing on either side and mismatch counts per column
+    """
+    expected = expected.select(actual.columns)
+    joined = expected.join(actual, on=key_columns, how='inner', suffix='_actual')
+
+    mismatches = {}
+    for column in actual.columns:
+        if column in key_columns:
+            continue
+        left, right = pl.col(column), pl.col(f'{column}_actual')
+        if expected.schema[column].is_numeric() and actual.schema[column].is_numeric():
+            differs = (left.cast(pl.Float64) - right.cast(pl.Float64)).abs() > tolerance
+        else:
+            differs = left.cast(pl.Utf8) != right.cast(pl.Utf8)
+        differs = differs.fill_null(left.is_null() != right.is_null())
+        count = joined.select(differs.sum()).item()
+        if count:
+            mismatches[column] = count
+
+    keys_expected = expected.select(key_columns).unique()
+    keys_actual = actual.select(key_columns).unique()
+    return {
+        'expected_rows': expected.height,
+        'actual_rows': actual.height,
+        'missing_rows': keys_expected.join(keys_actual, on=key_columns, how='anti').height,
+        'extra_rows': keys_actual.join(keys_expected, on=key_columns, how='anti').height,
+        'column_mismatches': mismatches,
+    }
+
+
+def verify_against_sql(db_helper, year, at_bat_level):
+    """
+    Check polars-built at_bat_level rows against the rows the SQL engine stored for the same year.
+
+    Args:
+        db_helper: Database instance
+        year: Season to compare
+        at_bat_level: pl.DataFrame returned by build_at_bat_level()
+
+    Returns:
+        Comparison summary from compare_frames()
+    """
+    expected = db_helper.db_pull(
+        f"SELECT {', '.join(AT_BAT_LEVEL_COLUMNS)} FROM retrosheet.at_bat_level WHERE YEAR_ID = {int(year)}",
+        db_helper.db_connect_polars())
+    return compare_frames(expected, at_bat_level, ['YEAR_ID', 'GAME_ID', 'seq_events'])
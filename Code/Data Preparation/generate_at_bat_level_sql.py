@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Generate the at_bat_level INSERT in Data_Processing_DV.sql from a declarative list of stats.
+
+Each counting stat is defined once in COUNTING_STATS (event codes, a T/F flag and/or a column
+to sum). The generated statement:
+- computes every stat's indicator once, in a subquery over events joined to games
+- accumulates the indicators with SUM(...) OVER one of two named windows:
+    game_window    PARTITION BY bat_id, YEAR_ID, GAME_ID ORDER BY INN_CT
+    season_window  PARTITION BY bat_id, YEAR_ID ORDER BY GAME_ID, INN_CT
+  Both sort by (bat_id, YEAR_ID, GAME_ID, INN_CT), so every cumulative column comes out of a
+  single sort. The hand-written block mixed ORDER BY E.GAME_ID, bat_id, INN_CT with
+  bat_id, E.GAME_ID, INN_CT. YEAR_ID is constant within a batch, so the game window covers
+  the same rows as the old PARTITION BY bat_id, GAME_ID, with the same RANGE peers.
+- divides two accumulated sums for each entry of RATE_STATS (game_ba, season_ba)
+
+The polars engine (at_bat_level_polars.py) builds its columns from the same lists.
+
+To add a stat, add it to COUNTING_STATS, add its game_/season_ columns to the CREATE TABLE
+statements, and regenerate.
+
+Usage:
+    python generate_at_bat_level_sql.py            # print the generated statement
+    python generate_at_bat_level_sql.py --write    # replace the generated block in Data_Processing_DV.sql
+    python generate_at_bat_level_sql.py --check    # exit 1 if Data_Processing_DV.sql is out of date
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+HIT_CODES = [20, 21, 22, 23]
+
+# retrosheet.events columns copied to at_bat_level (GAME_DATE is inserted after GAME_ID)
+EVENT_COLUMNS = [
+    'seq_events', 'YEAR_ID', 'GAME_ID', 'bat_id', 'PA_BALL_CT', 'PA_SWINGMISS_STRIKE_CT', 'BAT_HOME_ID',
+    'BAT_FATE_ID', 'EVENT_CD', 'RBI_CT', 'event_tx', 'BAT_LINEUP_ID', 'BASE1_RUN_ID', 'BASE2_RUN_ID',
+    'BASE3_RUN_ID', 'RUN1_SB_FL', 'RUN2_SB_FL', 'RUN3_SB_FL', 'ab_fl', 'PR_Run1_fl', 'PR_Run2_fl',
+    'PR_Run3_fl', 'INN_CT', 'AWAY_SCORE_CT', 'HOME_SCORE_CT', 'HOME_TEAM_ID', 'BAT_HAND_CD', 'PIT_HAND_CD',
+    'PIT_ID'
+]
+
+# retrosheet.games columns joined on GAME_ID
+GAME_COLUMNS = [
+    'GAME_ID', 'TEMP_PARK_CT', 'WIND_DIRECTION_PARK_CD', 'WIND_SPEED_PARK_CT', 'PRECIP_PARK_CD',
+    'SKY_PARK_CD', 'WIN_PIT_ID', 'park_id', 'DAYNIGHT_PARK_CD'
+]
+
+# Counting stats accumulated into game_* and season_* columns, in table order. A row counts 1 when
+# any of its conditions holds (EVENT_CD in event_codes, or flag = 'T'); weight sums a column instead.
+COUNTING_STATS = [
+    {'name': 'hits', 'event_codes': HIT_CODES},
+    {'name': 'ab', 'flag': 'ab_fl'},
+    {'name': 'singles', 'event_codes': [20]},
+    {'name': 'doubles', 'event_codes': [21]},
+    {'name': 'triples', 'event_codes': [22]},
+    {'name': 'hr', 'event_codes': [23]},
+    {'name': 'pa', 'flag': 'ab_fl', 'event_codes': [14, 15, 16]},
+    {'name': 'ibb', 'event_codes': [15]},
+    {'name': 'ubb', 'event_codes': [14]},
+    {'name': 'balls', 'weight': 'PA_BALL_CT'},
+    {'name': 'swing_strikes', 'weight': 'PA_SWINGMISS_STRIKE_CT'},
+]
+
+# Ratios of two accumulated counting stats, placed after the 'after' column in each scope
+RATE_STATS = [
+    {'name': 'ba', 'numerator': 'hits', 'denominator': 'ab', 'after': 'ab'},
+]
+
+WINDOWS = {
+    'game': 'PARTITION BY bat_id, YEAR_ID, GAME_ID ORDER BY INN_CT',
+    'season': 'PARTITION BY bat_id, YEAR_ID ORDER BY GAME_ID, INN_CT',
+}
+
+# Per-row columns after the cumulative stats, computed from the subquery columns
+DERIVED_COLUMNS_SQL = """\
+	       hits_ind AS hit_fl,
+	       CASE
+		 WHEN EVENT_CD = 3 THEN 2
+		 WHEN EVENT_CD IN (20, 21, 22, 23) THEN -0.6
+		 WHEN EVENT_CD IN (14, 16) THEN -0.6
+		 ELSE 0
+	       END AS pitching_points,
+	       CASE
+		 WHEN EVENT_CD = 23 THEN @hr
+		 WHEN EVENT_CD = 20 THEN @single + RBI_CT * @rbi
+		 WHEN EVENT_CD = 21 THEN @double + RBI_CT * @rbi
+		 WHEN EVENT_CD IN (14, 16) THEN @walk + RBI_CT * @rbi
+		 WHEN EVENT_CD = 22 THEN @triple + RBI_CT * @rbi
+		 ELSE 0
+	       END AS batting_points,
+	       CASE
+		 WHEN BAT_HAND_CD = 'R' AND PIT_HAND_CD = 'R' THEN 1
+		 WHEN BAT_HAND_CD = 'R' AND PIT_HAND_CD = 'L' THEN 2
+		 WHEN BAT_HAND_CD = 'L' AND PIT_HAND_CD = 'R' THEN 3
+		 ELSE 4
+	       END AS MATCHUP_IN"""
+
+BEGIN_MARKER = '-- BEGIN GENERATED: at_bat_level insert (generate_at_bat_level_sql.py --write)'
+END_MARKER = '-- END GENERATED: at_bat_level insert'
+
+
+def stat_columns(scope):
+    """
+    Names of the cumulative columns for one scope ('game' or 'season'), in table order.
+
+    Returns:
+        List of (column name, counting stat or rate stat) pairs
+    """
+    rates = {rate['after']: rate for rate in RATE_STATS}
+    columns = []
+    for stat in COUNTING_STATS:
+        columns.append((f"{scope}_{stat['name']}", stat))
+        if stat['name'] in rates:
+            columns.append((f"{scope}_{rates[stat['name']]['name']}", rates[stat['name']]))
+    return columns
+
+
+def indicator_sql(stat):
+    """SQL for one row's contribution to a counting stat."""
+    if 'weight' in stat:
+        return stat['weight']
+    conditions = []
+    if 'flag' in stat:
+        conditions.append(f"{stat['flag']} = 'T'")
+    if 'event_codes' in stat:
+        codes = stat['event_codes']
+        conditions.append(f'EVENT_CD = {codes[0]}' if len(codes) == 1
+                          else f"EVENT_CD IN ({', '.join(str(code) for code in codes)})")
+    return f"CASE WHEN {' OR '.join(conditions)} THEN 1 ELSE 0 END"
+
+
+def generate_insert_sql():
+    """Build the INSERT INTO retrosheet.at_bat_level statement for one @process_year."""
+    inner = [f'E.{column}' for column in EVENT_COLUMNS[:3]]
+    inner.append("STR_TO_DATE(SUBSTRING(E.GAME_ID, 4, 8), '%Y%m%d') AS GAME_DATE")
+    inner += [f'E.{column}' for column in EVENT_COLUMNS[3:]]
+    inner += [f'G.{column}' for column in GAME_COLUMNS[1:]]
+    inner += [f"{indicator_sql(stat)} AS {stat['name']}_ind" for stat in COUNTING_STATS]
+
+    outer = EVENT_COLUMNS[:3] + ['GAME_DATE'] + EVENT_COLUMNS[3:] + GAME_COLUMNS[1:]
+    for scope in WINDOWS:
+        for column, stat in stat_columns(scope):
+            if 'numerator' in stat:
+                outer.append(f"SUM({stat['numerator']}_ind) OVER {scope}_window"
+                             f" / NULLIF(SUM({stat['denominator']}_ind) OVER {scope}_window, 0) AS {column}")
+            else:
+                outer.append(f"SUM({stat['name']}_ind) OVER {scope}_window AS {column}")
+
+    windows = ',\n\t       '.join(f'{scope}_window AS ({spec})' for scope, spec in WINDOWS.items())
+    return (
+        'INSERT INTO retrosheet.at_bat_level\n'
+        '\tSELECT ' + ',\n\t       '.join(outer) + ',\n'
+        + DERIVED_COLUMNS_SQL + '\n'
+        '\tFROM (\n'
+        '\t\tSELECT ' + ',\n\t\t       '.join(inner) + '\n'
+        '\t\tFROM retrosheet.events E\n'
+        '\t\tLEFT JOIN (\n'
+        '\t\t  SELECT ' + ',\n\t\t\t '.join(GAME_COLUMNS) + '\n'
+        '\t\t  FROM retrosheet.games\n'
+        '\t\t  WHERE year_id = @process_year\n'
+        '\t\t) G\n'
+        '\t\tON E.GAME_ID = G.GAME_ID\n'
+        '\t\tWHERE E.YEAR_ID = @process_year\n'
+        '\t) I\n'
+        f'\tWINDOW {windows}\n'
+        ';'
+    )
+
+
+def replace_generated_block(script, generated_sql):
+    """Swap the text between the BEGIN/END GENERATED markers for the generated statement."""
+    start = script.find(BEGIN_MARKER)
+    end = script.find(END_MARKER)
+    if start == -1 or end == -1 or end < start:
+        raise ValueError(f'Could not find the generated block markers:\n  {BEGIN_MARKER}\n  {END_MARKER}')
+    return script[:start] + BEGIN_MARKER + '\n' + generated_sql + '\n' + script[end:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the at_bat_level INSERT in Data_Processing_DV.sql')
+    parser.add_argument('--sql-script', default=str(Path(__file__).parent / 'Data_Processing_DV.sql'),
+                        help='SQL script containing the generated block (default: Data_Processing_DV.sql)')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--write', action='store_true', help='Rewrite the generated block in place')
+    group.add_argument('--check', action='store_true', help='Exit 1 if the generated block is out of date')
+    args = parser.parse_args()
+
+    generated_sql = generate_insert_sql()
+    if not (args.write or args.check):
+        print(generated_sql)
+        return
+
+    path = Path(args.sql_script)
+    script = path.read_text()
+    updated = replace_generated_block(script, generated_sql)
+    if args.check:
+        if updated != script:
+            print(f'{path} is out of date; run: python {Path(__file__).name} --write')
+            sys.exit(1)
+        print(f'{path} is up to date')
+    elif updated != script:
+        path.write_text(updated)
+        print(f'Updated {path}')
+    else:
+        print(f'{path} already up to date')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,708 @@
+#!/usr/bin/env python3
+"""
+Streaming Retrosheet Event-File Parser
+
+This script parses the raw Retrosheet event files (YYYYTTT.EVA / .EVN / .EVF / .EVR,
+format described in Resources/event_file.md) directly into year-partitioned
+columnar files, so a full rebuild no longer depends on bulk loading
+retrosheet.events into MariaDB first.
+
+Each event file is streamed record by record with generators (one game is held in
+memory at a time) and team-season files are parsed in a process pool. Every file is
+written by its worker as:
+
+    OUTPUT_DIR/events/YYYY/TTT.parquet   (same columns as retrosheet.events)
+    OUTPUT_DIR/games/YYYY/TTT.parquet    (game-level info used by Data_Processing_DV.sql)
+
+Handedness (BAT_HAND_CD / PIT_HAND_CD) comes from the TTTYYYY.ROS roster files that
+ship in the same Retrosheet archive, with badj/padj records applied. Switch hitters
+bat from the side opposite the pitcher's throwing hand.
+
+Usage:
+    python parse_retrosheet_events.py --input-dir EVENT_DIR --output-dir OUT_DIR [OPTIONS]
+
+Options:
+    --input-dir         Directory containing the unzipped event and roster files (searched recursively)
+    --output-dir        Directory to write the events/ and games/ partitions to
+    --start-year        First year to parse (default: 1952)
+    --end-year          Last year to parse (default: 2025)
+    --workers           Number of parser processes (default: CPU count)
+    --format            Output format: parquet or ipc (Arrow) (default: parquet)
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+import polars as pl
+
+
+# Column layout of retrosheet.events, as consumed by Data_Processing_DV.sql
+EVENTS_SCHEMA = {
+    'seq_events': pl.Int32,
+    'YEAR_ID': pl.Int32,
+    'GAME_ID': pl.Utf8,
+    'bat_id': pl.Utf8,
+    'PA_BALL_CT': pl.Int32,
+    'PA_SWINGMISS_STRIKE_CT': pl.Int32,
+    'BAT_HOME_ID': pl.Int32,
+    'BAT_FATE_ID': pl.Int32,
+    'EVENT_CD': pl.Int32,
+    'RBI_CT': pl.Int32,
+    'event_tx': pl.Utf8,
+    'BAT_LINEUP_ID': pl.Int32,
+    'BASE1_RUN_ID': pl.Utf8,
+    'BASE2_RUN_ID': pl.Utf8,
+    'BASE3_RUN_ID': pl.Utf8,
+    'RUN1_SB_FL': pl.Utf8,
+    'RUN2_SB_FL': pl.Utf8,
+    'RUN3_SB_FL': pl.Utf8,
+    'ab_fl': pl.Utf8,
+    'PR_Run1_fl': pl.Utf8,
+    'PR_Run2_fl': pl.Utf8,
+    'PR_Run3_fl': pl.Utf8,
+    'INN_CT': pl.Int32,
+    'OUTS_CT': pl.Int32,
+    'AWAY_SCORE_CT': pl.Int32,
+    'HOME_SCORE_CT': pl.Int32,
+    'HOME_TEAM_ID': pl.Utf8,
+    'BAT_HAND_CD': pl.Utf8,
+    'PIT_HAND_CD': pl.Utf8,
+    'PIT_ID': pl.Utf8,
+}
+
+# Game-level info joined onto at_bat_level from retrosheet.games
+GAMES_SCHEMA = {
+    'GAME_ID': pl.Utf8,
+    'YEAR_ID': pl.Int32,
+    'GAME_DT': pl.Date,
+    'GAME_CT': pl.Int32,
+    'HOME_TEAM_ID': pl.Utf8,
+    'AWAY_TEAM_ID': pl.Utf8,
+    'START_GAME_TM': pl.Utf8,
+    'DAYNIGHT_PARK_CD': pl.Utf8,
+    'TEMP_PARK_CT': pl.Int32,
+    'WIND_DIRECTION_PARK_CD': pl.Utf8,
+    'WIND_SPEED_PARK_CT': pl.Int32,
+    'PRECIP_PARK_CD': pl.Utf8,
+    'SKY_PARK_CD': pl.Utf8,
+    'WIN_PIT_ID': pl.Utf8,
+    'park_id': pl.Utf8,
+}
+
+# Chadwick event type codes (EVENT_CD)
+EVENT_UNKNOWN = 0
+EVENT_GENERIC_OUT = 2
+EVENT_STRIKEOUT = 3
+EVENT_STOLEN_BASE = 4
+EVENT_DEFENSIVE_INDIFFERENCE = 5
+EVENT_CAUGHT_STEALING = 6
+EVENT_PICKOFF_ERROR = 7
+EVENT_PICKOFF = 8
+EVENT_WILD_PITCH = 9
+EVENT_PASSED_BALL = 10
+EVENT_BALK = 11
+EVENT_OTHER_ADVANCE = 12
+EVENT_FOUL_ERROR = 13
+EVENT_WALK = 14
+EVENT_INTENTIONAL_WALK = 15
+EVENT_HIT_BY_PITCH = 16
+EVENT_INTERFERENCE = 17
+EVENT_ERROR = 18
+EVENT_FIELDERS_CHOICE = 19
+EVENT_SINGLE = 20
+EVENT_DOUBLE = 21
+EVENT_TRIPLE = 22
+EVENT_HOME_RUN = 23
+
+# Events that end the plate appearance
+BATTER_EVENTS = {EVENT_GENERIC_OUT, EVENT_STRIKEOUT, EVENT_WALK, EVENT_INTENTIONAL_WALK, EVENT_HIT_BY_PITCH,
+                 EVENT_INTERFERENCE, EVENT_ERROR, EVENT_FIELDERS_CHOICE, EVENT_SINGLE, EVENT_DOUBLE,
+                 EVENT_TRIPLE, EVENT_HOME_RUN}
+AT_BAT_EVENTS = {EVENT_GENERIC_OUT, EVENT_STRIKEOUT, EVENT_ERROR, EVENT_FIELDERS_CHOICE, EVENT_SINGLE,
+                 EVENT_DOUBLE, EVENT_TRIPLE, EVENT_HOME_RUN}
+# Runs scored on these events are RBIs unless the advance says otherwise
+RBI_EVENTS = {EVENT_GENERIC_OUT, EVENT_WALK, EVENT_INTENTIONAL_WALK, EVENT_HIT_BY_PITCH, EVENT_INTERFERENCE,
+              EVENT_FIELDERS_CHOICE, EVENT_SINGLE, EVENT_DOUBLE, EVENT_TRIPLE, EVENT_HOME_RUN}
+
+BALL_PITCHES = set('BIPV')
+SWINGMISS_PITCHES = set('SMQ')
+
+BASE_NUMBER = {'B': 0, '1': 1, '2': 2, '3': 3, 'H': 4}
+
+EVENT_FILE_PATTERN = re.compile(r'^(\d{4})([A-Z0-9]{3})\.EV[ANFR]$', re.IGNORECASE)
+ADVANCE_PATTERN = re.compile(r'^([B123])([-X])([123H])((?:\([^)]*\))*)')
+PARAM_PATTERN = re.compile(r'\(([^)]*)\)')
+ERROR_PATTERN = re.compile(r'E\d')
+
+
+def iter_records(path):
+    """
+    Stream the records of a Retrosheet event file.
+
+    Args:
+        path: Path to a YYYYTTT.EVx file
+
+    Yields:
+        (record_type, fields) tuples, one per non-empty line
+    """
+    with open(path, 'r', encoding='latin-1', newline='') as handle:
+        for fields in csv.reader(handle):
+            if fields:
+                yield fields[0].strip(), [field.strip() for field in fields[1:]]
+
+
+def iter_games(path):
+    """
+    Group the record stream of an event file into games.
+
+    Args:
+        path: Path to a YYYYTTT.EVx file
+
+    Yields:
+        (game_id, records) tuples, where records is the list of (record_type, fields)
+        following the id record
+    """
+    game_id = None
+    records = []
+    for record_type, fields in iter_records(path):
+        if record_type == 'id':
+            if game_id is not None:
+                yield game_id, records
+            game_id = fields[0]
+            records = []
+        elif game_id is not None:
+            records.append((record_type, fields))
+    if game_id is not None:
+        yield game_id, records
+
+
+@lru_cache(maxsize=None)
+def load_rosters(directory, year):
+    """
+    Load batting and throwing hands from every TTTYYYY.ROS file for a season.
+
+    Args:
+        directory: Directory containing the roster files (searched recursively)
+        year: Season to load
+
+    Returns:
+        Dictionary mapping Retrosheet player id to (bats, throws)
+    """
+    hands = {}
+    for roster_path in Path(directory).rglob(f'*{year}.ROS'):
+        with open(roster_path, 'r', encoding='latin-1', newline='') as handle:
+            for fields in csv.reader(handle):
+                if len(fields) >= 5:
+                    hands[fields[0].strip()] = (fields[3].strip(), fields[4].strip())
+    return hands
+
+
+def _split_outside_parens(text, sep):
+    """Split text on sep, ignoring separators inside parentheses."""
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        if char == sep and depth == 0:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append(''.join(current))
+    return parts
+
+
+def _has_error(params):
+    """Return True if any advance/fielding parameter charges an error (which negates an out)."""
+    return any(ERROR_PATTERN.search(param) for param in params)
+
+
+def _parse_runner_play(part, moves, stolen):
+    """
+    Apply the implicit runner movement of a base-running play (SB, CS, PO, POCS).
+
+    Args:
+        part: A single base-running play such as 'SB2', 'CS3(25)' or 'PO1(E3)'
+        moves: Dictionary of source base -> (destination base, is_out) to update
+        stolen: Set of source bases credited with a stolen base, updated in place
+
+    Returns:
+        Event code for the play
+    """
+    params = PARAM_PATTERN.findall(part)
+    match = re.match(r'^(SB|POCS|CS|PO)([123H])', part)
+    if match is None:
+        return EVENT_UNKNOWN
+
+    kind, base = match.group(1), BASE_NUMBER[match.group(2)]
+    if kind == 'SB':
+        moves[base - 1] = (base, False)
+        stolen.add(base - 1)
+        return EVENT_STOLEN_BASE
+    if kind in ('CS', 'POCS'):
+        moves[base - 1] = (base, not _has_error(params))
+        return EVENT_CAUGHT_STEALING
+    # Pickoff: the runner is out at his own base unless an error negates it
+    if _has_error(params):
+        return EVENT_PICKOFF_ERROR
+    moves[base] = (base, True)
+    return EVENT_PICKOFF
+
+
+def parse_event(event_tx):
+    """
+    Parse the event field of a play record.
+
+    Args:
+        event_tx: Event text, e.g. 'S8/G.3-H;1-2' or '64(1)3/GDP/G6'
+
+    Returns:
+        Dictionary with the event code, the implicit moves (source base -> (destination, is_out),
+        with 0 for the batter and 4 for home), explicit advance parameters, stolen-base sources,
+        and the sacrifice / double play modifiers. None for NP (no play) records.
+    """
+    event = event_tx.replace('!', '').replace('#', '').replace('?', '').strip()
+    if event in ('NP', ''):
+        return None
+
+    sections = _split_outside_parens(event, '.')
+    basic, advances = sections[0], '.'.join(sections[1:])
+    pieces = _split_outside_parens(basic, '/')
+    play = pieces[0]
+    modifiers = {piece.rstrip('+-') for piece in pieces[1:]}
+
+    moves = {}
+    stolen = set()
+    primary, _, secondary = play.partition('+')
+
+    if re.match(r'^(SB|CS|POCS|PO)[123H]', primary):
+        event_cd = EVENT_UNKNOWN
+        for part in primary.split(';'):
+            code = _parse_runner_play(part, moves, stolen)
+            event_cd = code if event_cd == EVENT_UNKNOWN else event_cd
+    elif primary.startswith('DI'):
+        event_cd = EVENT_DEFENSIVE_INDIFFERENCE
+    elif primary.startswith('BK'):
+        event_cd = EVENT_BALK
+    elif primary.startswith('WP'):
+        event_cd = EVENT_WILD_PITCH
+    elif primary.startswith('PB'):
+        event_cd = EVENT_PASSED_BALL
+    elif primary.startswith('OA'):
+        event_cd = EVENT_OTHER_ADVANCE
+    elif primary.startswith('FLE'):
+        event_cd = EVENT_FOUL_ERROR
+    elif primary.startswith('K'):
+        event_cd = EVENT_STRIKEOUT
+        moves[0] = (0, True)
+    elif primary in ('IW', 'I'):
+        event_cd = EVENT_INTENTIONAL_WALK
+        moves[0] = (1, False)
+    elif primary == 'W':
+        event_cd = EVENT_WALK
+        moves[0] = (1, False)
+    elif primary.startswith('HP'):
+        event_cd = EVENT_HIT_BY_PITCH
+        moves[0] = (1, False)
+    elif primary.startswith('H'):
+        event_cd = EVENT_HOME_RUN
+        moves[0] = (4, False)
+    elif primary.startswith('FC'):
+        event_cd = EVENT_FIELDERS_CHOICE
+        moves[0] = (1, False)
+    elif primary.startswith('S'):
+        event_cd = EVENT_SINGLE
+        moves[0] = (1, False)
+    elif primary.startswith('D'):
+        event_cd = EVENT_DOUBLE
+        moves[0] = (2, False)
+    elif primary.startswith('T'):
+        event_cd = EVENT_TRIPLE
+        moves[0] = (3, False)
+    elif primary == 'C':
+        event_cd = EVENT_INTERFERENCE
+        moves[0] = (1, False)
+    elif re.match(r'^\d*E\d', primary):
+        event_cd = EVENT_ERROR
+        moves[0] = (1, False)
+    elif primary[:1].isdigit():
+        event_cd = EVENT_GENERIC_OUT
+        runners_out = re.findall(r'\(([B123])\)', primary)
+        trailing = primary.rsplit(')', 1)[-1] if '(' in primary else primary
+        for runner in runners_out:
+            base = BASE_NUMBER[runner]
+            moves[base] = (base, True)
+        if '(' not in primary or 'B' in runners_out or trailing:
+            moves[0] = (0, True)
+        else:
+            moves[0] = (1, False)
+    else:
+        event_cd = EVENT_UNKNOWN
+
+    # K+SB2, W+WP, K+PO1(13), ...
+    for part in (secondary.split(';') if secondary else []):
+        if re.match(r'^(SB|CS|POCS|PO)[123H]', part):
+            _parse_runner_play(part, moves, stolen)
+
+    explicit = {}
+    for advance in (_split_outside_parens(advances, ';') if advances else []):
+        match = ADVANCE_PATTERN.match(advance.strip())
+        if match is None:
+            continue
+        source, kind, destination, raw_params = match.groups()
+        params = PARAM_PATTERN.findall(raw_params)
+        is_out = kind == 'X' and not _has_error(params)
+        explicit[BASE_NUMBER[source]] = (BASE_NUMBER[destination], is_out, params)
+
+    return {
+        'event_cd': event_cd,
+        'moves': moves,
+        'explicit': explicit,
+        'stolen': stolen,
+        'sacrifice': bool(modifiers & {'SH', 'SF'}),
+        'double_play': any(modifier.endswith(('DP', 'TP')) and modifier != 'NDP' for modifier in modifiers),
+    }
+
+
+class _Runner:
+    """A runner on base: player id, pinch-runner flag and the event row where the batter reached."""
+
+    __slots__ = ('player_id', 'pinch_runner', 'origin_row')
+
+    def __init__(self, player_id, origin_row):
+        self.player_id = player_id
+        self.pinch_runner = False
+        self.origin_row = origin_row
+
+
+def parse_game(game_id, records, hands):
+    """
+    Replay one game and build its events and games rows.
+
+    Args:
+        game_id: Twelve character Retrosheet GAME_ID
+        records: (record_type, fields) tuples following the id record
+        hands: Roster hands from load_rosters()
+
+    Returns:
+        (game_row, event_rows) where game_row is a dict matching GAMES_SCHEMA and event_rows
+        is a list of dicts matching EVENTS_SCHEMA
+    """
+    year = int(game_id[3:7])
+    home_team = game_id[:3]
+    info = {}
+    lineups = ({}, {})       # team -> {player_id: batting slot}
+    slot_players = ({}, {})  # team -> {batting slot: player_id}
+    pitchers = [None, None]  # team -> current pitcher
+    score = [0, 0]
+    bases = {1: None, 2: None, 3: None}
+    outs = 0
+    half_inning = None
+    pending_runners = []
+    bat_adjust = {}
+    pit_adjust = {}
+    adjusted_bat_id = None   # batter whose plate appearance the badj/padj records apply to
+    rows = []
+
+    for record_type, fields in records:
+        if record_type == 'info' and len(fields) >= 2:
+            info[fields[0]] = fields[1]
+
+        elif record_type in ('start', 'sub') and len(fields) >= 5:
+            player_id, team, slot, position = fields[0], int(fields[2]), int(fields[3]), int(fields[4])
+            replaced = slot_players[team].get(slot)
+            if position == 12 and replaced is not None:
+                for runner in bases.values():
+                    if runner is not None and runner.player_id == replaced:
+                        runner.player_id = player_id
+                        runner.pinch_runner = True
+            if replaced is not None and slot != 0:
+                lineups[team].pop(replaced, None)
+            lineups[team][player_id] = slot
+            slot_players[team][slot] = player_id
+            if position == 1:
+                pitchers[team] = player_id
+
+        elif record_type in ('badj', 'padj') and len(fields) >= 2:
+            if adjusted_bat_id is not None:
+                # Adjustments already in use belong to an earlier plate appearance
+                bat_adjust, pit_adjust, adjusted_bat_id = {}, {}, None
+            (bat_adjust if record_type == 'badj' else pit_adjust)[fields[0]] = fields[1]
+
+        elif record_type == 'radj' and len(fields) >= 2:
+            pending_runners.append((fields[0], int(fields[1])))
+
+        elif record_type == 'play' and len(fields) >= 6:
+            inning, batting_team, bat_id, pitches, event_tx = int(fields[0]), int(fields[1]), fields[2], fields[4], fields[5]
+            if (inning, batting_team) != half_inning:
+                half_inning = (inning, batting_team)
+                bases = {1: None, 2: None, 3: None}
+                outs = 0
+            if adjusted_bat_id not in (None, bat_id):
+                # The adjusted plate appearance ended without a batter event (e.g. caught stealing)
+                bat_adjust, pit_adjust, adjusted_bat_id = {}, {}, None
+            for runner_id, base in pending_runners:
+                bases[base] = _Runner(runner_id, None)
+            pending_runners = []
+
+            parsed = parse_event(event_tx)
+            if parsed is None:
+                continue
+
+            pit_id = pitchers[1 - batting_team]
+            bats, _ = hands.get(bat_id, ('', ''))
+            _, throws = hands.get(pit_id, ('', ''))
+            throws = pit_adjust.get(pit_id, throws)
+            bats = bat_adjust.get(bat_id, bats)
+            if bat_adjust or pit_adjust:
+                adjusted_bat_id = bat_id
+            if bats == 'B':
+                bats = 'L' if throws == 'R' else 'R'
+
+            event_cd = parsed['event_cd']
+            row = {
+                'seq_events': len(rows) + 1,
+                'YEAR_ID': year,
+                'GAME_ID': game_id,
+                'bat_id': bat_id,
+                'PA_BALL_CT': sum(pitch in BALL_PITCHES for pitch in pitches),
+                'PA_SWINGMISS_STRIKE_CT': sum(pitch in SWINGMISS_PITCHES for pitch in pitches),
+                'BAT_HOME_ID': batting_team,
+                'BAT_FATE_ID': 0,
+                'EVENT_CD': event_cd,
+                'RBI_CT': 0,
+                'event_tx': event_tx,
+                'BAT_LINEUP_ID': lineups[batting_team].get(bat_id),
+                'BASE1_RUN_ID': bases[1].player_id if bases[1] else None,
+                'BASE2_RUN_ID': bases[2].player_id if bases[2] else None,
+                'BASE3_RUN_ID': bases[3].player_id if bases[3] else None,
+                'RUN1_SB_FL': 'T' if 1 in parsed['stolen'] else 'F',
+                'RUN2_SB_FL': 'T' if 2 in parsed['stolen'] else 'F',
+                'RUN3_SB_FL': 'T' if 3 in parsed['stolen'] else 'F',
+                'ab_fl': 'T' if event_cd in AT_BAT_EVENTS and not parsed['sacrifice'] else 'F',
+                'PR_Run1_fl': 'T' if bases[1] and bases[1].pinch_runner else 'F',
+                'PR_Run2_fl': 'T' if bases[2] and bases[2].pinch_runner else 'F',
+                'PR_Run3_fl': 'T' if bases[3] and bases[3].pinch_runner else 'F',
+                'INN_CT': inning,
+                'OUTS_CT': outs,
+                'AWAY_SCORE_CT': score[0],
+                'HOME_SCORE_CT': score[1],
+                'HOME_TEAM_ID': home_team,
+                'BAT_HAND_CD': bats or None,
+                'PIT_HAND_CD': throws or None,
+                'PIT_ID': pit_id,
+            }
+            rows.append(row)
+
+            # Resolve every runner's movement: explicit advances override implicit ones
+            moves = dict(parsed['moves'])
+            params = {}
+            if event_cd in (EVENT_WALK, EVENT_INTENTIONAL_WALK, EVENT_HIT_BY_PITCH, EVENT_INTERFERENCE):
+                # Forced runners advance one base unless the advance field says otherwise
+                for base in (1, 2, 3):
+                    if bases[base] is None:
+                        break
+                    moves.setdefault(base, (base + 1, False))
+            for source, (destination, is_out, advance_params) in parsed['explicit'].items():
+                moves[source] = (destination, is_out)
+                params[source] = advance_params
+
+            batter = _Runner(bat_id, len(rows) - 1) if event_cd in BATTER_EVENTS or 0 in moves else None
+            new_bases = {base: bases[base] for base in (1, 2, 3) if base not in moves}
+            rbi = 0
+            for source in (3, 2, 1, 0):
+                if source not in moves:
+                    continue
+                runner = batter if source == 0 else bases[source]
+                if runner is None:
+                    continue
+                destination, is_out = moves[source]
+                if is_out:
+                    outs += 1
+                    continue
+                if runner.origin_row is not None:
+                    fate = rows[runner.origin_row]
+                    fate['BAT_FATE_ID'] = max(fate['BAT_FATE_ID'], destination)
+                if destination == 4:
+                    score[batting_team] += 1
+                    advance_params = params.get(source, [])
+                    credited = event_cd in RBI_EVENTS and not parsed['double_play'] and not _has_error(advance_params)
+                    if 'RBI' in advance_params:
+                        credited = True
+                    if 'NR' in advance_params or 'NORBI' in advance_params:
+                        credited = False
+                    rbi += credited
+                elif destination > 0:
+                    new_bases[destination] = runner
+            row['RBI_CT'] = rbi
+            bases = {base: new_bases.get(base) for base in (1, 2, 3)}
+            if event_cd in BATTER_EVENTS:
+                bat_adjust, pit_adjust, adjusted_bat_id = {}, {}, None
+
+    game_date = info.get('date')
+    temp = info.get('temp')
+    windspeed = info.get('windspeed')
+    daynight = info.get('daynight', '')
+    game_row = {
+        'GAME_ID': game_id,
+        'YEAR_ID': year,
+        'GAME_DT': datetime.strptime(game_date, '%Y/%m/%d').date() if game_date else None,
+        'GAME_CT': int(info.get('number', game_id[-1]) or 0),
+        'HOME_TEAM_ID': info.get('hometeam', home_team),
+        'AWAY_TEAM_ID': info.get('visteam'),
+        'START_GAME_TM': info.get('starttime'),
+        'DAYNIGHT_PARK_CD': daynight[:1].upper() or None,
+        'TEMP_PARK_CT': int(temp) if temp and temp.lstrip('-').isdigit() else None,
+        'WIND_DIRECTION_PARK_CD': info.get('winddir'),
+        'WIND_SPEED_PARK_CT': int(windspeed) if windspeed and windspeed.lstrip('-').isdigit() else None,
+        'PRECIP_PARK_CD': info.get('precip'),
+        'SKY_PARK_CD': info.get('sky'),
+        'WIN_PIT_ID': info.get('wp') or None,
+        'park_id': info.get('site'),
+    }
+    return game_row, rows
+
+
+def parse_event_file(path, input_dir, output_dir, fmt='parquet'):
+    """
+    Parse one team-season event file and write its events and games partitions.
+
+    Args:
+        path: Path to the YYYYTTT.EVx file
+        input_dir: Directory containing the roster files for the season
+        output_dir: Root output directory
+        fmt: 'parquet' or 'ipc'
+
+    Returns:
+        (path, year, games_parsed, events_parsed)
+    """
+    match = EVENT_FILE_PATTERN.match(Path(path).name)
+    year, team = int(match.group(1)), match.group(2).upper()
+    hands = load_rosters(str(input_dir), year)
+
+    game_rows = []
+    event_rows = []
+    for game_id, records in iter_games(path):
+        game_row, rows = parse_game(game_id, records, hands)
+        game_rows.append(game_row)
+        event_rows.extend(rows)
+
+    extension = 'parquet' if fmt == 'parquet' else 'arrow'
+    for name, rows, schema in (('events', event_rows, EVENTS_SCHEMA), ('games', game_rows, GAMES_SCHEMA)):
+        target = Path(output_dir) / name / str(year) / f'{team}.{extension}'
+        target.parent.mkdir(parents=True, exist_ok=True)
+        frame = pl.from_dicts(rows, schema=schema) if rows else pl.DataFrame(schema=schema)
+        if fmt == 'parquet':
+            frame.write_parquet(target)
+        else:
+            frame.write_ipc(target)
+
+    return str(path), year, len(game_rows), len(event_rows)
+
+
+def find_event_files(input_dir, start_year, end_year):
+    """Return the event files in input_dir for the given seasons, sorted by year and team."""
+    files = []
+    for path in Path(input_dir).rglob('*'):
+        match = EVENT_FILE_PATTERN.match(path.name)
+        if match and start_year <= int(match.group(1)) <= end_year:
+            files.append(path)
+    return sorted(files, key=lambda p: p.name.upper())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Parse raw Retrosheet event files into year-partitioned columnar files',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Parse every season with all cores
+  python parse_retrosheet_events.py --input-dir ~/retrosheet/events --output-dir ~/retrosheet/columnar
+
+  # Parse 2020-2025 as Arrow IPC with 8 workers
+  python parse_retrosheet_events.py --input-dir ~/retrosheet/events --output-dir ~/retrosheet/columnar --start-year 2020 --end-year 2025 --format ipc --workers 8
+        """
+    )
+
+    parser.add_argument('--input-dir', required=True, help='Directory containing the unzipped event and roster files')
+    parser.add_argument('--output-dir', required=True, help='Directory to write the events/ and games/ partitions to')
+    parser.add_argument('--start-year', type=int, default=1952, help='First year to parse (default: 1952)')
+    parser.add_argument('--end-year', type=int, default=2025, help='Last year to parse (default: 2025)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of parser processes (default: CPU count)')
+    parser.add_argument('--format', choices=['parquet', 'ipc'], default='parquet', help='Output format (default: parquet)')
+
+    args = parser.parse_args()
+
+    files = find_event_files(args.input_dir, args.start_year, args.end_year)
+    if not files:
+        print(f"ERROR: No event files found in {args.input_dir} for {args.start_year}-{args.end_year}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("RETROSHEET EVENT FILE PARSER - CONFIGURATION")
+    print("=" * 60)
+    print(f"Input directory: {args.input_dir}")
+    print(f"Output directory: {args.output_dir}")
+    print(f"Year range: {args.start_year} to {args.end_year}")
+    print(f"Event files: {len(files)}")
+    print(f"Workers: {args.workers}")
+    print(f"Format: {args.format}")
+    print("=" * 60)
+
+    overall_start = datetime.now()
+    total_games = 0
+    total_events = 0
+    processed = 0
+    failed_files = []
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        future_to_path = {
+            executor.submit(parse_event_file, path, args.input_dir, args.output_dir, args.format): path
+            for path in files
+        }
+
+        for future in as_completed(future_to_path):
+            path = future_to_path[future]
+            processed += 1
+            try:
+                _, year, games, events = future.result()
+                total_games += games
+                total_events += events
+            except Exception as exc:
+                failed_files.append(path)
+                print(f"✗ {path.name} failed: {exc}")
+
+            if processed % 50 == 0 or processed == len(files):
+                print(f"Progress: {processed}/{len(files)} files | Games: {total_games:,} | Events: {total_events:,}")
+
+    total_duration = (datetime.now() - overall_start).total_seconds()
+
+    print("\n" + "=" * 60)
+    print("PARSING COMPLETE")
+    print("=" * 60)
+    print(f"Total duration: {total_duration / 60:.1f} minutes ({total_duration:.0f} seconds)")
+    print(f"Files parsed: {len(files) - len(failed_files)}/{len(files)}")
+    print(f"Games: {total_games:,}")
+    print(f"Events: {total_events:,}")
+    if failed_files:
+        print(f"\nFailed files: {', '.join(p.name for p in failed_files)}")
+    print("=" * 60)
+
+    sys.exit(0 if not failed_files else 1)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nParsing interrupted by user (Ctrl+C)")
+        sys.exit(130)
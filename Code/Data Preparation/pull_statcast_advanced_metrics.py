@@ -9,26 +9,43 @@ This script retrieves pitch-level Statcast data and aggregates it to game level:
 
 Data is inserted into the retrosheet MariaDB database with partitioning by year.
 Includes both MLB game_pk and Retrosheet GAME_ID for joining with existing tables.
+
+Raw pitches are kept in a local store (statcast_pitch_store.py, one Parquet file per game
+date), so reruns and new aggregates read from disk and only missing dates are downloaded.
+Batches are upserted on the table keys, so reruns and backfills may overlap dates already loaded.
+Batches follow the season's actual game dates (statcast_schedule.py), are sized by expected pitch
+count to stay under Savant's per-query row cap, and leave out dates that are already loaded.
+With --since-last-run only the game dates since the latest one loaded are pulled (nightly runs),
+starting SETTLE_DAYS before it, since Savant may still have been adding games of those dates.
+Each batch keeps only the pitch columns the aggregations read, with compact types (savant_csv.py);
+with --ingest csv the Savant search CSV is downloaded directly instead of through pybaseball.
 """
 
 import argparse
 import getpass
 import logging
+import queue
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 
 import pandas as pd
 import numpy as np
 import sqlalchemy
-from pybaseball import statcast, cache, playerid_reverse_lookup
+from pybaseball import statcast, cache
 
 # Add parent directory to path to import Database class
 sys.path.append(str(Path(__file__).parent.parent / 'Production'))
-from create_model_ready import Database
+from create_model_ready import DATA_DIR, Database, PlayerCrosswalk
+from statcast_pitch_store import SETTLE_DAYS, StatcastPitchStore, settled_through
+from rate_limiter import TokenBucket, call_with_retry
+from statcast_schedule import SeasonSchedule, plan_batches, DEFAULT_MAX_PITCHES, SAVANT_ROW_CAP
+from savant_csv import PITCH_SCHEMA, compact_pitches, fetch_savant_csv, split_range
+import statcast_game_polars
 
 
 # Configure logging
@@ -43,6 +60,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Primary keys of the game-level tables; upserts replace the non-key columns of existing rows
+TABLE_KEYS = {
+    'statcast_batter_game': ('year_id', 'game_pk', 'batter_id'),
+    'statcast_pitcher_game': ('year_id', 'game_pk', 'pitcher_id'),
+}
+
+
 # Team code mapping from MLB to Retrosheet format
 MLB_TO_RETROSHEET = {
     "LAA": "ANA", "HOU": "HOU", "OAK": "OAK", "TOR": "TOR",
@@ -52,7 +76,7 @@ MLB_TO_RETROSHEET = {
     "BAL": "BAL", "SD": "SDN", "PHI": "PHI", "PIT": "PIT",
     "TEX": "TEX", "TB": "TBA", "BOS": "BOS", "CIN": "CIN",
     "COL": "COL", "KC": "KCA", "DET": "DET", "MIN": "MIN",
-    "CWS": "CHA", "NYY": "NYA"
+    "CWS": "CHA", "NYY": "NYA", "AZ": "ARI"
 }
 
 
@@ -60,7 +84,10 @@ class StatcastGameLevelLoader:
     """Pull pitch-level Statcast data and aggregate to game level for MariaDB."""
 
     def __init__(self, uid: str, pwd: str, host: str, db: str, port: int,
-                 enable_cache: bool = True):
+                 enable_cache: bool = True, store_dir: Optional[str] = None, upsert: bool = True,
+                 agg_engine: str = 'pandas', requests_per_sec: float = 2.0, fetch_retries: int = 4,
+                 schedule_dir: Optional[str] = None, max_pitches_per_batch: int = DEFAULT_MAX_PITCHES,
+                 skip_loaded: bool = True, ingest: str = 'pybaseball'):
         """
         Initialize the database loader.
 
@@ -71,9 +98,41 @@ class StatcastGameLevelLoader:
             db: Database name
             port: Database port
             enable_cache: Whether to enable pybaseball caching (recommended)
+            store_dir: Directory of the local pitch-level store; None downloads every batch from Savant
+            upsert: Merge batches on the table keys so reruns of overlapping dates replace existing rows
+                (False appends and fails on duplicate keys)
+            agg_engine: 'pandas' or 'polars' (statcast_game_polars.py) for the game-level aggregations
+            requests_per_sec: Savant request budget shared by all loader threads (one request per day of data)
+            fetch_retries: Retries of a failed Savant pull, with exponential backoff
+            schedule_dir: Directory of the cached season schedules used to plan batches; None keeps
+                them in memory only
+            max_pitches_per_batch: Most expected pitches per Savant request (see statcast_schedule.py)
+            skip_loaded: Leave dates whose games are all loaded already out of the batches
+            ingest: 'pybaseball' (statcast(), every column) or 'csv' (Savant's search CSV read
+                directly with only the aggregation columns, see savant_csv.py); with a pitch store,
+                'csv' stores only those columns
         """
         self.db_helper = Database(uid, pwd, host, db, port)
-        self.engine = self.db_helper.db_connect()
+        # local_infile lets db_insert bulk-load each batch with LOAD DATA LOCAL INFILE
+        self.engine = self.db_helper.db_connect(connect_args={'local_infile': True})
+
+        self.upsert = upsert
+        self.agg_engine = agg_engine
+        self.ingest = ingest
+        # One limiter for every thread, so the combined request rate stays within the budget
+        self.limiter = TokenBucket(requests_per_sec)
+        self.fetch_retries = fetch_retries
+        self._fetch_stats = threading.local()
+
+        self.pitch_store = StatcastPitchStore(store_dir, fetch=self.fetch_statcast) if store_dir else None
+        if self.pitch_store is not None:
+            logger.info(f"Local pitch store: {store_dir}")
+
+        self.schedule = SeasonSchedule(schedule_dir, engine=self.engine)
+        self._game_index = {}
+        self._game_index_lock = threading.Lock()
+        self.max_pitches_per_batch = max_pitches_per_batch
+        self.skip_loaded = skip_loaded
 
         if enable_cache:
             cache.enable()
@@ -199,54 +258,69 @@ class StatcastGameLevelLoader:
 
         logger.info("All tables created successfully")
 
-    def map_mlb_to_retrosheet_ids(self, mlb_ids: list) -> dict:
+    def map_mlb_to_retrosheet_ids(self, mlb_ids: pd.Series) -> np.ndarray:
         """
         Map MLB (MLBAM) player IDs to Retrosheet player IDs.
 
+        Uses the process-wide PlayerCrosswalk, so the Chadwick register is read once per process
+        instead of once per batch.
+
         Args:
-            mlb_ids: List of MLB player IDs
+            mlb_ids: MLB player IDs
 
         Returns:
-            Dictionary mapping MLB ID to Retrosheet ID
+            Retrosheet IDs aligned with mlb_ids (None where unmapped)
         """
-        if not mlb_ids:
-            return {}
-
         try:
-            # Remove duplicates and NaN values
-            unique_ids = [int(pid) for pid in set(mlb_ids) if pd.notna(pid)]
-
-            if not unique_ids:
-                return {}
-
-            logger.info(f"    Mapping {len(unique_ids)} unique player IDs to Retrosheet format...")
+            retro_ids = PlayerCrosswalk.shared().to_retro(mlb_ids)
+            known = pd.notna(mlb_ids)
+            mapped = known & pd.notna(retro_ids)
+            logger.info(f"    Mapped {pd.Series(mlb_ids)[mapped].nunique()}/{pd.Series(mlb_ids)[known].nunique()} "
+                        f"players to Retrosheet IDs")
+            return retro_ids
 
-            # Use pybaseball's reverse lookup function
-            # key_type='mlbam' means we're passing MLB IDs
-            lookup_df = playerid_reverse_lookup(unique_ids, key_type='mlbam')
+        except Exception as e:
+            logger.warning(f"    Error mapping player IDs to Retrosheet format: {e}")
+            return np.full(len(mlb_ids), None, dtype=object)
 
-            # Create mapping dictionary: mlb_id -> retrosheet_id
-            mapping = {}
-            if lookup_df is not None and not lookup_df.empty:
-                for _, row in lookup_df.iterrows():
-                    mlb_id = row.get('key_mlbam')
-                    retro_id = row.get('key_retro')
-                    if pd.notna(mlb_id) and pd.notna(retro_id):
-                        mapping[int(mlb_id)] = retro_id
+    def retrosheet_game_index(self, year: int) -> pd.DataFrame:
+        """
+        GAME_IDs of a season in retrosheet.games, keyed by home team, date and game order.
 
-                logger.info(f"    Successfully mapped {len(mapping)}/{len(unique_ids)} players to Retrosheet IDs")
-            else:
-                logger.warning(f"    No Retrosheet mappings found for provided MLB IDs")
+        Read once per season and kept for the life of the loader. The game order numbers a home
+        team's games on a date 1, 2, ... in GAME_ID order (suffix 0 for a single game, 1 and 2
+        for a doubleheader).
 
-            return mapping
+        Args:
+            year: Season
 
-        except Exception as e:
-            logger.warning(f"    Error mapping player IDs to Retrosheet format: {e}")
-            return {}
+        Returns:
+            DataFrame with home_team_rs, date_str (YYYYMMDD), game_order and game_id columns
+            (empty if the season is not in retrosheet.games)
+        """
+        with self._game_index_lock:
+            if year not in self._game_index:
+                query = sqlalchemy.text("SELECT GAME_ID FROM retrosheet.games WHERE YEAR_ID = :year")
+                try:
+                    with self.engine.connect() as connection:
+                        game_ids = pd.Series([row[0] for row in connection.execute(query, {'year': year})],
+                                             dtype=object)
+                except Exception as e:
+                    logger.warning(f"    Could not read {year} GAME_IDs from retrosheet.games: {e}")
+                    game_ids = pd.Series([], dtype=object)
+
+                index = pd.DataFrame({
+                    'home_team_rs': game_ids.str[:3],
+                    'date_str': game_ids.str[3:11],
+                    'game_id': game_ids,
+                }).sort_values('game_id', ignore_index=True)
+                index['game_order'] = index.groupby(['home_team_rs', 'date_str']).cumcount() + 1
+                self._game_index[year] = index
+            return self._game_index[year]
 
     def create_retrosheet_game_ids(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Create Retrosheet-format GAME_ID for all games in dataframe.
+        Add the Retrosheet GAME_ID of each row's game.
 
         Format: TTTYYYYMMDDG
         - TTT: Home team 3-letter Retrosheet code
@@ -255,6 +329,12 @@ class StatcastGameLevelLoader:
         - DD: Day (2 digits with leading zero)
         - G: Game number (0 for single game, 1/2 for doubleheader games)
 
+        Each distinct game is matched once against the GAME_IDs in retrosheet.games on home team,
+        date and game order. Doubleheader games are ordered by scheduled start time (see
+        SeasonSchedule.game_order), or by game_pk when the schedule does not have them. Games
+        missing from retrosheet.games (the current season, the postseason) are reported and get
+        a GAME_ID built from the same fields.
+
         Args:
             df: DataFrame with home_team, game_date, game_pk columns
 
@@ -262,39 +342,37 @@ class StatcastGameLevelLoader:
             DataFrame with game_id column added
         """
         try:
-            # Convert home team to Retrosheet format
-            df['home_team_rs'] = df['home_team'].map(
-                lambda x: MLB_TO_RETROSHEET.get(x, x)
-            )
-
-            # Format date as YYYYMMDD
-            df['date_str'] = pd.to_datetime(df['game_date']).dt.strftime('%Y%m%d')
-
-            # Detect doubleheaders: multiple games same date, same home team
-            # First, count games per (home_team, date)
-            game_counts = df.groupby(['home_team_rs', 'date_str'])['game_pk'].transform('nunique')
-
-            # For each (home_team, date) with multiple games, assign game numbers
-            df['game_num'] = 0  # Default to 0 for single games
-
-            # Identify doubleheaders (more than 1 game per home team per date)
-            doubleheader_mask = game_counts > 1
-
-            if doubleheader_mask.any():
-                # For doubleheaders, sort by game_pk and assign 1, 2, etc.
-                df.loc[doubleheader_mask, 'game_num'] = (
-                    df[doubleheader_mask]
-                    .groupby(['home_team_rs', 'date_str'])['game_pk']
-                    .rank(method='dense')
-                    .astype(int)
-                )
-
-            # Create GAME_ID: TTTYYYYMMDDG
-            df['game_id'] = df['home_team_rs'] + df['date_str'] + df['game_num'].astype(str)
-
-            # Clean up temporary columns
-            df = df.drop(columns=['home_team_rs', 'date_str', 'game_num'])
-
+            games = df.loc[df['home_team'].notna(), ['game_pk', 'home_team', 'game_date']].drop_duplicates('game_pk')
+            game_dates = pd.to_datetime(games['game_date'])
+            games = pd.DataFrame({
+                'game_pk': games['game_pk'].to_numpy(),
+                'home_team_rs': games['home_team'].astype(object).replace(MLB_TO_RETROSHEET).to_numpy(),
+                'date_str': game_dates.dt.strftime('%Y%m%d').to_numpy(),
+                'year': game_dates.dt.year.to_numpy(),
+            })
+            years = [int(year) for year in games['year'].unique()]
+
+            # Doubleheader order by start time, falling back to game_pk order
+            game_order = {}
+            for year in years:
+                game_order.update(self.schedule.game_order(year))
+            pk_order = games.groupby(['home_team_rs', 'date_str'])['game_pk'].rank(method='dense')
+            games['game_order'] = games['game_pk'].map(game_order).fillna(pk_order).astype(int)
+
+            index = pd.concat([self.retrosheet_game_index(year) for year in years], ignore_index=True)
+            games = games.merge(index, on=['home_team_rs', 'date_str', 'game_order'], how='left')
+
+            unmatched = games['game_id'].isna()
+            if unmatched.any():
+                doubleheader = games.groupby(['home_team_rs', 'date_str'])['game_pk'].transform('size') > 1
+                game_num = games['game_order'].where(doubleheader, 0).astype(str)
+                games.loc[unmatched, 'game_id'] = (games['home_team_rs'] + games['date_str'] + game_num)[unmatched]
+                rows = df['game_pk'].isin(games.loc[unmatched, 'game_pk']).sum()
+                logger.warning(f"    {unmatched.sum()} of {len(games)} games ({rows} rows) not in retrosheet.games, "
+                               f"e.g. {', '.join(games.loc[unmatched, 'game_id'].head(3))}; "
+                               f"using unverified GAME_IDs")
+
+            df['game_id'] = df['game_pk'].map(games.set_index('game_pk')['game_id'])
             return df
 
         except Exception as e:
@@ -303,80 +381,162 @@ class StatcastGameLevelLoader:
             df['game_id'] = None
             return df
 
-    def aggregate_batter_game_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+    def derive_pitch_features(self, df: pd.DataFrame):
         """
-        Aggregate pitch-level data to game level for batters.
+        Derivation stage shared by the batter and pitcher aggregations.
+
+        The batted-ball mask, quality-of-contact flags and plate appearance boundaries are
+        computed once per pull, and both aggregations read them.
 
         Args:
             df: Pitch-level Statcast data
 
+        Returns:
+            The pitches with the derived columns: a pandas DataFrame (derive_pitch_flags), or with
+            the polars engine a cached LazyFrame (statcast_game_polars.derive_pitch_features)
+        """
+        if self.agg_engine == 'polars':
+            pitches = statcast_game_polars.pitches_from_pandas(df)
+            return statcast_game_polars.derive_pitch_features(pitches).cache()
+        return self.derive_pitch_flags(df)
+
+    def aggregate_batter_game_stats(self, df) -> pd.DataFrame:
+        """
+        Aggregate pitch-level data to game level for batters.
+
+        Args:
+            df: Output of derive_pitch_features
+
         Returns:
             Game-level batter statistics
         """
         logger.info("  Aggregating batter statistics to game level...")
 
-        # Filter to batted balls only for some metrics
-        batted_df = df[df['type'] == 'X'].copy()  # type='X' means ball in play
-
-        # Create barrel indicator (>=98mph exit velo AND 26-30° launch angle)
-        # Fill NA values with 0 before converting to int
-        if 'launch_speed' in batted_df.columns and 'launch_angle' in batted_df.columns:
-            batted_df['is_barrel'] = (
-                (batted_df['launch_speed'].fillna(0) >= 98) &
-                (batted_df['launch_angle'].fillna(0) >= 26) &
-                (batted_df['launch_angle'].fillna(0) <= 30)
-            ).fillna(False).astype(int)
-
-            # Hard hit: >= 95 mph
-            batted_df['is_hard_hit'] = (
-                batted_df['launch_speed'].fillna(0) >= 95
-            ).fillna(False).astype(int)
-
-            # Sweet spot: 8-32° launch angle
-            batted_df['is_sweet_spot'] = (
-                (batted_df['launch_angle'].fillna(0) >= 8) &
-                (batted_df['launch_angle'].fillna(0) <= 32)
-            ).fillna(False).astype(int)
+        if self.agg_engine == 'polars':
+            batted_agg = statcast_game_polars.aggregate_batter_game_stats(df).to_pandas()
+        else:
+            batted_agg = self.aggregate_batter_pitches(df)
 
-        # Aggregate batted ball metrics
-        # Note: Group by batter ID only, not player_name, to avoid duplicates from inconsistent names
-        batted_agg = batted_df.groupby(['game_pk', 'game_date', 'batter']).agg({
-            'player_name': 'first',  # Take first player name for this batter
-            'launch_speed': ['mean', 'max', 'count'],
-            'launch_angle': 'mean',
-            'is_barrel': 'sum',
-            'is_hard_hit': 'sum',
-            'is_sweet_spot': 'sum',
-            'estimated_ba_using_speedangle': 'mean',
-            'estimated_woba_using_speedangle': 'mean',
-            'estimated_slg_using_speedangle': 'mean',
-            'home_team': 'first',
-            'away_team': 'first'
-        }).reset_index()
-
-        # Flatten column names
-        batted_agg.columns = [
-            'game_pk', 'game_date', 'batter_id', 'batter_name',
-            'avg_launch_speed', 'max_launch_speed', 'batted_balls',
-            'avg_launch_angle', 'barrels', 'hard_hit', 'sweet_spot',
-            'avg_xba', 'avg_xwoba', 'avg_xslg',
-            'home_team', 'away_team'
-        ]
+        # Create Retrosheet GAME_ID
+        batted_agg = self.create_retrosheet_game_ids(batted_agg)
 
-        # Fill NaN values in integer columns to prevent database insertion errors
-        int_columns = ['batted_balls', 'barrels', 'hard_hit', 'sweet_spot']
-        for col in int_columns:
-            batted_agg[col] = batted_agg[col].fillna(0).astype(int)
+        # Map MLB batter IDs to Retrosheet bat_id
+        batted_agg['bat_id'] = self.map_mlb_to_retrosheet_ids(batted_agg['batter_id'])
+
+        # Select and rename columns to match schema
+        result = batted_agg[[
+            'game_pk', 'game_id', 'game_date', 'year_id', 'batter_id', 'bat_id', 'batter_name',
+            'team', 'opponent', 'home_away', 'pa', 'ab', 'batted_balls',
+            'avg_launch_speed', 'max_launch_speed', 'avg_launch_angle',
+            'barrels', 'barrel_rate', 'hard_hit', 'hard_hit_rate',
+            'sweet_spot', 'sweet_spot_rate', 'avg_xba', 'avg_xwoba', 'avg_xslg'
+        ]].copy()
+
+        logger.info(f"    Aggregated to {len(result)} game-batter combinations")
+        return result
 
-        # Count PA and AB from full dataset
-        pa_counts = df.groupby(['game_pk', 'batter']).agg({
-            'description': 'count',  # Total pitches seen
-        }).reset_index()
+    def aggregate_pitcher_game_stats(self, df) -> pd.DataFrame:
+        """
+        Aggregate pitch-level data to game level for pitchers.
+
+        Args:
+            df: Output of derive_pitch_features
+
+        Returns:
+            Game-level pitcher statistics
+        """
+        logger.info("  Aggregating pitcher statistics to game level...")
 
-        # Count actual plate appearances (last pitch of each AB)
-        pa_actual = df[df['pitch_number'].notna()].groupby(['game_pk', 'batter']).agg({
-            'at_bat_number': 'nunique'
-        }).reset_index()
+        if self.agg_engine == 'polars':
+            result = statcast_game_polars.aggregate_pitcher_game_stats(df).to_pandas()
+        else:
+            result = self.aggregate_pitcher_pitches(df)
+
+        # Create Retrosheet GAME_ID
+        result = self.create_retrosheet_game_ids(result)
+
+        # Map MLB pitcher IDs to Retrosheet pit_id
+        result['pit_id'] = self.map_mlb_to_retrosheet_ids(result['pitcher_id'])
+
+        # Select columns to match schema
+        result = result[[
+            'game_pk', 'game_id', 'game_date', 'year_id', 'pitcher_id', 'pit_id', 'pitcher_name',
+            'team', 'opponent', 'home_away', 'pitches', 'batters_faced', 'batted_balls_against',
+            'avg_release_speed', 'max_release_speed', 'avg_spin_rate',
+            'avg_launch_speed_against', 'max_launch_speed_against', 'avg_launch_angle_against',
+            'barrels_against', 'barrel_rate_against', 'hard_hit_against', 'hard_hit_rate_against',
+            'avg_xba_against', 'avg_xwoba_against'
+        ]].copy()
+
+        logger.info(f"    Aggregated to {len(result)} game-pitcher combinations")
+        return result
+
+    @staticmethod
+    def derive_pitch_flags(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pandas derivation stage: per-pitch columns shared by the batter and pitcher aggregations.
+
+        Adds, in place:
+        - is_batted_ball: ball in play (type 'X')
+        - is_barrel / is_hard_hit / is_sweet_spot: quality-of-contact flags, 0 on pitches not in play
+          and when the launch speed or angle is missing
+        - pa_start: 1 on the first pitch of each plate appearance (pitches with a pitch_number,
+          per game, batter and at_bat_number)
+
+        Args:
+            df: Pitch-level Statcast data
+
+        Returns:
+            The same DataFrame with the derived columns
+        """
+        df['is_batted_ball'] = df['type'] == 'X'
+
+        # Barrel: >=98mph exit velo AND 26-30° launch angle; hard hit: >= 95 mph; sweet spot: 8-32° launch angle
+        # (comparisons with a missing launch speed or angle are False)
+        launch_speed, launch_angle = df['launch_speed'], df['launch_angle']
+        df['is_barrel'] = (df['is_batted_ball'] & (launch_speed >= 98) &
+                           (launch_angle >= 26) & (launch_angle <= 30)).astype('int8')
+        df['is_hard_hit'] = (df['is_batted_ball'] & (launch_speed >= 95)).astype('int8')
+        df['is_sweet_spot'] = (df['is_batted_ball'] & (launch_angle >= 8) & (launch_angle <= 32)).astype('int8')
+
+        # Plate appearance boundaries
+        in_pa = df['pitch_number'].notna() & df['at_bat_number'].notna()
+        pa_start = pd.Series(False, index=df.index)
+        pa_start[in_pa] = ~df.loc[in_pa, ['game_pk', 'batter', 'at_bat_number']].duplicated()
+        df['pa_start'] = pa_start.astype('int8')
+        return df
+
+    @staticmethod
+    def aggregate_batter_pitches(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pandas engine for the batter aggregation (everything except GAME_ID and Retrosheet IDs).
+
+        Args:
+            df: Pitch-level Statcast data with the columns of derive_pitch_flags
+
+        Returns:
+            One row per batter and game with the columns of statcast_game_polars.BATTER_COLUMNS
+        """
+        # Aggregate batted ball metrics
+        # Note: Group by batter ID only, not player_name, to avoid duplicates from inconsistent names
+        batted_agg = df[df['is_batted_ball']].groupby(['game_pk', 'game_date', 'batter']).agg(
+            batter_name=('player_name', 'first'),  # Take first player name for this batter
+            avg_launch_speed=('launch_speed', 'mean'),
+            max_launch_speed=('launch_speed', 'max'),
+            batted_balls=('launch_speed', 'count'),
+            avg_launch_angle=('launch_angle', 'mean'),
+            barrels=('is_barrel', 'sum'),
+            hard_hit=('is_hard_hit', 'sum'),
+            sweet_spot=('is_sweet_spot', 'sum'),
+            avg_xba=('estimated_ba_using_speedangle', 'mean'),
+            avg_xwoba=('estimated_woba_using_speedangle', 'mean'),
+            avg_xslg=('estimated_slg_using_speedangle', 'mean'),
+            home_team=('home_team', 'first'),
+            away_team=('away_team', 'first')
+        ).reset_index().rename(columns={'batter': 'batter_id'})
+
+        # Count actual plate appearances (first pitch of each PA, see derive_pitch_flags)
+        pa_actual = df.groupby(['game_pk', 'batter'])['pa_start'].sum().reset_index()
         pa_actual.columns = ['game_pk', 'batter_id', 'pa']
 
         # Merge PA counts
@@ -386,13 +546,17 @@ class StatcastGameLevelLoader:
             how='left'
         )
 
-        # Fill NaN in pa column
-        batted_agg['pa'] = batted_agg['pa'].fillna(0).astype(int)
+        # Fill NaN values in integer columns to prevent database insertion errors
+        int_columns = ['batted_balls', 'barrels', 'hard_hit', 'sweet_spot', 'pa']
+        for col in int_columns:
+            batted_agg[col] = batted_agg[col].fillna(0).astype(int)
 
         # Calculate rates (handle division by zero)
         batted_agg['barrel_rate'] = (batted_agg['barrels'] / batted_agg['batted_balls']).fillna(0)
         batted_agg['hard_hit_rate'] = (batted_agg['hard_hit'] / batted_agg['batted_balls']).fillna(0)
-        batted_agg['sweet_spot_rate'] = (batted_agg['sweet_spot'] / batted_agg['batted_balls']).fillna(0)
+        # Sweet spots only need a launch angle, so there can be some with no launch speeds (batted_balls == 0)
+        batted_agg['sweet_spot_rate'] = (
+            batted_agg['sweet_spot'] / batted_agg['batted_balls']).replace(np.inf, 0).fillna(0)
 
         # Add year_id
         batted_agg['year_id'] = pd.to_datetime(batted_agg['game_date']).dt.year
@@ -405,115 +569,52 @@ class StatcastGameLevelLoader:
         # Add AB count (roughly PA minus walks/HBP, but simplified here)
         batted_agg['ab'] = batted_agg['pa']  # Simplified (pa is already int from above)
 
-        # Create Retrosheet GAME_ID
-        batted_agg = self.create_retrosheet_game_ids(batted_agg)
-
-        # Map MLB batter IDs to Retrosheet bat_id
-        batter_id_mapping = self.map_mlb_to_retrosheet_ids(batted_agg['batter_id'].tolist())
-        batted_agg['bat_id'] = batted_agg['batter_id'].map(batter_id_mapping)
-
-        # Select and rename columns to match schema
-        result = batted_agg[[
-            'game_pk', 'game_id', 'game_date', 'year_id', 'batter_id', 'bat_id', 'batter_name',
-            'team', 'opponent', 'home_away', 'pa', 'ab', 'batted_balls',
-            'avg_launch_speed', 'max_launch_speed', 'avg_launch_angle',
-            'barrels', 'barrel_rate', 'hard_hit', 'hard_hit_rate',
-            'sweet_spot', 'sweet_spot_rate', 'avg_xba', 'avg_xwoba', 'avg_xslg'
-        ]].copy()
-
-        logger.info(f"    Aggregated to {len(result)} game-batter combinations")
-        return result
+        return batted_agg
 
-    def aggregate_pitcher_game_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def aggregate_pitcher_pitches(df: pd.DataFrame) -> pd.DataFrame:
         """
-        Aggregate pitch-level data to game level for pitchers.
+        Pandas engine for the pitcher aggregation (everything except GAME_ID and Retrosheet IDs).
 
         Args:
-            df: Pitch-level Statcast data
+            df: Pitch-level Statcast data with the columns of derive_pitch_flags
 
         Returns:
-            Game-level pitcher statistics
+            One row per pitcher and game with the columns of statcast_game_polars.PITCHER_COLUMNS
         """
-        logger.info("  Aggregating pitcher statistics to game level...")
-
-        # First, get base pitcher info from full dataset (ensures game_date, pitcher_name always present)
-        base_pitcher_info = df.groupby(['game_pk', 'pitcher']).agg({
-            'game_date': 'first',
-            'player_name': 'first',
-            'home_team': 'first',
-            'away_team': 'first'
-        }).reset_index()
-
-        base_pitcher_info.columns = ['game_pk', 'pitcher_id', 'game_date', 'pitcher_name', 'home_team', 'away_team']
-
-        # Filter to batted balls for contact metrics
-        batted_df = df[df['type'] == 'X'].copy()
-
-        # Create barrel and hard hit indicators
-        # Fill NA values with 0 before converting to int
-        if 'launch_speed' in batted_df.columns and 'launch_angle' in batted_df.columns:
-            batted_df['is_barrel'] = (
-                (batted_df['launch_speed'].fillna(0) >= 98) &
-                (batted_df['launch_angle'].fillna(0) >= 26) &
-                (batted_df['launch_angle'].fillna(0) <= 30)
-            ).fillna(False).astype(int)
-            batted_df['is_hard_hit'] = (
-                batted_df['launch_speed'].fillna(0) >= 95
-            ).fillna(False).astype(int)
-
-        # Aggregate batted ball metrics against (only if there are batted balls)
-        if len(batted_df) > 0:
-            batted_agg = batted_df.groupby(['game_pk', 'pitcher']).agg({
-                'launch_speed': ['mean', 'max', 'count'],
-                'launch_angle': 'mean',
-                'is_barrel': 'sum',
-                'is_hard_hit': 'sum',
-                'estimated_ba_using_speedangle': 'mean',
-                'estimated_woba_using_speedangle': 'mean'
-            }).reset_index()
-
-            batted_agg.columns = [
-                'game_pk', 'pitcher_id',
-                'avg_launch_speed_against', 'max_launch_speed_against', 'batted_balls_against',
-                'avg_launch_angle_against', 'barrels_against', 'hard_hit_against',
-                'avg_xba_against', 'avg_xwoba_against'
-            ]
-
-            # Fill NaN values in integer columns
-            int_columns = ['batted_balls_against', 'barrels_against', 'hard_hit_against']
-            for col in int_columns:
-                batted_agg[col] = batted_agg[col].fillna(0).astype(int)
-        else:
-            # No batted balls in this batch - create empty dataframe with correct columns
-            batted_agg = pd.DataFrame(columns=[
-                'game_pk', 'pitcher_id', 'avg_launch_speed_against', 'max_launch_speed_against',
-                'batted_balls_against', 'avg_launch_angle_against', 'barrels_against',
-                'hard_hit_against', 'avg_xba_against', 'avg_xwoba_against'
-            ])
-
-        # Aggregate pitch characteristics
-        pitch_agg = df.groupby(['game_pk', 'pitcher']).agg({
-            'release_speed': ['mean', 'max', 'count'],
-            'release_spin_rate': 'mean',
-            'batter': 'nunique'
-        }).reset_index()
-
-        pitch_agg.columns = [
-            'game_pk', 'pitcher_id',
-            'avg_release_speed', 'max_release_speed', 'pitches',
-            'avg_spin_rate', 'batters_faced'
-        ]
-
-        # Start with base pitcher info, then merge in pitch stats and batted ball stats
-        # Using left merge ensures all pitchers keep their game_date, pitcher_name, etc.
-        result = base_pitcher_info.merge(pitch_agg, on=['game_pk', 'pitcher_id'], how='left')
-        result = result.merge(batted_agg, on=['game_pk', 'pitcher_id'], how='left')
+        # Base pitcher info and pitch characteristics from the full dataset
+        # (ensures game_date, pitcher_name always present)
+        pitch_agg = df.groupby(['game_pk', 'pitcher']).agg(
+            game_date=('game_date', 'first'),
+            pitcher_name=('player_name', 'first'),
+            home_team=('home_team', 'first'),
+            away_team=('away_team', 'first'),
+            avg_release_speed=('release_speed', 'mean'),
+            max_release_speed=('release_speed', 'max'),
+            pitches=('release_speed', 'count'),
+            avg_spin_rate=('release_spin_rate', 'mean'),
+            batters_faced=('batter', 'nunique')
+        ).reset_index().rename(columns={'pitcher': 'pitcher_id'})
+
+        # Aggregate batted ball metrics against
+        batted_agg = df[df['is_batted_ball']].groupby(['game_pk', 'pitcher']).agg(
+            avg_launch_speed_against=('launch_speed', 'mean'),
+            max_launch_speed_against=('launch_speed', 'max'),
+            batted_balls_against=('launch_speed', 'count'),
+            avg_launch_angle_against=('launch_angle', 'mean'),
+            barrels_against=('is_barrel', 'sum'),
+            hard_hit_against=('is_hard_hit', 'sum'),
+            avg_xba_against=('estimated_ba_using_speedangle', 'mean'),
+            avg_xwoba_against=('estimated_woba_using_speedangle', 'mean')
+        ).reset_index().rename(columns={'pitcher': 'pitcher_id'})
+
+        # Using left merge ensures pitchers without batted balls keep their pitch stats
+        result = pitch_agg.merge(batted_agg, on=['game_pk', 'pitcher_id'], how='left')
 
         # Fill NaN values in integer columns after merge
         int_columns_after_merge = ['pitches', 'batters_faced', 'batted_balls_against', 'barrels_against', 'hard_hit_against']
         for col in int_columns_after_merge:
-            if col in result.columns:
-                result[col] = result[col].fillna(0).astype(int)
+            result[col] = result[col].fillna(0).astype(int)
 
         # Calculate rates (handle division by zero)
         result['barrel_rate_against'] = (result['barrels_against'] / result['batted_balls_against']).fillna(0)
@@ -527,46 +628,103 @@ class StatcastGameLevelLoader:
         result['opponent'] = None
         result['home_away'] = None
 
-        # Create Retrosheet GAME_ID
-        result = self.create_retrosheet_game_ids(result)
+        return result
 
-        # Map MLB pitcher IDs to Retrosheet pit_id
-        pitcher_id_mapping = self.map_mlb_to_retrosheet_ids(result['pitcher_id'].tolist())
-        result['pit_id'] = result['pitcher_id'].map(pitcher_id_mapping)
+    def fetch_statcast(self, start_dt: str, end_dt: str) -> pd.DataFrame:
+        """
+        Download pitches under the shared rate limiter, retrying failures and empty results.
 
-        # Select columns to match schema
-        result = result[[
-            'game_pk', 'game_id', 'game_date', 'year_id', 'pitcher_id', 'pit_id', 'pitcher_name',
-            'team', 'opponent', 'home_away', 'pitches', 'batters_faced', 'batted_balls_against',
-            'avg_release_speed', 'max_release_speed', 'avg_spin_rate',
-            'avg_launch_speed_against', 'max_launch_speed_against', 'avg_launch_angle_against',
-            'barrels_against', 'barrel_rate_against', 'hard_hit_against', 'hard_hit_rate_against',
-            'avg_xba_against', 'avg_xwoba_against'
-        ]].copy()
+        Uses pybaseball's statcast(), or with ingest='csv' Savant's search CSV (fetch_savant_csv).
+        A CSV result that reaches Savant's row cap may be truncated, so the range is split in two
+        and each half fetched again. Limiter and backoff waits are added to the calling thread's
+        fetch stats (see run_batches).
 
-        logger.info(f"    Aggregated to {len(result)} game-pitcher combinations")
-        return result
+        Args:
+            start_dt: Start date (YYYY-MM-DD)
+            end_dt: End date (YYYY-MM-DD)
 
-    def pull_and_aggregate_date_range(self, start_date: str, end_date: str) -> tuple:
+        Returns:
+            Pitch-level DataFrame
         """
-        Pull pitch-level data for date range and aggregate to game level.
+        days = (datetime.strptime(end_dt, '%Y-%m-%d') - datetime.strptime(start_dt, '%Y-%m-%d')).days + 1
+
+        def on_retry(attempt, reason, delay):
+            logger.warning(f"    Savant {start_dt} to {end_dt}: {reason}; retry {attempt} in {delay:.1f}s")
+
+        if self.ingest == 'csv':
+            def request():
+                return fetch_savant_csv(start_dt, end_dt)
+        else:
+            def request():
+                return statcast(start_dt=start_dt, end_dt=end_dt)
+
+        df, stats = call_with_retry(request, self.limiter, tokens=days, retries=self.fetch_retries,
+                                    on_retry=on_retry)
+
+        fetch_stats = self._fetch_stats
+        fetch_stats.limiter_wait = getattr(fetch_stats, 'limiter_wait', 0.0) + stats['limiter_wait']
+        fetch_stats.backoff_wait = getattr(fetch_stats, 'backoff_wait', 0.0) + stats['backoff_wait']
+        fetch_stats.retries = getattr(fetch_stats, 'retries', 0) + stats['attempts'] - 1
+
+        if self.ingest == 'csv' and df is not None and len(df) >= SAVANT_ROW_CAP:
+            if days > 1:
+                logger.warning(f"    Savant {start_dt} to {end_dt}: {len(df)} rows reached the row cap; "
+                               f"splitting the range")
+                first, second = split_range(start_dt, end_dt)
+                return pd.concat([self.fetch_statcast(*first), self.fetch_statcast(*second)], ignore_index=True)
+            logger.warning(f"    Savant {start_dt}: {len(df)} rows reached the row cap; the day may be truncated")
+        return df
+
+    def fetch_date_range(self, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """
+        Pull pitch-level data for a date range (from the local pitch store when enabled).
+
+        The result has only the columns of savant_csv.PITCH_SCHEMA, with its compact types.
 
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
 
         Returns:
-            Tuple of (batter_df, pitcher_df)
+            Pitch-level DataFrame, or None if there is no data or the pull failed
         """
         try:
             logger.info(f"  Pulling pitch-level data for {start_date} to {end_date}...")
-            df = statcast(start_dt=start_date, end_dt=end_date)
+            if self.pitch_store is not None:
+                df = self.pitch_store.load_range(start_date, end_date, columns=list(PITCH_SCHEMA))
+            else:
+                df = self.fetch_statcast(start_dt=start_date, end_dt=end_date)
 
             if df is None or df.empty:
                 logger.warning(f"    No data returned for {start_date} to {end_date}")
-                return None, None
+                return None
+
+            # Only the columns the aggregations read, with compact types, wait in the pipeline queues
+            df = compact_pitches(df)
 
             logger.info(f"    Retrieved {len(df)} pitches")
+            return df
+
+        except Exception as e:
+            logger.error(f"    Error pulling data for {start_date} to {end_date}: {e}")
+            return None
+
+    def aggregate_pitches(self, df: Optional[pd.DataFrame]) -> tuple:
+        """
+        Aggregate one batch of pitch-level data to game level.
+
+        Args:
+            df: Pitch-level data from fetch_date_range (None if there was none)
+
+        Returns:
+            Tuple of (batter_df, pitcher_df), (None, None) if there is nothing to aggregate
+        """
+        if df is None:
+            return None, None
+
+        try:
+            # Per-pitch flags shared by both aggregations, computed once per pull
+            df = self.derive_pitch_features(df)
 
             # Aggregate to game level
             batter_stats = self.aggregate_batter_game_stats(df)
@@ -575,9 +733,22 @@ class StatcastGameLevelLoader:
             return batter_stats, pitcher_stats
 
         except Exception as e:
-            logger.error(f"    Error pulling/aggregating data: {e}")
+            logger.error(f"    Error aggregating data: {e}")
             return None, None
 
+    def pull_and_aggregate_date_range(self, start_date: str, end_date: str) -> tuple:
+        """
+        Pull pitch-level data for date range and aggregate to game level.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Tuple of (batter_df, pitcher_df)
+        """
+        return self.aggregate_pitches(self.fetch_date_range(start_date, end_date))
+
     def insert_data(self, df: pd.DataFrame, table_name: str, date_range: str) -> None:
         """
         Insert data into database table.
@@ -592,81 +763,261 @@ class StatcastGameLevelLoader:
             return
 
         try:
-            # Insert data (append mode)
-            self.db_helper.db_insert(df, table_name, self.engine)
-            logger.info(f"    Inserted {len(df)} rows into {table_name} for {date_range}")
+            # Bulk-load from a temporary CSV file; upserts go through a staging table
+            if self.upsert:
+                stats = self.db_helper.db_upsert(df, table_name, self.engine, key_columns=TABLE_KEYS[table_name])
+            else:
+                stats = self.db_helper.db_insert(df, table_name, self.engine, bulk=True)
+            logger.info(f"    {'Upserted' if self.upsert else 'Inserted'} {stats['rows']} rows into {table_name} "
+                        f"for {date_range} ({stats['method']}, {stats['rows_per_sec']:,.0f} rows/sec)")
 
         except Exception as e:
             logger.error(f"    Error inserting into {table_name}: {e}")
             raise
 
-    def pull_and_insert_year(self, year: int, batch_days: int = 7, rate_limit_delay: float = 0.5) -> Dict:
+    @staticmethod
+    def season_batches(year: int, batch_days: int = 7) -> List[Tuple[str, str]]:
+        """
+        Date ranges (YYYY-MM-DD, inclusive) covering a season in batches of batch_days.
+
+        Args:
+            year: Season
+            batch_days: Number of days per batch
+
+        Returns:
+            List of (start_date, end_date) tuples
+        """
+        start_date = datetime(year, 3, 1)  # MLB season typically starts late March
+        end_date = datetime(year, 11, 30)  # Season ends in November
+        return StatcastGameLevelLoader.date_batches(start_date, end_date, batch_days)
+
+    @staticmethod
+    def date_batches(start_date: datetime, end_date: datetime, batch_days: int = 7) -> List[Tuple[str, str]]:
+        """
+        Date ranges (YYYY-MM-DD, inclusive) covering start_date to end_date in batches of batch_days.
+
+        Args:
+            start_date: First date
+            end_date: Last date, inclusive
+            batch_days: Number of days per batch
+
+        Returns:
+            List of (start_date, end_date) tuples
+        """
+        batches = []
+        current_date = start_date
+        while current_date <= end_date:
+            batch_end = min(current_date + timedelta(days=batch_days - 1), end_date)
+            batches.append((current_date.strftime('%Y-%m-%d'), batch_end.strftime('%Y-%m-%d')))
+            current_date = batch_end + timedelta(days=1)
+        return batches
+
+    def loaded_game_counts(self, year: int) -> Dict:
+        """
+        Number of games already loaded on each date of a season.
+
+        Args:
+            year: Season
+
+        Returns:
+            Dictionary of game date -> games in statcast_pitcher_game (empty if the table is empty)
+        """
+        query = sqlalchemy.text("""
+            SELECT game_date, COUNT(DISTINCT game_pk) AS games
+            FROM statcast_pitcher_game
+            WHERE year_id = :year
+            GROUP BY game_date
+        """)
+        with self.engine.connect() as connection:
+            rows = connection.execute(query, {'year': year}).fetchall()
+        return {pd.Timestamp(game_date).date(): int(games) for game_date, games in rows}
+
+    def plan_season_batches(self, year: int, batch_days: int = 7) -> List[Tuple[str, str]]:
+        """
+        Date ranges to request for a season, following its game dates.
+
+        Batches hold consecutive game dates up to max_pitches_per_batch expected pitches and
+        batch_days days. With skip_loaded, dates whose scheduled games are all in
+        statcast_pitcher_game are left out, except the last SETTLE_DAYS days, whose games may have
+        been loaded while still in progress. Without a schedule the whole calendar is requested in
+        batch_days windows (season_batches).
+
+        Args:
+            year: Season
+            batch_days: Most days per batch
+
+        Returns:
+            List of (start_date, end_date) tuples
+        """
+        games_per_date = self.schedule.games_per_date(year)
+        if not games_per_date:
+            logger.warning(f"No schedule for {year}; requesting March 1 to November 30 in {batch_days}-day batches")
+            return self.season_batches(year, batch_days)
+
+        skip_dates = []
+        if self.skip_loaded:
+            settled = settled_through()
+            loaded = self.loaded_game_counts(year)
+            skip_dates = [day for day, games in games_per_date.items()
+                          if day <= settled and loaded.get(day, 0) >= games]
+
+        batches = plan_batches(games_per_date, max_pitches=self.max_pitches_per_batch,
+                               max_days=batch_days, skip_dates=skip_dates)
+        logger.info(f"{year}: {len(batches)} batches over {len(games_per_date) - len(skip_dates)} game dates "
+                    f"({len(skip_dates)} dates already loaded)")
+        return batches
+
+    def pull_and_insert_year(self, year: int, batch_days: int = 7, pipeline_depth: int = 2) -> Dict:
         """
         Pull and insert data for an entire year in batches.
 
+        Batches are planned from the season's game dates (see plan_season_batches) and go
+        through the fetch/aggregate/write pipeline of run_batches.
+
         Args:
             year: Year to pull
-            batch_days: Number of days per batch (default 7)
-            rate_limit_delay: Seconds to wait between API calls (default 0.5)
+            batch_days: Most days per batch (default 7)
+            pipeline_depth: Batches that may wait between two stages (default 2)
 
         Returns:
             Dictionary with timing and statistics
         """
-        year_start_time = time.time()
-
         logger.info(f"\n{'='*60}")
         logger.info(f"Processing year: {year}")
         logger.info(f"{'='*60}")
 
-        start_date = datetime(year, 3, 1)  # MLB season typically starts late March
-        end_date = datetime(year, 11, 30)  # Season ends in November
+        result = self.run_batches(self.plan_season_batches(year, batch_days), f"Year {year}", pipeline_depth)
+        result['year'] = year
+        return result
 
-        current_date = start_date
-        batches_processed = 0
-        batches_failed = 0
-        total_batter_rows = 0
-        total_pitcher_rows = 0
+    def run_batches(self, batches: List[Tuple[str, str]], label: str, pipeline_depth: int = 2) -> Dict:
+        """
+        Pull, aggregate and insert a list of date ranges.
 
-        while current_date <= end_date:
-            batch_end = min(current_date + timedelta(days=batch_days - 1), end_date)
+        The batches go through a three-stage pipeline connected by bounded queues: a fetch thread
+        downloads batch N+1 while an aggregate thread works on batch N and this thread writes
+        batch N-1. A stage blocks when the queue after it is full, so at most pipeline_depth
+        batches wait between two stages and memory stays bounded. Savant requests are paced by
+        the loader's shared rate limiter (see fetch_statcast).
+
+        Args:
+            batches: (start_date, end_date) tuples (YYYY-MM-DD, inclusive)
+            label: Name of the run in thread names and the summary (e.g. 'Year 2023')
+            pipeline_depth: Batches that may wait between two stages (default 2)
 
-            start_str = current_date.strftime('%Y-%m-%d')
-            end_str = batch_end.strftime('%Y-%m-%d')
+        Returns:
+            Dictionary with timing and statistics
+        """
+        run_start_time = time.time()
 
-            logger.info(f"\nProcessing batch: {start_str} to {end_str}")
+        fetched = queue.Queue(maxsize=pipeline_depth)
+        aggregated = queue.Queue(maxsize=pipeline_depth)
+        stop = threading.Event()
+        stage_seconds = {'fetch': 0.0, 'aggregate': 0.0, 'write': 0.0}
+        fetch_stats = {'limiter_wait': 0.0, 'backoff_wait': 0.0, 'retries': 0}
 
+        def put(q, item) -> bool:
+            """Blocking put (backpressure) that gives up once the pipeline is stopped."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q):
+            """Blocking get that returns None once the pipeline is stopped."""
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=1)
+                except queue.Empty:
+                    continue
+            return None
+
+        def fetch_stage():
             try:
-                # Pull and aggregate
-                batter_df, pitcher_df = self.pull_and_aggregate_date_range(start_str, end_str)
+                for start_str, end_str in batches:
+                    logger.info(f"\nFetching batch: {start_str} to {end_str}")
+                    stage_start = time.perf_counter()
+                    df = self.fetch_date_range(start_str, end_str)
+                    stage_seconds['fetch'] += time.perf_counter() - stage_start
+                    if not put(fetched, (start_str, end_str, df)):
+                        return
+            finally:
+                for key in fetch_stats:
+                    fetch_stats[key] = getattr(self._fetch_stats, key, fetch_stats[key])
+                put(fetched, None)
+
+        def aggregate_stage():
+            try:
+                while True:
+                    item = get(fetched)
+                    if item is None:
+                        return
+                    start_str, end_str, df = item
+                    stage_start = time.perf_counter()
+                    batter_df, pitcher_df = self.aggregate_pitches(df)
+                    del df, item
+                    stage_seconds['aggregate'] += time.perf_counter() - stage_start
+                    if not put(aggregated, (start_str, end_str, batter_df, pitcher_df)):
+                        return
+            finally:
+                put(aggregated, None)
+
+        workers = [threading.Thread(target=fetch_stage, name=f'statcast-fetch-{label}', daemon=True),
+                   threading.Thread(target=aggregate_stage, name=f'statcast-aggregate-{label}', daemon=True)]
+        for worker in workers:
+            worker.start()
+
+        batches_processed = 0
+        batches_failed = 0
+        total_batter_rows = 0
+        total_pitcher_rows = 0
 
-                # Insert batters
-                if batter_df is not None:
-                    self.insert_data(batter_df, 'statcast_batter_game', f"{start_str} to {end_str}")
-                    total_batter_rows += len(batter_df)
+        # Write stage
+        try:
+            while True:
+                item = aggregated.get()
+                if item is None:
+                    break
+                start_str, end_str, batter_df, pitcher_df = item
+                stage_start = time.perf_counter()
 
-                # Insert pitchers
-                if pitcher_df is not None:
-                    self.insert_data(pitcher_df, 'statcast_pitcher_game', f"{start_str} to {end_str}")
-                    total_pitcher_rows += len(pitcher_df)
+                try:
+                    # Insert batters
+                    if batter_df is not None:
+                        self.insert_data(batter_df, 'statcast_batter_game', f"{start_str} to {end_str}")
+                        total_batter_rows += len(batter_df)
 
-                batches_processed += 1
+                    # Insert pitchers
+                    if pitcher_df is not None:
+                        self.insert_data(pitcher_df, 'statcast_pitcher_game', f"{start_str} to {end_str}")
+                        total_pitcher_rows += len(pitcher_df)
 
-                # Rate limiting between API calls
-                time.sleep(rate_limit_delay)
+                    batches_processed += 1
 
-            except Exception as e:
-                logger.error(f"  Batch {start_str} to {end_str} failed: {e}")
-                batches_failed += 1
+                except Exception as e:
+                    logger.error(f"  Batch {start_str} to {end_str} failed: {e}")
+                    batches_failed += 1
 
-            current_date = batch_end + timedelta(days=1)
+                stage_seconds['write'] += time.perf_counter() - stage_start
+        finally:
+            # Unblock and wind down the other stages if this one stops early
+            stop.set()
+            for worker in workers:
+                worker.join()
 
-        year_end_time = time.time()
-        year_duration = year_end_time - year_start_time
+        run_duration = time.time() - run_start_time
 
-        # Log summary for this year
+        # Log summary for this run
         logger.info(f"\n{'='*60}")
-        logger.info(f"Year {year} Complete")
-        logger.info(f"  Duration: {year_duration:.2f} seconds ({year_duration/60:.2f} minutes)")
+        logger.info(f"{label} Complete")
+        logger.info(f"  Duration: {run_duration:.2f} seconds ({run_duration/60:.2f} minutes)")
+        logger.info(f"  Stage busy time: fetch {stage_seconds['fetch']:.1f}s, "
+                    f"aggregate {stage_seconds['aggregate']:.1f}s, write {stage_seconds['write']:.1f}s")
+        logger.info(f"  Rate limiter wait: {fetch_stats['limiter_wait']:.1f}s, "
+                    f"backoff: {fetch_stats['backoff_wait']:.1f}s over {fetch_stats['retries']} retries")
         logger.info(f"  Batches processed: {batches_processed}")
         logger.info(f"  Batches failed: {batches_failed}")
         logger.info(f"  Total batter rows inserted: {total_batter_rows:,}")
@@ -674,16 +1025,18 @@ class StatcastGameLevelLoader:
         logger.info(f"{'='*60}")
 
         return {
-            'year': year,
-            'duration_seconds': year_duration,
+            'duration_seconds': run_duration,
             'batches_processed': batches_processed,
             'batches_failed': batches_failed,
             'batter_rows': total_batter_rows,
-            'pitcher_rows': total_pitcher_rows
+            'pitcher_rows': total_pitcher_rows,
+            'stage_seconds': stage_seconds,
+            'limiter_wait': fetch_stats['limiter_wait'],
+            'retries': fetch_stats['retries']
         }
 
     def pull_and_insert_all_years(self, start_year: int, end_year: int, batch_days: int = 7,
-                                  max_workers: int = 5, rate_limit_delay: float = 0.5) -> None:
+                                  max_workers: int = 5, pipeline_depth: int = 2) -> None:
         """
         Pull and insert data for multiple years in parallel.
 
@@ -692,7 +1045,7 @@ class StatcastGameLevelLoader:
             end_year: Last year to pull (inclusive)
             batch_days: Days per batch
             max_workers: Number of parallel workers (default 5)
-            rate_limit_delay: Seconds to wait between API calls per worker (default 0.5)
+            pipeline_depth: Batches that may wait between two pipeline stages within a year (default 2)
         """
         total_start_time = time.time()
 
@@ -701,8 +1054,8 @@ class StatcastGameLevelLoader:
         logger.info("\n" + "="*60)
         logger.info(f"Starting parallel processing of {len(years)} years")
         logger.info(f"  Workers: {max_workers}")
-        logger.info(f"  Batch size: {batch_days} days")
-        logger.info(f"  Rate limit delay: {rate_limit_delay}s per worker")
+        logger.info(f"  Batch size: up to {batch_days} days, {self.max_pitches_per_batch:,} expected pitches")
+        logger.info(f"  Savant budget: {self.limiter.max_rate:g} requests/sec across all workers")
         logger.info("="*60)
 
         # Track results
@@ -712,7 +1065,7 @@ class StatcastGameLevelLoader:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all year processing tasks
             future_to_year = {
-                executor.submit(self.pull_and_insert_year, year, batch_days, rate_limit_delay): year
+                executor.submit(self.pull_and_insert_year, year, batch_days, pipeline_depth): year
                 for year in years
             }
 
@@ -771,10 +1124,90 @@ class StatcastGameLevelLoader:
 
             status = "✓" if 'error' not in result else "✗"
             logger.info(f"{status} {year}: {duration:.1f}s | Batches: {batches} | "
-                       f"Failed: {failures} | Batters: {batter_rows:,} | Pitchers: {pitcher_rows:,}")
+                       f"Failed: {failures} | Batters: {batter_rows:,} | Pitchers: {pitcher_rows:,} | "
+                       f"Limiter wait: {result.get('limiter_wait', 0):.1f}s")
+
+        # Engines are shared process-wide (Database.db_connect); checkout waits show pool contention
+        for stats in Database.pool_stats():
+            logger.info(f"Connection pool {stats['url']}: {stats['checkouts']} checkouts, "
+                        f"waited {stats['wait_seconds']:.2f}s (max {stats['max_wait_seconds']:.3f}s), "
+                        f"pool size {stats['pool_size']}")
 
         logger.info("="*60)
 
+    def last_loaded_date(self) -> Optional[datetime]:
+        """
+        Latest game date in both game-level tables.
+
+        The smaller of the two maxima is used, so a run that stopped between the batter and the
+        pitcher insert is picked up again.
+
+        Returns:
+            Latest loaded game date, or None if either table is empty
+        """
+        query = sqlalchemy.text("""
+            SELECT (SELECT MAX(game_date) FROM statcast_batter_game) AS batter_max,
+                   (SELECT MAX(game_date) FROM statcast_pitcher_game) AS pitcher_max
+        """)
+        with self.engine.connect() as connection:
+            batter_max, pitcher_max = connection.execute(query).fetchone()
+        if batter_max is None or pitcher_max is None:
+            return None
+        return pd.Timestamp(min(batter_max, pitcher_max)).to_pydatetime()
+
+    def pull_since_last_run(self, batch_days: int = 7, pipeline_depth: int = 2) -> Optional[Dict]:
+        """
+        Pull and insert the game dates since the latest one already loaded, through yesterday.
+
+        Meant for nightly runs during the season: the new dates are planned from the schedule
+        (off days and the offseason cost no requests) and go through the same pipeline as a
+        season load (run_batches). The run starts SETTLE_DAYS before the latest loaded date, since
+        the last run may have seen only part of those dates' games (late games, Savant still
+        processing); upserts replace the rows pulled again. With plain inserts (upsert=False) the
+        run starts the day after, as overlapping rows would fail.
+
+        Args:
+            batch_days: Most days per batch (default 7)
+            pipeline_depth: Batches that may wait between two stages (default 2)
+
+        Returns:
+            Dictionary with timing and statistics, or None if nothing has been loaded yet
+        """
+        last_date = self.last_loaded_date()
+        if last_date is None:
+            logger.error("No games loaded yet; run a season load (--start-year/--end-year) first")
+            return None
+
+        if self.upsert:
+            start_date = last_date - timedelta(days=SETTLE_DAYS)
+        else:
+            logger.warning(f"Plain inserts: not re-pulling the {SETTLE_DAYS} days before the last loaded date, "
+                           f"whose games may be incomplete")
+            start_date = last_date + timedelta(days=1)
+        end_date = datetime.combine(datetime.now().date() - timedelta(days=1), datetime.min.time())
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Incremental run: last loaded game date {last_date:%Y-%m-%d}")
+        logger.info(f"{'='*60}")
+        if start_date > end_date:
+            logger.info("Already up to date")
+            return None
+
+        games_per_date = {}
+        for year in range(start_date.year, end_date.year + 1):
+            schedule = self.schedule.games_per_date(year)
+            if not schedule:
+                logger.warning(f"No schedule for {year}; requesting every day from "
+                               f"{start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}")
+                batches = self.date_batches(start_date, end_date, batch_days)
+                break
+            games_per_date.update({day: games for day, games in schedule.items()
+                                   if start_date.date() <= day <= end_date.date()})
+        else:
+            batches = plan_batches(games_per_date, max_pitches=self.max_pitches_per_batch,
+                                   max_days=batch_days, until=end_date.date())
+
+        return self.run_batches(batches, f"{start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}", pipeline_depth)
+
 
 def main():
     """Main execution function."""
@@ -811,12 +1244,53 @@ def main():
     )
     parser.add_argument(
         '--batch-days', type=int, default=7,
-        help='Number of days per batch request (default: 7)'
+        help='Most days per batch request; batches also stop at off days and the pitch limit (default: 7)'
     )
     parser.add_argument(
         '--no-cache', action='store_true',
         help='Disable pybaseball caching (not recommended)'
     )
+    parser.add_argument(
+        '--pipeline-depth', type=int, default=2,
+        help='Batches that may wait between the fetch, aggregate and write stages of a year (default: 2)'
+    )
+    parser.add_argument(
+        '--store-dir', type=str, default=str(DATA_DIR / 'statcast_pitches'),
+        help=f'Local pitch-level store; only dates missing from it are downloaded (default: {DATA_DIR / "statcast_pitches"})'
+    )
+    parser.add_argument(
+        '--no-store', action='store_true',
+        help='Do not keep raw pitches locally; download every batch from Savant'
+    )
+    parser.add_argument(
+        '--agg-engine', choices=['pandas', 'polars'], default='pandas',
+        help='Engine for the game-level aggregations (default: pandas)'
+    )
+    parser.add_argument(
+        '--ingest', choices=['pybaseball', 'csv'], default='pybaseball',
+        help='Download through pybaseball (every column) or read the Savant CSV directly with only the '
+             'aggregation columns (default: pybaseball)'
+    )
+    parser.add_argument(
+        '--append-only', action='store_true',
+        help='Plain inserts instead of upserts (fails if a batch overlaps rows already loaded)'
+    )
+    parser.add_argument(
+        '--schedule-dir', type=str, default=str(DATA_DIR / 'statcast_schedule'),
+        help=f'Cached season schedules used to plan batches (default: {DATA_DIR / "statcast_schedule"})'
+    )
+    parser.add_argument(
+        '--max-pitches-per-batch', type=int, default=DEFAULT_MAX_PITCHES,
+        help=f'Most expected pitches per Savant request, under its row cap (default: {DEFAULT_MAX_PITCHES})'
+    )
+    parser.add_argument(
+        '--reload-loaded', action='store_true',
+        help='Also request dates whose games are already loaded'
+    )
+    parser.add_argument(
+        '--since-last-run', action='store_true',
+        help='Only pull the game dates after the latest one loaded, through yesterday (ignores --start-year/--end-year)'
+    )
     parser.add_argument(
         '--create-tables-only', action='store_true',
         help='Only create tables, do not pull data'
@@ -826,8 +1300,12 @@ def main():
         help='Number of parallel workers for year-level processing (default: 5)'
     )
     parser.add_argument(
-        '--rate-limit-delay', type=float, default=0.5,
-        help='Seconds to wait between API calls per worker (default: 0.5)'
+        '--requests-per-sec', type=float, default=2.0,
+        help='Savant request budget shared by all workers; one request per day of data (default: 2.0)'
+    )
+    parser.add_argument(
+        '--fetch-retries', type=int, default=4,
+        help='Retries of a failed Savant pull, with exponential backoff and jitter (default: 4)'
     )
 
     args = parser.parse_args()
@@ -841,11 +1319,18 @@ def main():
     logger.info("Statcast Game-Level Metrics Loader")
     logger.info("="*60)
     logger.info(f"Database: {args.db}@{args.host}:{args.port}")
-    logger.info(f"Years: {args.start_year} - {args.end_year}")
-    logger.info(f"Batch size: {args.batch_days} days")
+    logger.info(f"Dates: {'Since last run' if args.since_last_run else f'{args.start_year} - {args.end_year}'}")
+    logger.info(f"Batch size: up to {args.batch_days} days, {args.max_pitches_per_batch:,} expected pitches")
+    logger.info(f"Already loaded dates: {'Reloaded' if args.reload_loaded else 'Skipped'}")
     logger.info(f"Parallel workers: {args.parallel_workers}")
-    logger.info(f"Rate limit delay: {args.rate_limit_delay}s per worker")
+    logger.info(f"Savant budget: {args.requests_per_sec:g} requests/sec shared by all workers, "
+                f"{args.fetch_retries} retries")
+    logger.info(f"Pipeline depth: {args.pipeline_depth} batches per stage")
     logger.info(f"Caching: {'Disabled' if args.no_cache else 'Enabled'}")
+    logger.info(f"Pitch store: {'Disabled' if args.no_store else args.store_dir}")
+    logger.info(f"Insert mode: {'Append' if args.append_only else 'Upsert'}")
+    logger.info(f"Aggregation engine: {args.agg_engine}")
+    logger.info(f"Ingest: {args.ingest}")
     logger.info("="*60)
 
     # Initialize loader
@@ -855,23 +1340,34 @@ def main():
         host=args.host,
         db=args.db,
         port=args.port,
-        enable_cache=not args.no_cache
+        enable_cache=not args.no_cache,
+        store_dir=None if args.no_store else args.store_dir,
+        upsert=not args.append_only,
+        agg_engine=args.agg_engine,
+        requests_per_sec=args.requests_per_sec,
+        fetch_retries=args.fetch_retries,
+        schedule_dir=args.schedule_dir,
+        max_pitches_per_batch=args.max_pitches_per_batch,
+        skip_loaded=not args.reload_loaded,
+        ingest=args.ingest
     )
 
     # Create tables
     loader.create_tables()
 
     # Pull and insert data (unless create-tables-only flag is set)
-    if not args.create_tables_only:
+    if args.create_tables_only:
+        logger.info("\n--create-tables-only flag set, skipping data pull")
+    elif args.since_last_run:
+        loader.pull_since_last_run(batch_days=args.batch_days, pipeline_depth=args.pipeline_depth)
+    else:
         loader.pull_and_insert_all_years(
             start_year=args.start_year,
             end_year=args.end_year,
             batch_days=args.batch_days,
             max_workers=args.parallel_workers,
-            rate_limit_delay=args.rate_limit_delay
+            pipeline_depth=args.pipeline_depth
         )
-    else:
-        logger.info("\n--create-tables-only flag set, skipping data pull")
 
     logger.info("\n" + "="*60)
     logger.info("COMPLETE!")
@@ -0,0 +1,139 @@
+"""
+Token-bucket rate limiter with retry/backoff, shared by every thread of a loader.
+
+A fixed sleep per worker thread does not bound the combined request rate (five workers
+sleeping 0.5s each make ten requests a second), and a throttled request simply fails.
+Instead, all threads draw from one TokenBucket:
+- tokens refill at `rate` per second up to `capacity`; acquire() reserves tokens and sleeps
+  until the reservation is covered, so waiting threads are served in arrival order
+- throttled() halves the rate (down to min_rate) when a request fails, and succeeded()
+  gives it back a step at a time, up to the configured rate
+- call_with_retry() wraps a request: it acquires tokens, retries failures and empty responses
+  with exponential backoff and jitter, and reports the time spent waiting
+
+Usage:
+    limiter = TokenBucket(rate=2.0)
+    result, stats = call_with_retry(lambda: fetch(...), limiter, tokens=7)
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket with an adaptive refill rate."""
+
+    def __init__(self, rate, capacity=None, min_rate=None):
+        """
+        Args:
+            rate: Tokens (requests) per second
+            capacity: Burst size (default: one second's worth of tokens, at least 1)
+            min_rate: Lowest rate throttled() may fall to (default: rate / 16)
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = float(min_rate) if min_rate else self.max_rate / 16
+        self.capacity = float(capacity) if capacity else max(1.0, self.max_rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1.0):
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        A request larger than the bucket is allowed; it leaves the bucket in debt and later
+        callers wait for it to be repaid.
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            wait = max(0.0, -self.tokens / self.rate)
+            self.wait_seconds += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def throttled(self):
+        """The server pushed back: halve the rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def succeeded(self):
+        """A request went through: recover a tenth of the configured rate."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=60.0):
+    """Exponential backoff with jitter: about base_delay * 2**attempt, randomized by +/-50%."""
+    return min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def call_with_retry(request, limiter, tokens=1.0, retries=4, empty_retries=1, base_delay=1.0,
+                    max_delay=60.0, is_empty=None, on_retry=None):
+    """
+    Run a request under the limiter, retrying failures and (optionally) empty responses.
+
+    Args:
+        request: Function taking no arguments that performs the request
+        limiter: Shared TokenBucket
+        tokens: Tokens the request costs (e.g. one per day of data requested)
+        retries: Retries of failed requests
+        empty_retries: Retries of empty responses, which may be throttling but are also what a date
+            range without games returns
+        base_delay: First backoff delay in seconds
+        max_delay: Longest backoff delay in seconds
+        is_empty: Function telling whether a response is empty (default: None or .empty)
+        on_retry: Optional callback(attempt, reason, delay) called before each retry
+
+    Returns:
+        Tuple of (response, stats) where stats has attempts, limiter_wait and backoff_wait seconds.
+        The empty response is returned once empty_retries is used up; the error is raised once
+        retries is used up.
+    """
+    if is_empty is None:
+        def is_empty(response):
+            return response is None or getattr(response, 'empty', False)
+
+    stats = {'attempts': 0, 'limiter_wait': 0.0, 'backoff_wait': 0.0}
+    errors = empties = 0
+    while True:
+        stats['attempts'] += 1
+        stats['limiter_wait'] += limiter.acquire(tokens)
+        try:
+            response = request()
+        except Exception as e:
+            errors += 1
+            if errors > retries:
+                raise
+            reason = f'error: {e}'
+            limiter.throttled()
+        else:
+            if not is_empty(response):
+                limiter.succeeded()
+                return response, stats
+            empties += 1
+            if empties > empty_retries:
+                return response, stats
+            reason = 'empty response'
+
+        delay = backoff_delay(stats['attempts'] - 1, base_delay, max_delay)
+        if on_retry is not None:
+            on_retry(stats['attempts'], reason, delay)
+        stats['backoff_wait'] += delay
+        time.sleep(delay)
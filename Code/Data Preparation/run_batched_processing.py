@@ -8,6 +8,18 @@ parallel processing to avoid memory issues when processing the full dataset (11.
 Key optimizations:
 - Filters the games table JOIN to only the current year (75x reduction)
 - Parallel processing: Run multiple years simultaneously (10x speedup on 16-core CPU)
+- Pooled stage executor (default for the SQL engine): runs the stages of
+  Data_Processing_DV.sql on a pooled SQLAlchemy engine as a DAG across years, so e.g.
+  stolen_bases for one year overlaps at_bat_level for the next, with per-stage timings
+  (--executor cli keeps the one-mariadb-subprocess-per-year behaviour)
+- Partition-exchange loading (--load-mode exchange): each year is built into an
+  unpartitioned staging table and swapped in with ALTER TABLE ... EXCHANGE PARTITION,
+  so parallel workers do not contend on the live tables and reruns are a swap
+- Optional polars engine (--engine polars): builds the same tables in memory with one sort
+  and grouped cumulative sums instead of the MariaDB window functions
+- Incremental refresh (--incremental): appends only the games played since the season
+  watermark, continuing season_* totals from each batter's stored state (seconds per day
+  in season instead of a full DELETE + rebuild of the year)
 
 Performance:
 - Sequential: ~2 minutes/year × 74 years = 2.5 hours
@@ -20,12 +32,24 @@ Options:
     --user, -u          MySQL/MariaDB username (required)
     --password, -p      MySQL/MariaDB password (required)
     --host              MySQL/MariaDB host (default: localhost)
+    --port              MySQL/MariaDB port (default: 3306)
     --db                Database name (default: retrosheet)
-    --start-year        First year to process (default: 1952)
-    --end-year          Last year to process (default: 2025)
+    --start-year        First year to process (default: 1952, or the current season with --incremental)
+    --end-year          Last year to process (default: 2025, or the current season with --incremental)
     --resume            Resume from a specific year
     --test              Test mode: only process 2 years (2023-2024)
     --sudo              Run mariadb with sudo (for socket authentication)
+    --engine            sql (mariadb + Data_Processing_DV.sql) or polars (default: sql)
+    --executor          sql engine: pooled (stage DAG over SQLAlchemy) or cli (mariadb
+                        subprocess per year) (default: pooled)
+    --load-mode         delete (DELETE + INSERT into the live table) or exchange (staging table
+                        + EXCHANGE PARTITION; pooled executor or polars engine) (default: delete)
+    --events-dir        polars engine: read events/games from parse_retrosheet_events.py output
+                        instead of retrosheet.events / retrosheet.games
+    --verify            polars engine: compare against the at_bat_level rows already built
+                        by the SQL engine instead of writing
+    --incremental       Append games newer than the stored watermark instead of rebuilding
+                        each year (uses the polars engine, no confirmation prompt)
 """
 
 import subprocess
@@ -90,6 +114,158 @@ def run_year_batch(year, mysql_user, mysql_password, mysql_host, mysql_db, sql_s
         return False, "", str(e)
 
 
+def run_years_pooled(years, mysql_user, mysql_password, mysql_host, mysql_port, mysql_db, sql_script_path,
+                     max_workers, log_file_handle, load_mode='delete'):
+    """
+    Execute the SQL script for all years with the pooled stage executor.
+
+    Stages of different years overlap; the first year drops and recreates the tables and the same
+    stage of every later year waits for it.
+
+    Args:
+        load_mode: 'delete' or 'exchange' (build into a staging table, swap in with EXCHANGE PARTITION)
+
+    Returns:
+        (successful_years: list, failed_years: list)
+    """
+    sys.path.append(str(Path(__file__).parent.parent / 'Production'))
+    from create_model_ready import Database
+    from sql_stage_executor import StageExecutor, format_timings, summarize_years
+
+    db_helper = Database(mysql_user, mysql_password, mysql_host, mysql_db, mysql_port)
+    engine = db_helper.db_connect(pool_size=max_workers, max_overflow=0, pool_pre_ping=True, pool_recycle=3600)
+    executor = StageExecutor(engine, sql_script_path, max_workers=max_workers, load_mode=load_mode)
+
+    def log_stage(result):
+        # Invalidate cached db_pull results of the tables the stage wrote, whether or not it succeeded
+        db_helper.bump_table_versions(engine, result['tables'])
+
+        log_file_handle.write(f"\n{'='*80}\n")
+        log_file_handle.write(f"YEAR: {result['year']} | STAGE: {result['stage']}\n")
+        log_file_handle.write(f"Status: {'SUCCESS' if result['success'] else 'FAILED'}\n")
+        log_file_handle.write(f"Duration: {result['duration']:.1f} seconds\n")
+        log_file_handle.write(f"Started: {result['started'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+        log_file_handle.write(f"Ended: {result['ended'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+        log_file_handle.write(f"Rows inserted: {result['rows']}\n")
+        log_file_handle.write(f"\n--- OUTPUT ---\n" + '\n'.join(result['output']) + "\n")
+        if result['error']:
+            log_file_handle.write(f"\n--- ERROR ---\n{result['error']}\n")
+        log_file_handle.write(f"{'='*80}\n")
+        log_file_handle.flush()
+
+        if not result['success']:
+            print(f"✗ Year {result['year']} {result['stage']} FAILED: {result['error'][:200]}")
+        elif result['stage'] == list(executor.stages)[-1]:
+            print(f"✓ Year {result['year']} completed successfully")
+
+    try:
+        results = executor.run(years, drop_first=True, on_stage_done=log_stage)
+    finally:
+        engine.dispose()
+
+    timings = format_timings(results)
+    print("\n" + "="*60)
+    print("STAGE TIMINGS")
+    print("="*60)
+    print(timings)
+    log_file_handle.write(f"\nSTAGE TIMINGS\n{timings}\n")
+
+    return summarize_years(results)
+
+
+def run_year_polars(year, mysql_user, mysql_password, mysql_host, mysql_port, mysql_db, sql_script_path,
+                    is_first_year=False, events_dir=None, verify=False, load_mode='delete'):
+    """
+    Build one year with the polars engine instead of the SQL script.
+
+    Args:
+        is_first_year: If True, will drop and recreate tables. Otherwise preserves existing tables.
+        events_dir: Read events/games from parse_retrosheet_events.py output instead of MariaDB
+        verify: Compare against the rows the SQL engine stored for this year instead of writing
+        load_mode: 'delete' or 'exchange' (write into a staging table, swap in with EXCHANGE PARTITION)
+
+    Returns:
+        (success: bool, output: str, error: str)
+    """
+    import at_bat_level_polars as engine_polars
+
+    print(f"\n{'='*60}")
+    print(f"Processing Year: {year} (polars engine{', verify only' if verify else ''})")
+    if is_first_year and not verify:
+        print("FIRST YEAR: Will drop and recreate tables")
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*60}")
+
+    try:
+        db_helper = engine_polars.Database(mysql_user, mysql_password, mysql_host, mysql_db, mysql_port)
+        engine = db_helper.db_connect(connect_args={'local_infile': True})  # bulk loads use LOAD DATA LOCAL INFILE
+
+        if events_dir:
+            events, games = engine_polars.load_season_from_files(events_dir, year)
+        else:
+            events, games = engine_polars.load_season_from_database(db_helper, year)
+
+        if verify:
+            at_bat_level = engine_polars.build_at_bat_level(events, games)
+            summary = engine_polars.verify_against_sql(db_helper, year, at_bat_level)
+            success = (summary['missing_rows'] == 0 and summary['extra_rows'] == 0
+                       and not summary['column_mismatches'])
+            output = f"Verification for {year}: {summary}"
+        else:
+            at_bat_level, game_matchup_level, stolen_bases = engine_polars.build_season(events, games)
+            engine_polars.create_tables_from_script(engine, sql_script_path, drop_tables=is_first_year)
+            rows = engine_polars.write_season(db_helper, engine, year, at_bat_level, game_matchup_level,
+                                              stolen_bases, load_mode=load_mode)
+            success = True
+            output = f"Rows inserted for {year}: {rows}"
+
+        print(output)
+        if success:
+            print(f"✓ Year {year} completed successfully")
+        else:
+            print(f"✗ Year {year} does not match the SQL output")
+        return success, output, "" if success else output
+
+    except Exception as e:
+        print(f"✗ Year {year} EXCEPTION: {str(e)}")
+        return False, "", str(e)
+
+
+def run_year_incremental(year, mysql_user, mysql_password, mysql_host, mysql_port, mysql_db, events_dir=None):
+    """
+    Append the games played since the year's watermark with the polars engine.
+
+    Args:
+        events_dir: Read events/games from parse_retrosheet_events.py output instead of MariaDB
+
+    Returns:
+        (success: bool, output: str, error: str)
+    """
+    import at_bat_level_polars as engine_polars
+
+    print(f"\n{'='*60}")
+    print(f"Refreshing Year: {year} (incremental)")
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*60}")
+
+    try:
+        db_helper = engine_polars.Database(mysql_user, mysql_password, mysql_host, mysql_db, mysql_port)
+        engine = db_helper.db_connect(connect_args={'local_infile': True})  # bulk loads use LOAD DATA LOCAL INFILE
+        summary = engine_polars.refresh_season_incremental(db_helper, engine, year, events_dir=events_dir)
+
+        if summary['new_games']:
+            output = f"Appended {summary['new_games']} games for {year} (watermark was {summary['watermark']}): {summary}"
+        else:
+            output = f"No new games for {year} since {summary['watermark']}"
+        print(output)
+        print(f"✓ Year {year} completed successfully")
+        return True, output, ""
+
+    except Exception as e:
+        print(f"✗ Year {year} EXCEPTION: {str(e)}")
+        return False, "", str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Process Retrosheet baseball data in yearly batches',
@@ -107,21 +283,60 @@ Examples:
 
   # Resume from year 2000 with parallelization
   python run_batched_processing.py -u sean -p mypassword --resume 2000 --parallel 10
+
+  # Load every year through a staging table and EXCHANGE PARTITION
+  python run_batched_processing.py -u sean -p mypassword --parallel 10 --load-mode exchange
+
+  # Fall back to one mariadb subprocess per year
+  python run_batched_processing.py -u sean -p mypassword --executor cli --parallel 4
+
+  # Build every season with the polars engine from parsed event files
+  python run_batched_processing.py -u sean -p mypassword --engine polars --events-dir ~/retrosheet/columnar --parallel 4
+
+  # Check the polars engine against the SQL-built at_bat_level for 2023-2025
+  python run_batched_processing.py -u sean -p mypassword --test --engine polars --verify
+
+  # Daily in-season refresh: append only the games since the last run
+  python run_batched_processing.py -u sean -p mypassword --incremental
         """
     )
 
     parser.add_argument('-u', '--user', required=True, help='MySQL/MariaDB username')
     parser.add_argument('-p', '--password', required=True, help='MySQL/MariaDB password')
     parser.add_argument('--host', default='localhost', help='MySQL/MariaDB host (default: localhost)')
+    parser.add_argument('--port', type=int, default=3306, help='MySQL/MariaDB port (default: 3306)')
     parser.add_argument('--db', default='retrosheet', help='Database name (default: retrosheet)')
-    parser.add_argument('--start-year', type=int, default=1952, help='First year to process (default: 1952)')
-    parser.add_argument('--end-year', type=int, default=2025, help='Last year to process (default: 2025)')
+    parser.add_argument('--start-year', type=int, help='First year to process (default: 1952, or the current season with --incremental)')
+    parser.add_argument('--end-year', type=int, help='Last year to process (default: 2025, or the current season with --incremental)')
     parser.add_argument('--resume', type=int, help='Resume processing from this year')
     parser.add_argument('--test', action='store_true', help='Test mode: process years 2023-2025 (2023 sequential, then 2024-2025 parallel)')
     parser.add_argument('--parallel', type=int, default=1, help='Number of years to process in parallel (default: 1, recommended: 8-12 for 16-core CPU)')
+    parser.add_argument('--engine', choices=['sql', 'polars'], default='sql', help='Processing engine (default: sql)')
+    parser.add_argument('--executor', choices=['pooled', 'cli'], default='pooled', help='sql engine: pooled stage executor or one mariadb subprocess per year (default: pooled)')
+    parser.add_argument('--load-mode', choices=['delete', 'exchange'], default='delete', help='DELETE + INSERT, or staging table + EXCHANGE PARTITION (default: delete)')
+    parser.add_argument('--events-dir', help='polars engine: read parse_retrosheet_events.py output instead of retrosheet.events')
+    parser.add_argument('--verify', action='store_true', help='polars engine: compare against the SQL-built at_bat_level instead of writing')
+    parser.add_argument('--incremental', action='store_true', help='Append games newer than the stored watermark instead of rebuilding each year')
 
     args = parser.parse_args()
 
+    if args.incremental:
+        if args.verify:
+            parser.error('--incremental cannot be combined with --verify')
+        args.engine = 'polars'
+    if (args.events_dir or args.verify) and args.engine != 'polars':
+        parser.error('--events-dir and --verify require --engine polars')
+
+    use_pooled = args.engine == 'sql' and args.executor == 'pooled'
+    if args.load_mode == 'exchange' and (args.incremental or (args.engine == 'sql' and not use_pooled)):
+        parser.error('--load-mode exchange requires the pooled executor or the polars engine, without --incremental')
+
+    default_start, default_end = (datetime.now().year,) * 2 if args.incremental else (1952, 2025)
+    if args.start_year is None:
+        args.start_year = default_start
+    if args.end_year is None:
+        args.end_year = default_end
+
     # Determine year range
     if args.test:
         start_year = 2023
@@ -155,12 +370,20 @@ Examples:
     print(f"Year range: {start_year} to {end_year}")
     print(f"Total years: {end_year - start_year + 1}")
     print(f"Parallel workers: {args.parallel}")
+    print(f"Engine: {args.engine}{' (verify only)' if args.verify else ''}{' (incremental)' if args.incremental else ''}")
+    if args.engine == 'sql':
+        print(f"Executor: {args.executor}")
+    print(f"Load mode: {args.load_mode}")
+    if args.events_dir:
+        print(f"Events directory: {args.events_dir}")
     print(f"SQL script: {sql_script}")
     print(f"Log file: {log_file}")
     print(f"Optimization: Filtered games table JOIN")
     print("="*60)
 
-    input("\nPress ENTER to start processing (or Ctrl+C to cancel)...")
+    # Incremental refreshes are meant to run unattended (e.g. from cron)
+    if not args.incremental:
+        input("\nPress ENTER to start processing (or Ctrl+C to cancel)...")
 
     # Track results
     total_years = end_year - start_year + 1
@@ -170,19 +393,54 @@ Examples:
 
     overall_start = datetime.now()
 
+    def record_script_load():
+        """Invalidate cached db_pull results of the tables the script writes (mariadb subprocess runs)."""
+        sys.path.append(str(Path(__file__).parent.parent / 'Production'))
+        from create_model_ready import Database
+        from sql_stage_executor import script_tables
+
+        db_helper = Database(args.user, args.password, args.host, args.db, args.port)
+        db_helper.bump_table_versions(db_helper.db_connect(), script_tables(sql_script))
+
     def process_and_log_year(year, is_first_year, log_file_handle):
         """Process a single year and log results (thread-safe)"""
         year_start = datetime.now()
 
-        success, stdout, stderr = run_year_batch(
-            year,
-            args.user,
-            args.password,
-            args.host,
-            args.db,
-            str(sql_script),
-            is_first_year=is_first_year
-        )
+        if args.incremental:
+            success, stdout, stderr = run_year_incremental(
+                year,
+                args.user,
+                args.password,
+                args.host,
+                args.port,
+                args.db,
+                events_dir=args.events_dir
+            )
+        elif args.engine == 'polars':
+            success, stdout, stderr = run_year_polars(
+                year,
+                args.user,
+                args.password,
+                args.host,
+                args.port,
+                args.db,
+                str(sql_script),
+                is_first_year=is_first_year,
+                events_dir=args.events_dir,
+                verify=args.verify,
+                load_mode=args.load_mode
+            )
+        else:
+            success, stdout, stderr = run_year_batch(
+                year,
+                args.user,
+                args.password,
+                args.host,
+                args.db,
+                str(sql_script),
+                is_first_year=is_first_year
+            )
+            record_script_load()
 
         year_end = datetime.now()
         duration = (year_end - year_start).total_seconds()
@@ -209,27 +467,47 @@ Examples:
         log.write(f"Parallel workers: {args.parallel}\n")
         log.write("="*80 + "\n\n")
 
-        # Process first year solo to create tables
-        print("\n" + "="*60)
-        print("STEP 1: Processing first year (creates tables)")
-        print("="*60)
+        # Pooled executor: all years and stages as one DAG (it orders the first year's table creation itself)
+        if use_pooled:
+            print("\n" + "="*60)
+            print(f"Processing {total_years} years as a stage DAG with {args.parallel} pooled connections")
+            print("="*60)
+            successful_years, failed_years = run_years_pooled(
+                list(range(start_year, end_year + 1)),
+                args.user,
+                args.password,
+                args.host,
+                args.port,
+                args.db,
+                str(sql_script),
+                args.parallel,
+                log,
+                load_mode=args.load_mode
+            )
+
+        # Process first year solo to create tables (an incremental refresh appends to existing tables)
+        if not args.incremental and not use_pooled:
+            print("\n" + "="*60)
+            print("STEP 1: Processing first year (creates tables)")
+            print("="*60)
 
-        year, success, stderr = process_and_log_year(start_year, is_first_year=True, log_file_handle=log)
+            year, success, stderr = process_and_log_year(start_year, is_first_year=True, log_file_handle=log)
 
-        if success:
-            successful_years.append(year)
-            print(f"✓ Year {year} completed successfully")
-        else:
-            failed_years.append(year)
-            print(f"✗ Year {year} FAILED")
-            print(f"\nERROR OUTPUT:\n{stderr}\n")
-            response = input(f"\nFirst year failed. Continue anyway? (y/n): ")
-            if response.lower() != 'y':
-                print("\nProcessing stopped by user.")
-                sys.exit(1)
+            if success:
+                successful_years.append(year)
+                print(f"✓ Year {year} completed successfully")
+            else:
+                failed_years.append(year)
+                print(f"✗ Year {year} FAILED")
+                print(f"\nERROR OUTPUT:\n{stderr}\n")
+                response = input(f"\nFirst year failed. Continue anyway? (y/n): ")
+                if response.lower() != 'y':
+                    print("\nProcessing stopped by user.")
+                    sys.exit(1)
 
         # Process remaining years in parallel
-        remaining_years = list(range(start_year + 1, end_year + 1))
+        first_parallel_year = start_year if args.incremental else start_year + 1
+        remaining_years = [] if use_pooled else list(range(first_parallel_year, end_year + 1))
 
         if remaining_years:
             print("\n" + "="*60)
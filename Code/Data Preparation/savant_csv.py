@@ -0,0 +1,151 @@
+"""
+Direct, column-pruned ingestion of Baseball Savant's Statcast search CSV.
+
+pybaseball.statcast() returns every column of the search (about 90) as object and float64, while
+the game-level aggregations read 17 of them. Here the CSV is read straight from Savant with
+only those columns and compact types:
+- IDs as int32, counts as nullable Int16
+- speeds, spin and angles as float32 (Savant reports them to one decimal, so the aggregation
+  thresholds compare the same)
+- team codes, pitch result type and player names as categoricals
+- game_date parsed as a date
+
+compact_pitches() gives data from pybaseball or the pitch store the same columns and types.
+
+Usage:
+    pitches = fetch_savant_csv('2023-04-01', '2023-04-07')
+    pitches = read_savant_csv('savant_2023-04-01.csv')
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pandas as pd
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+SAVANT_CSV_URL = 'https://baseballsavant.mlb.com/statcast_search/csv'
+
+# Search parameters of pybaseball's statcast() request: every pitch of regular season and postseason
+# games (no spring training), one row per pitch
+SAVANT_CSV_PARAMS = {
+    'all': 'true',
+    'hfGT': 'R|PO|',
+    'player_type': 'pitcher',
+    'min_pitches': 0,
+    'min_results': 0,
+    'min_pas': 0,
+    'group_by': 'name',
+    'sort_col': 'pitches',
+    'player_event_sort': 'api_p_release_speed',
+    'sort_order': 'desc',
+    'type': 'details',
+}
+
+# Columns the game-level aggregations read (statcast_game_polars.PITCH_COLUMNS), with compact types
+PITCH_SCHEMA = {
+    'game_pk': 'int32',
+    'game_date': 'datetime64[ns]',
+    'batter': 'int32',
+    'pitcher': 'int32',
+    'player_name': 'category',
+    'home_team': 'category',
+    'away_team': 'category',
+    'type': 'category',
+    'pitch_number': 'Int16',
+    'at_bat_number': 'Int16',
+    'release_speed': 'float32',
+    'release_spin_rate': 'float32',
+    'launch_speed': 'float32',
+    'launch_angle': 'float32',
+    'estimated_ba_using_speedangle': 'float32',
+    'estimated_woba_using_speedangle': 'float32',
+    'estimated_slg_using_speedangle': 'float32',
+}
+
+
+def read_savant_csv(source, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a Statcast search CSV, keeping only the given columns with their compact types.
+
+    Args:
+        source: Path or file-like object of the CSV
+        columns: Columns to read (default: PITCH_SCHEMA); columns missing from the CSV are skipped
+
+    Returns:
+        Pitch-level DataFrame
+    """
+    columns = columns or list(PITCH_SCHEMA)
+    wanted = set(columns)
+    dtypes = {column: dtype for column, dtype in PITCH_SCHEMA.items()
+              if column in wanted and column != 'game_date'}
+    df = pd.read_csv(source, usecols=lambda column: column in wanted, dtype=dtypes,
+                     parse_dates=['game_date'] if 'game_date' in wanted else False, na_values=[''])
+    return df[[column for column in columns if column in df.columns]]
+
+
+def compact_pitches(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Prune pitch-level data (pybaseball, pitch store) to the given columns and compact types.
+
+    Args:
+        df: Pitch-level DataFrame
+        columns: Columns to keep (default: PITCH_SCHEMA)
+
+    Returns:
+        New DataFrame with the columns that are present
+    """
+    columns = [column for column in (columns or list(PITCH_SCHEMA)) if column in df.columns]
+    df = df[columns].copy()
+    for column in columns:
+        dtype = PITCH_SCHEMA.get(column)
+        if dtype is None or df[column].dtype == dtype:
+            continue
+        if column == 'game_date':
+            df[column] = pd.to_datetime(df[column])
+        elif dtype == 'category':
+            df[column] = df[column].astype('category')
+        else:
+            # Through float64 first so nullable integers and strings of numbers convert alike
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(dtype)
+    return df
+
+
+def fetch_savant_csv(start_dt: str, end_dt: str, columns: Optional[List[str]] = None,
+                     timeout: float = 120.0) -> pd.DataFrame:
+    """
+    Download the pitches of a date range from Savant's search CSV, reading only the given columns.
+
+    The response is streamed into the CSV reader, so the full-width text is never held in memory.
+    Savant cuts results off at its per-query row cap without an error; keep ranges small enough
+    (see statcast_schedule.plan_batches) or split them when a result reaches the cap.
+
+    Args:
+        start_dt: Start date (YYYY-MM-DD)
+        end_dt: End date (YYYY-MM-DD), inclusive
+        columns: Columns to read (default: PITCH_SCHEMA)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Pitch-level DataFrame (empty if there were no games)
+    """
+    params = dict(SAVANT_CSV_PARAMS, game_date_gt=start_dt, game_date_lt=end_dt)
+    with requests.get(SAVANT_CSV_URL, params=params, timeout=timeout, stream=True) as res:
+        res.raise_for_status()
+        res.raw.decode_content = True
+        try:
+            return read_savant_csv(res.raw, columns)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame(columns=columns or list(PITCH_SCHEMA))
+
+
+def split_range(start_dt: str, end_dt: str) -> tuple:
+    """Split a date range (YYYY-MM-DD, inclusive) into two halves; the first is the longer one."""
+    start = datetime.strptime(start_dt, '%Y-%m-%d')
+    end = datetime.strptime(end_dt, '%Y-%m-%d')
+    middle = start + timedelta(days=(end - start).days // 2)
+    return ((start_dt, middle.strftime('%Y-%m-%d')),
+            ((middle + timedelta(days=1)).strftime('%Y-%m-%d'), end_dt))
@@ -0,0 +1,396 @@
+"""
+Pooled, stage-aware executor for Data_Processing_DV.sql.
+
+run_year_batch() starts one `mariadb -e "SET @process_year ...; SOURCE ..."` subprocess per
+year: every year opens a new connection and re-parses the whole script, output is only seen
+once the process exits, and the tables of one year are built strictly one after another.
+
+This executor splits the script once at its "-- @stage: <name> [after <stage> ...]" markers
+and runs every (year, stage) pair as a node of a DAG on a pooled SQLAlchemy engine:
+- each stage runs on its own pooled session; the statements before the first marker
+  (the points constants) run at the start of every session, then @process_year and
+  @drop_tables are set with bound parameters
+- a stage waits for the stages named in its "after" list for the same year, so
+  stolen_bases for one year can run while at_bat_level for the next year is running
+- with drop_first, every stage of the later years also waits for the same stage of the
+  first year, which drops and recreates the table
+- result sets (the progress SELECTs) are printed as each statement finishes
+- per-stage start/end times, durations and inserted row counts are recorded
+
+With load_mode='exchange', a stage's DELETE + INSERT into a partitioned table is replaced by
+an INSERT into an unpartitioned staging copy, swapped in at the end of the stage with
+ALTER TABLE ... EXCHANGE PARTITION p<year>. Workers no longer contend for row locks on the
+live table and no undo log is built for the DELETE; a rerun replaces the year in one swap.
+Tables that are not partitioned (or years without their own partition) fall back to DELETE + INSERT.
+
+Usage:
+    from sql_stage_executor import StageExecutor, format_timings
+
+    executor = StageExecutor(engine, 'Data_Processing_DV.sql', max_workers=8)
+    results = executor.run(range(2023, 2026))
+    print(format_timings(results))
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from pathlib import Path
+
+import sqlalchemy
+
+STAGE_MARKER = re.compile(r'^--\s*@stage:\s*(\w+)(?:\s+after\s+([\w\s,]+?))?\s*$')
+DELETE_TARGET = re.compile(r'^DELETE\s+FROM\s+([\w.]+)', re.IGNORECASE)
+INSERT_TARGET = re.compile(r'^INSERT\s+INTO\s+([\w.]+)', re.IGNORECASE)
+
+# Serializes partition checks and REORGANIZE PARTITION between workers of this process
+_partition_lock = threading.Lock()
+
+
+def split_statements(sql):
+    """
+    Split a SQL script into statements on semicolons outside quotes and comments.
+
+    Comments (--, # and /* */) are dropped, since statements are sent to the server one at a time.
+
+    Returns:
+        List of statement strings without the trailing semicolon
+    """
+    statements = []
+    current = []
+    i = 0
+    length = len(sql)
+    while i < length:
+        char = sql[i]
+        if char in ("'", '"', '`'):
+            end = i + 1
+            while end < length and sql[end] != char:
+                end += 2 if sql[end] == '\\' else 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+        elif sql.startswith('--', i) and (i + 2 >= length or sql[i + 2].isspace()) or char == '#':
+            newline = sql.find('\n', i)
+            i = length if newline == -1 else newline
+        elif sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+        elif char == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            i += 1
+        else:
+            current.append(char)
+            i += 1
+
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def parse_script(sql_script_path):
+    """
+    Split Data_Processing_DV.sql into its setup statements and named stages.
+
+    Returns:
+        (setup, stages): setup is the list of statements before the first marker; stages maps
+        each stage name, in script order, to {'after': [stage names], 'statements': [...]}
+    """
+    chunks = [('', None, [])]
+    for line in Path(sql_script_path).read_text().splitlines(keepends=True):
+        marker = STAGE_MARKER.match(line.strip())
+        if marker:
+            after = re.split(r'[\s,]+', marker.group(2).strip()) if marker.group(2) else []
+            chunks.append((marker.group(1), after, []))
+        else:
+            chunks[-1][2].append(line)
+
+    setup = split_statements(''.join(chunks[0][2]))
+    stages = {}
+    for name, after, lines in chunks[1:]:
+        if name in stages:
+            raise ValueError(f'Stage {name} is defined twice in {sql_script_path}')
+        unknown = [stage for stage in after if stage not in stages]
+        if unknown:
+            raise ValueError(f'Stage {name} runs after undefined stage(s): {", ".join(unknown)}')
+        stages[name] = {'after': after, 'statements': split_statements(''.join(lines))}
+    if not stages:
+        raise ValueError(f'No "-- @stage:" markers found in {sql_script_path}')
+    return setup, stages
+
+
+def script_tables(sql_script_path):
+    """Tables the stages of a script delete from or insert into, in script order."""
+    _, stages = parse_script(sql_script_path)
+    tables = []
+    for stage in stages.values():
+        for statement in stage['statements']:
+            target = DELETE_TARGET.match(statement) or INSERT_TARGET.match(statement)
+            if target and target.group(1) not in tables:
+                tables.append(target.group(1))
+    return tables
+
+
+def year_partition_ready(conn, table, year):
+    """
+    Check that a table has a partition p<year> ending at year + 1, adding it if needed.
+
+    A missing partition is split off p_future when the year is past every existing bound.
+
+    Args:
+        conn: SQLAlchemy connection
+        table: Table name, optionally schema-qualified
+        year: Year to load
+
+    Returns:
+        True when the year can be loaded by exchanging partition p<year>
+    """
+    schema, name = table.split('.', 1) if '.' in table else (None, table)
+    with _partition_lock:
+        partitions = dict(conn.execute(sqlalchemy.text(
+            'SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS '
+            'WHERE TABLE_SCHEMA = COALESCE(:schema, DATABASE()) AND TABLE_NAME = :name '
+            'AND PARTITION_NAME IS NOT NULL'),
+            {'schema': schema, 'name': name}).all())
+        if not partitions:
+            return False
+
+        partition = f'p{year}'
+        if partition in partitions:
+            return partitions[partition] == str(year + 1)
+
+        bounds = [int(bound) for bound in partitions.values() if bound != 'MAXVALUE']
+        if 'p_future' not in partitions or (bounds and year < max(bounds)):
+            return False
+        conn.exec_driver_sql(
+            f'ALTER TABLE {table} REORGANIZE PARTITION p_future INTO ('
+            f'PARTITION {partition} VALUES LESS THAN ({year + 1}), PARTITION p_future VALUES LESS THAN MAXVALUE)')
+        return True
+
+
+def prepare_staging_table(conn, table, year):
+    """
+    Create an empty, unpartitioned copy of a table to build one year into.
+
+    Returns:
+        Name of the staging table
+    """
+    staging = f'{table}_stage_{year}'
+    conn.exec_driver_sql(f'DROP TABLE IF EXISTS {staging}')
+    conn.exec_driver_sql(f'CREATE TABLE {staging} LIKE {table}')
+    conn.exec_driver_sql(f'ALTER TABLE {staging} REMOVE PARTITIONING')
+    return staging
+
+
+def exchange_staging_table(conn, table, staging, year):
+    """Swap a staging table in as partition p<year>, then drop it (it now holds the old rows)."""
+    conn.exec_driver_sql(f'ALTER TABLE {table} EXCHANGE PARTITION p{year} WITH TABLE {staging}')
+    conn.exec_driver_sql(f'DROP TABLE {staging}')
+
+
+class StageExecutor:
+    """Run the stages of Data_Processing_DV.sql for many years as a DAG on a pooled engine."""
+
+    def __init__(self, engine, sql_script_path, max_workers=4, echo=True, load_mode='delete'):
+        """
+        Args:
+            engine: SQLAlchemy engine; its pool should allow max_workers connections
+            sql_script_path: Path to Data_Processing_DV.sql (with stage markers)
+            max_workers: Maximum number of stages running at once
+            echo: Print stage progress and result sets as they arrive
+            load_mode: 'delete' runs the script's DELETE + INSERT as written; 'exchange' builds
+                partitioned tables in a staging table and swaps it in with EXCHANGE PARTITION
+        """
+        if load_mode not in ('delete', 'exchange'):
+            raise ValueError(f'Unknown load_mode: {load_mode}')
+        self.engine = engine
+        self.max_workers = max_workers
+        self.echo = echo
+        self.load_mode = load_mode
+        self.setup, self.stages = parse_script(sql_script_path)
+
+    def _print(self, message):
+        if self.echo:
+            print(message, flush=True)
+
+    def dependencies(self, years, drop_first=True):
+        """
+        Build the DAG for the given years.
+
+        Returns:
+            Dictionary mapping each (year, stage) node to the list of nodes it waits for
+        """
+        years = list(years)
+        graph = {}
+        for year in years:
+            for name, stage in self.stages.items():
+                after = [(year, dependency) for dependency in stage['after']]
+                if drop_first and year != years[0]:
+                    after.append((years[0], name))
+                graph[(year, name)] = after
+        return graph
+
+    def run_stage(self, year, name, drop_tables=False):
+        """
+        Run one stage for one year on a pooled session.
+
+        Returns:
+            Dictionary with year, stage, success, started, ended, duration, rows (rows inserted),
+            tables (tables the stage deleted from or inserted into, also when it failed), output
+            (result set lines) and error
+        """
+        prefix = f'[{year} {name}]'
+        result = {'year': year, 'stage': name, 'success': False, 'started': datetime.now(), 'rows': 0,
+                  'tables': [], 'output': [], 'error': ''}
+        start = time.perf_counter()
+        self._print(f'{prefix} started')
+        staging = {}
+
+        try:
+            # Autocommit each statement, as the mariadb client does when sourcing the script. Statements without
+            # parameters go to the driver as written: pymysql would otherwise apply `statement % {}` and fail on
+            # format strings such as STR_TO_DATE(..., '%Y%m%d')
+            with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT', no_parameters=True) as conn:
+                for statement in self.setup:
+                    conn.exec_driver_sql(statement)
+                conn.execute(sqlalchemy.text('SET @process_year = :process_year, @drop_tables = :drop_tables'),
+                             {'process_year': year, 'drop_tables': 1 if drop_tables else 0})
+
+                for statement in self.stages[name]['statements']:
+                    delete = DELETE_TARGET.match(statement)
+                    target = delete or INSERT_TARGET.match(statement)
+                    if target and target.group(1) not in result['tables']:
+                        result['tables'].append(target.group(1))
+                    if (delete and self.load_mode == 'exchange'
+                            and year_partition_ready(conn, delete.group(1), year)):
+                        staging[delete.group(1)] = prepare_staging_table(conn, delete.group(1), year)
+                        continue
+                    insert = INSERT_TARGET.match(statement)
+                    if insert and insert.group(1) in staging:
+                        statement = statement[:insert.start(1)] + staging[insert.group(1)] + statement[insert.end(1):]
+
+                    cursor = conn.exec_driver_sql(statement)
+                    if cursor.returns_rows:
+                        for row in cursor.fetchall():
+                            line = ' '.join('' if value is None else str(value) for value in row)
+                            result['output'].append(line)
+                            if line.strip():
+                                self._print(f'{prefix} {line}')
+                    elif insert:
+                        result['rows'] += max(cursor.rowcount, 0)
+
+                # Swap at the end of the stage so the script's ROW_COUNT() reports still see the INSERT
+                for table, staging_table in list(staging.items()):
+                    exchange_staging_table(conn, table, staging_table, year)
+                    del staging[table]
+                    self._print(f'{prefix} exchanged partition p{year} of {table}')
+            result['success'] = True
+        except Exception as e:
+            result['error'] = str(e)
+            for staging_table in staging.values():
+                try:
+                    with self.engine.connect() as cleanup:
+                        cleanup.exec_driver_sql(f'DROP TABLE IF EXISTS {staging_table}')
+                except Exception:
+                    pass
+
+        result['ended'] = datetime.now()
+        result['duration'] = time.perf_counter() - start
+        status = 'completed' if result['success'] else f'FAILED: {result["error"][:200]}'
+        self._print(f'{prefix} {status} in {result["duration"]:.1f}s')
+        return result
+
+    def run(self, years, drop_first=True, on_stage_done=None):
+        """
+        Run every stage for every year, starting each stage as soon as its dependencies finish.
+
+        Stages whose dependencies failed are not run and are reported as failed.
+
+        Args:
+            years: Years to process; the first one drops and recreates the tables when drop_first is set
+            drop_first: Set @drop_tables = 1 for the first year
+            on_stage_done: Optional callback receiving each stage result as it finishes
+
+        Returns:
+            List of stage results (see run_stage()) in completion order
+        """
+        years = list(years)
+        graph = self.dependencies(years, drop_first)
+        order = {node: index for index, node in enumerate(graph)}
+        pending = dict(graph)
+        done = {}
+        results = []
+        running = {}
+
+        def finish(result):
+            done[(result['year'], result['stage'])] = result['success']
+            results.append(result)
+            if on_stage_done:
+                on_stage_done(result)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                # Skip nodes whose dependencies failed, submit the ones that are ready (oldest year first)
+                for node in sorted(pending, key=order.get):
+                    after = pending[node]
+                    failed = [dependency for dependency in after if done.get(dependency) is False]
+                    if failed:
+                        del pending[node]
+                        now = datetime.now()
+                        finish({'year': node[0], 'stage': node[1], 'success': False, 'started': now, 'ended': now,
+                                'duration': 0.0, 'rows': 0, 'tables': [], 'output': [],
+                                'error': f'Skipped: {failed[0][1]} for {failed[0][0]} failed'})
+                    elif all(done.get(dependency) for dependency in after) and len(running) < self.max_workers:
+                        del pending[node]
+                        year, name = node
+                        drop_tables = drop_first and year == years[0]
+                        running[pool.submit(self.run_stage, year, name, drop_tables)] = node
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    del running[future]
+                    finish(future.result())
+
+        return results
+
+
+def summarize_years(results):
+    """
+    Collapse stage results to one status per year.
+
+    Returns:
+        (successful_years, failed_years) sorted lists
+    """
+    status = {}
+    for result in results:
+        status[result['year']] = status.get(result['year'], True) and result['success']
+    return (sorted(year for year, success in status.items() if success),
+            sorted(year for year, success in status.items() if not success))
+
+
+def format_timings(results):
+    """Format per-stage timings as a text table, with totals per stage."""
+    lines = [f"{'Year':<6} {'Stage':<20} {'Status':<8} {'Start':<10} {'Seconds':>9} {'Rows':>10}"]
+    for result in sorted(results, key=lambda r: (r['year'], r['started'])):
+        lines.append(f"{result['year']:<6} {result['stage']:<20} {'OK' if result['success'] else 'FAILED':<8} "
+                     f"{result['started'].strftime('%H:%M:%S'):<10} {result['duration']:>9.1f} {result['rows']:>10}")
+
+    lines.append('')
+    lines.append(f"{'Stage':<20} {'Runs':>5} {'Total s':>9} {'Mean s':>8} {'Max s':>8}")
+    stage_names = list(dict.fromkeys(result['stage'] for result in results))
+    for name in stage_names:
+        durations = [result['duration'] for result in results if result['stage'] == name]
+        lines.append(f"{name:<20} {len(durations):>5} {sum(durations):>9.1f} "
+                     f"{sum(durations) / len(durations):>8.1f} {max(durations):>8.1f}")
+
+    if results:
+        wall = (max(r['ended'] for r in results) - min(r['started'] for r in results)).total_seconds()
+        busy = sum(result['duration'] for result in results)
+        lines.append('')
+        lines.append(f'Wall clock: {wall:.1f}s | Stage time: {busy:.1f}s | Overlap factor: {busy / wall if wall else 0:.2f}x')
+    return '\n'.join(lines)
@@ -0,0 +1,304 @@
+"""
+Polars engine for the Statcast batter/pitcher game aggregations.
+
+This is an alternative to the pandas aggregations in pull_statcast_advanced_metrics.py
+(StatcastGameLevelLoader.aggregate_batter_pitches / aggregate_pitcher_pitches). Those subset the
+batted balls, run several groupbys per entity and merge them back together. Here each entity is
+one lazy group_by over the pitches, and the batted-ball metrics are conditional aggregations:
+inside agg, each batted-ball column is masked to null outside balls in play (when/then, which
+polars evaluates on the fast grouped path, unlike a per-group filter), so the pitches are
+scanned once per entity and nothing is merged.
+
+The output has the same columns and values as the pandas version, including:
+- batters only get a row for games in which they put a ball in play (type 'X')
+- pa counts distinct at_bat_number over pitches with a pitch_number, 0 if none
+- barrels / hard hit / sweet spot treat a missing launch speed or angle as not qualifying
+- rates are 0 when there are no batted balls with a launch speed
+- rows sorted by game_pk and player ID
+
+derive_pitch_features() computes the columns both aggregations need (batted-ball mask,
+quality-of-contact flags, plate appearance starts) once per pull, like the loader's
+derive_pitch_flags() for the pandas engine.
+
+GAME_ID and Retrosheet player IDs are added afterwards by the loader, for both engines.
+
+Usage:
+    python statcast_game_polars.py --pitches statcast_pitches/2023
+    python statcast_game_polars.py --pitches season_2023.parquet --repeat 5
+
+The benchmark reads a pitch file (or a directory of them, e.g. one season of the local pitch
+store), runs both engines, checks that they agree and prints the timings.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+# Pitch-level columns the aggregations read
+PITCH_COLUMNS = [
+    'game_pk', 'game_date', 'batter', 'pitcher', 'player_name', 'home_team', 'away_team', 'type',
+    'pitch_number', 'at_bat_number', 'release_speed', 'release_spin_rate', 'launch_speed', 'launch_angle',
+    'estimated_ba_using_speedangle', 'estimated_woba_using_speedangle', 'estimated_slg_using_speedangle'
+]
+
+BATTER_COLUMNS = [
+    'game_pk', 'game_date', 'batter_id', 'batter_name', 'avg_launch_speed', 'max_launch_speed',
+    'batted_balls', 'avg_launch_angle', 'barrels', 'hard_hit', 'sweet_spot', 'avg_xba', 'avg_xwoba',
+    'avg_xslg', 'home_team', 'away_team', 'pa', 'barrel_rate', 'hard_hit_rate', 'sweet_spot_rate',
+    'year_id', 'team', 'opponent', 'home_away', 'ab'
+]
+
+PITCHER_COLUMNS = [
+    'game_pk', 'pitcher_id', 'game_date', 'pitcher_name', 'home_team', 'away_team', 'avg_release_speed',
+    'max_release_speed', 'pitches', 'avg_spin_rate', 'batters_faced', 'avg_launch_speed_against',
+    'max_launch_speed_against', 'batted_balls_against', 'avg_launch_angle_against', 'barrels_against',
+    'hard_hit_against', 'avg_xba_against', 'avg_xwoba_against', 'barrel_rate_against',
+    'hard_hit_rate_against', 'year_id', 'team', 'opponent', 'home_away'
+]
+
+IS_BATTED_BALL = pl.col('is_batted_ball')
+
+
+def pitches_from_pandas(df):
+    """
+    Convert pitch-level Statcast data (pybaseball / pitch store) to a polars LazyFrame.
+
+    Only the columns the aggregations read are converted.
+
+    Args:
+        df: Pitch-level pandas DataFrame
+
+    Returns:
+        LazyFrame of the pitches
+    """
+    df = df[[column for column in PITCH_COLUMNS if column in df.columns]].copy()
+    df['game_date'] = pd.to_datetime(df['game_date'])
+    return pl.from_pandas(df).lazy()
+
+
+def derive_pitch_features(pitches):
+    """
+    Derivation stage: per-pitch columns shared by the batter and pitcher aggregations.
+
+    Same columns as StatcastGameLevelLoader.derive_pitch_flags: is_batted_ball, the quality-of-contact
+    flags is_barrel / is_hard_hit / is_sweet_spot (0 on pitches not in play) and pa_start (1 on the
+    first pitch of each plate appearance).
+
+    Args:
+        pitches: Pitch-level LazyFrame (see pitches_from_pandas)
+
+    Returns:
+        LazyFrame with the derived columns; cache() it when both aggregations read it
+    """
+    in_pa = pl.col('pitch_number').is_not_null() & pl.col('at_bat_number').is_not_null()
+    launch_speed, launch_angle = pl.col('launch_speed'), pl.col('launch_angle')
+    return (
+        pitches
+        .with_columns((pl.col('type') == 'X').fill_null(False).alias('is_batted_ball'))
+        .with_columns(
+            # Barrel: >= 98 mph exit velo and 26-30 degree launch angle
+            (IS_BATTED_BALL & (launch_speed >= 98) & launch_angle.is_between(26, 30))
+            .fill_null(False).cast(pl.Int8).alias('is_barrel'),
+            (IS_BATTED_BALL & (launch_speed >= 95)).fill_null(False).cast(pl.Int8).alias('is_hard_hit'),
+            (IS_BATTED_BALL & launch_angle.is_between(8, 32)).fill_null(False).cast(pl.Int8).alias('is_sweet_spot'),
+            # in_pa is part of the key so the first pitch counted is the first one with a pitch_number
+            (in_pa & pl.struct(pl.col('game_pk'), pl.col('batter'), pl.col('at_bat_number'), in_pa.alias('in_pa'))
+             .is_first_distinct()).cast(pl.Int8).alias('pa_start'),
+        )
+    )
+
+
+def _batted(expr):
+    """The expression on balls in play, null on every other pitch (aggregations skip the nulls)."""
+    return pl.when(IS_BATTED_BALL).then(expr)
+
+
+def _first(expr):
+    """First non-null value in the group, like pandas' groupby 'first'."""
+    return expr.first(ignore_nulls=True)
+
+
+def _rate(numerator, denominator):
+    return (pl.when(pl.col(denominator) > 0)
+            .then(pl.col(numerator) / pl.col(denominator))
+            .otherwise(0.0))
+
+
+def _batter_game_plan(pitches):
+    """One group_by over the pitches for every batter-game column."""
+    return (
+        pitches
+        .group_by('game_pk', 'batter')
+        .agg(
+            _first(_batted(pl.col('game_date'))).alias('game_date'),
+            _first(_batted(pl.col('player_name'))).alias('batter_name'),
+            _batted(pl.col('launch_speed')).mean().alias('avg_launch_speed'),
+            _batted(pl.col('launch_speed')).max().alias('max_launch_speed'),
+            _batted(pl.col('launch_speed')).count().cast(pl.Int64).alias('batted_balls'),
+            _batted(pl.col('launch_angle')).mean().alias('avg_launch_angle'),
+            pl.col('is_barrel').sum().cast(pl.Int64).alias('barrels'),
+            pl.col('is_hard_hit').sum().cast(pl.Int64).alias('hard_hit'),
+            pl.col('is_sweet_spot').sum().cast(pl.Int64).alias('sweet_spot'),
+            _batted(pl.col('estimated_ba_using_speedangle')).mean().alias('avg_xba'),
+            _batted(pl.col('estimated_woba_using_speedangle')).mean().alias('avg_xwoba'),
+            _batted(pl.col('estimated_slg_using_speedangle')).mean().alias('avg_xslg'),
+            _first(_batted(pl.col('home_team'))).alias('home_team'),
+            _first(_batted(pl.col('away_team'))).alias('away_team'),
+            pl.col('pa_start').sum().cast(pl.Int64).alias('pa'),
+            IS_BATTED_BALL.any().alias('has_batted_ball'),
+        )
+        .filter(pl.col('has_batted_ball') & pl.col('game_date').is_not_null())
+        .rename({'batter': 'batter_id'})
+        .with_columns(
+            _rate('barrels', 'batted_balls').alias('barrel_rate'),
+            _rate('hard_hit', 'batted_balls').alias('hard_hit_rate'),
+            _rate('sweet_spot', 'batted_balls').alias('sweet_spot_rate'),
+            pl.col('game_date').dt.year().alias('year_id'),
+            pl.lit(None, dtype=pl.Utf8).alias('team'),
+            pl.lit(None, dtype=pl.Utf8).alias('opponent'),
+            pl.lit(None, dtype=pl.Utf8).alias('home_away'),
+            pl.col('pa').alias('ab'),  # Simplified, as in the pandas version
+        )
+        .sort('game_pk', 'batter_id')
+        .select(BATTER_COLUMNS)
+    )
+
+
+def _pitcher_game_plan(pitches):
+    """One group_by over the pitches for every pitcher-game column."""
+    return (
+        pitches
+        .group_by('game_pk', 'pitcher')
+        .agg(
+            _first(pl.col('game_date')),
+            _first(pl.col('player_name')).alias('pitcher_name'),
+            _first(pl.col('home_team')),
+            _first(pl.col('away_team')),
+            pl.col('release_speed').mean().alias('avg_release_speed'),
+            pl.col('release_speed').max().alias('max_release_speed'),
+            pl.col('release_speed').count().cast(pl.Int64).alias('pitches'),
+            pl.col('release_spin_rate').mean().alias('avg_spin_rate'),
+            pl.col('batter').drop_nulls().n_unique().cast(pl.Int64).alias('batters_faced'),
+            _batted(pl.col('launch_speed')).mean().alias('avg_launch_speed_against'),
+            _batted(pl.col('launch_speed')).max().alias('max_launch_speed_against'),
+            _batted(pl.col('launch_speed')).count().cast(pl.Int64).alias('batted_balls_against'),
+            _batted(pl.col('launch_angle')).mean().alias('avg_launch_angle_against'),
+            pl.col('is_barrel').sum().cast(pl.Int64).alias('barrels_against'),
+            pl.col('is_hard_hit').sum().cast(pl.Int64).alias('hard_hit_against'),
+            _batted(pl.col('estimated_ba_using_speedangle')).mean().alias('avg_xba_against'),
+            _batted(pl.col('estimated_woba_using_speedangle')).mean().alias('avg_xwoba_against'),
+        )
+        .rename({'pitcher': 'pitcher_id'})
+        .with_columns(
+            _rate('barrels_against', 'batted_balls_against').alias('barrel_rate_against'),
+            _rate('hard_hit_against', 'batted_balls_against').alias('hard_hit_rate_against'),
+            pl.col('game_date').dt.year().alias('year_id'),
+            pl.lit(None, dtype=pl.Utf8).alias('team'),
+            pl.lit(None, dtype=pl.Utf8).alias('opponent'),
+            pl.lit(None, dtype=pl.Utf8).alias('home_away'),
+        )
+        .sort('game_pk', 'pitcher_id')
+        .select(PITCHER_COLUMNS)
+    )
+
+
+def aggregate_batter_game_stats(pitches):
+    """
+    Aggregate pitches to one row per batter and game.
+
+    Args:
+        pitches: Output of derive_pitch_features
+
+    Returns:
+        DataFrame with BATTER_COLUMNS
+    """
+    return _batter_game_plan(pitches).collect()
+
+
+def aggregate_pitcher_game_stats(pitches):
+    """
+    Aggregate pitches to one row per pitcher and game.
+
+    Args:
+        pitches: Output of derive_pitch_features
+
+    Returns:
+        DataFrame with PITCHER_COLUMNS
+    """
+    return _pitcher_game_plan(pitches).collect()
+
+
+def aggregate_game_stats(pitches):
+    """Derive the shared columns, then collect the batter and pitcher aggregations together."""
+    pitches = derive_pitch_features(pitches).cache()
+    batters, pitchers = pl.collect_all([_batter_game_plan(pitches), _pitcher_game_plan(pitches)])
+    return batters, pitchers
+
+
+def read_pitch_files(path):
+    """Read a Parquet pitch file, or every Parquet file under a directory (e.g. a season of the pitch store)."""
+    path = Path(path)
+    files = sorted(path.rglob('*.parquet')) if path.is_dir() else [path]
+    frames = [frame for frame in (pd.read_parquet(file) for file in files) if not frame.empty]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _timed(function, repeat):
+    """Best wall time over repeat runs, and the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the polars Statcast game aggregations against pandas')
+    parser.add_argument('--pitches', required=True,
+                        help='Parquet pitch file, or a directory of them (e.g. statcast_pitches/2023)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per engine; the best time is reported')
+    args = parser.parse_args()
+
+    # Imported here: the loader module configures logging to a file on import
+    from pull_statcast_advanced_metrics import StatcastGameLevelLoader
+    from at_bat_level_polars import compare_frames
+
+    df = read_pitch_files(args.pitches)
+    print(f"{'='*60}")
+    print(f"Statcast game aggregations: {len(df):,} pitches from {args.pitches}")
+    print(f"{'='*60}")
+
+    def run_pandas():
+        pitches = StatcastGameLevelLoader.derive_pitch_flags(df)
+        return (StatcastGameLevelLoader.aggregate_batter_pitches(pitches),
+                StatcastGameLevelLoader.aggregate_pitcher_pitches(pitches))
+
+    pandas_seconds, (pandas_batters, pandas_pitchers) = _timed(run_pandas, args.repeat)
+    polars_seconds, (polars_batters, polars_pitchers) = _timed(
+        lambda: aggregate_game_stats(pitches_from_pandas(df)), args.repeat)
+
+    ok = True
+    for name, expected, actual, keys in (
+            ('batter', pandas_batters, polars_batters, ['game_pk', 'batter_id']),
+            ('pitcher', pandas_pitchers, polars_pitchers, ['game_pk', 'pitcher_id'])):
+        expected = pl.from_pandas(expected[actual.columns].astype({'game_date': 'datetime64[us]'}))
+        result = compare_frames(expected, actual, keys)
+        matches = (result['missing_rows'] == 0 and result['extra_rows'] == 0
+                   and not result['column_mismatches'])
+        ok = ok and matches
+        print(f"{'✓' if matches else '✗'} {name}: {result['actual_rows']:,} rows "
+              f"(pandas {result['expected_rows']:,}), mismatches: {result['column_mismatches'] or 'none'}")
+
+    print(f"\npandas: {pandas_seconds:.3f}s")
+    print(f"polars: {polars_seconds:.3f}s (includes the pandas -> polars conversion)")
+    print(f"Speedup: {pandas_seconds / polars_seconds:.1f}x")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""
+Local pitch-level Statcast store, partitioned by season and game date.
+
+pull_statcast_advanced_metrics.py used to download pitches from Baseball Savant, aggregate them
+and discard them, so every new aggregate meant re-downloading whole seasons. The store keeps
+the raw pitches as one Parquet file per game date:
+
+    <root>/<YYYY>/<YYYY-MM-DD>.parquet
+
+- load_range() reads a date range from the store and fetches only the dates that are missing,
+  in contiguous runs, through pybaseball's statcast()
+- a fetched date with no games (off day, All-Star break) is stored as an empty file so it is
+  not requested again
+- dates within SETTLE_DAYS of today are never stored, since Savant may still be adding (late or
+  still processing) games of those dates; they are read straight from Savant instead, and a file
+  written before its date settled is treated as missing and fetched again
+- columns are stored typed: IDs and counts as nullable integers, measurements as floats,
+  game_date as a timestamp and text as strings
+
+Usage:
+    store = StatcastPitchStore('statcast_pitches')
+    pitches = store.load_range('2023-04-01', '2023-04-07')
+"""
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+# Savant may still add games of a date until this many days after it (late games, processing)
+SETTLE_DAYS = 2
+
+
+# Explicit types for the Statcast columns the aggregations rely on; other object columns are stored as strings
+PITCH_DTYPES = {
+    'game_pk': 'Int64',
+    'batter': 'Int64',
+    'pitcher': 'Int64',
+    'game_year': 'Int16',
+    'at_bat_number': 'Int16',
+    'pitch_number': 'Int16',
+    'inning': 'Int8',
+    'balls': 'Int8',
+    'strikes': 'Int8',
+    'outs_when_up': 'Int8',
+    'release_speed': 'float64',
+    'release_spin_rate': 'float64',
+    'launch_speed': 'float64',
+    'launch_angle': 'float64',
+    'estimated_ba_using_speedangle': 'float64',
+    'estimated_woba_using_speedangle': 'float64',
+    'estimated_slg_using_speedangle': 'float64',
+}
+
+
+def settled_through(today: Optional[date] = None) -> date:
+    """Latest game date whose Statcast data is complete (SETTLE_DAYS before today)."""
+    return (today or date.today()) - timedelta(days=SETTLE_DAYS)
+
+
+def _to_date(value) -> date:
+    """Accept 'YYYY-MM-DD' strings, dates and datetimes."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _date_runs(dates: List[date]) -> List[tuple]:
+    """Group sorted dates into (first, last) runs of consecutive days."""
+    runs = []
+    for day in dates:
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def normalize_pitches(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give pitch-level Statcast data consistent column types before storing it.
+
+    Args:
+        df: Pitch-level data as returned by pybaseball.statcast()
+
+    Returns:
+        Copy of the data with typed columns
+    """
+    df = df.copy()
+    df['game_date'] = pd.to_datetime(df['game_date']).dt.normalize()
+    for column, dtype in PITCH_DTYPES.items():
+        if column in df.columns:
+            if dtype.startswith('Int'):
+                df[column] = pd.to_numeric(df[column], errors='coerce').round().astype(dtype)
+            else:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype(dtype)
+    for column in df.columns:
+        if df[column].dtype == object:
+            # Parquet needs one type per column; keep missing values missing
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+    return df
+
+
+class StatcastPitchStore:
+    """Pitch-level Statcast data kept on disk as one Parquet file per game date."""
+
+    def __init__(self, root: str, fetch: Optional[Callable] = None):
+        """
+        Args:
+            root: Directory of the store (created if missing)
+            fetch: Function taking start_dt/end_dt ('YYYY-MM-DD') and returning pitch-level data;
+                defaults to pybaseball.statcast
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        if fetch is None:
+            from pybaseball import statcast
+            fetch = statcast
+        self.fetch = fetch
+
+    def date_path(self, day: date) -> Path:
+        """Path of the file holding one game date."""
+        return self.root / str(day.year) / f'{day.isoformat()}.parquet'
+
+    def is_stored(self, day: date) -> bool:
+        """Whether a date has a final file: one written after the date settled."""
+        path = self.date_path(day)
+        if not path.exists():
+            return False
+        # Files written while Savant could still add games of the date (older versions stored those)
+        return (date.fromtimestamp(path.stat().st_mtime) - day).days >= SETTLE_DAYS
+
+    def missing_dates(self, start_date, end_date) -> List[date]:
+        """
+        Dates in the range that are not in the store yet (or were stored before they settled).
+
+        Args:
+            start_date: First date (YYYY-MM-DD or date)
+            end_date: Last date, inclusive
+
+        Returns:
+            Sorted list of dates
+        """
+        start, end = _to_date(start_date), _to_date(end_date)
+        days = (start + timedelta(days=offset) for offset in range((end - start).days + 1))
+        return [day for day in days if not self.is_stored(day)]
+
+    def write_date(self, day: date, df: pd.DataFrame) -> None:
+        """Store the pitches of one game date, replacing any existing file atomically."""
+        path = self.date_path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def fetch_missing(self, start_date, end_date) -> int:
+        """
+        Download and store the dates of a range that are not in the store yet.
+
+        Returns:
+            Number of pitches downloaded
+        """
+        settled = settled_through()
+        missing = [day for day in self.missing_dates(start_date, end_date) if day <= settled]
+        pitches = 0
+        for first, last in _date_runs(missing):
+            logger.info(f"    Fetching {first} to {last} from Savant (not in local store)...")
+            df = self.fetch(start_dt=first.isoformat(), end_dt=last.isoformat())
+            if df is None or df.empty:
+                df = pd.DataFrame()
+            else:
+                df = normalize_pitches(df)
+                pitches += len(df)
+
+            by_date = {} if df.empty else {key.date(): group for key, group in df.groupby('game_date')}
+            for offset in range((last - first).days + 1):
+                day = first + timedelta(days=offset)
+                self.write_date(day, by_date.get(day, df.iloc[0:0]))
+        return pitches
+
+    def read_range(self, start_date, end_date, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read the stored pitches of a date range (missing dates are skipped).
+
+        Args:
+            start_date: First date (YYYY-MM-DD or date)
+            end_date: Last date, inclusive
+            columns: Optional subset of columns to read (columns a file does not have are skipped)
+
+        Returns:
+            Pitch-level DataFrame (empty if nothing is stored for the range)
+        """
+        start, end = _to_date(start_date), _to_date(end_date)
+        frames = []
+        for offset in range((end - start).days + 1):
+            path = self.date_path(start + timedelta(days=offset))
+            if path.exists():
+                # Files of dates without games may not have the columns
+                present = columns and [column for column in columns if column in pq.read_schema(path).names]
+                if columns and not present:
+                    continue
+                frame = pd.read_parquet(path, columns=present or None)
+                if not frame.empty:
+                    frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
+
+    def load_range(self, start_date, end_date, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Fetch any missing dates of a range, then read the whole range from the store.
+
+        Args:
+            start_date: First date (YYYY-MM-DD or date)
+            end_date: Last date, inclusive
+            columns: Optional subset of columns to read
+
+        Returns:
+            Pitch-level DataFrame
+        """
+        self.fetch_missing(start_date, end_date)
+        settled = settled_through()
+        df = self.read_range(start_date, min(_to_date(end_date), settled), columns)
+        if _to_date(end_date) > settled:
+            # Dates that have not settled are not stored; read them straight from Savant
+            first = max(_to_date(start_date), settled + timedelta(days=1))
+            live = self.fetch(start_dt=first.isoformat(), end_dt=_to_date(end_date).isoformat())
+            if live is not None and not live.empty:
+                live = normalize_pitches(live)
+                df = pd.concat([df, live[columns] if columns else live], ignore_index=True)
+        return df
@@ -0,0 +1,274 @@
+"""
+Schedule-aware planning of Statcast date batches.
+
+pull_statcast_advanced_metrics.py used to request every day from March 1 to November 30 in
+fixed windows. That spends requests (and rate-limiter tokens) on months without games, and a
+window with many games can run into Savant's per-query row cap, which truncates the result
+without an error. The planner works from the actual game dates instead:
+
+- SeasonSchedule gives the number of games on each date of a season, from a cached schedule
+  file, the MLB Stats API schedule (regular season and postseason) or, when that is not
+  reachable, the GAME_IDs in retrosheet.games (regular season only)
+- plan_batches() packs consecutive game dates into (start, end) batches whose expected pitch
+  count (games * PITCHES_PER_GAME) stays under max_pitches; a batch never spans an off day,
+  so no tokens are spent on dates without games
+- dates that are already loaded can be passed as skip_dates and are left out of every batch
+- SeasonSchedule.game_order() numbers each home team's games on a date by start time, which is
+  how Retrosheet numbers doubleheaders (the MLB schedule only; empty for retrosheet.games)
+
+Usage:
+    schedule = SeasonSchedule('statcast_schedule', engine=engine)
+    batches = plan_batches(schedule.games_per_date(2023), skip_dates=loaded)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+import sqlalchemy
+
+logger = logging.getLogger(__name__)
+
+
+# Rows Baseball Savant returns for one search query at most; larger results are cut off silently
+SAVANT_ROW_CAP = 25000
+
+# Pitches in an average MLB game (both teams), on the high side to leave room for extra innings
+PITCHES_PER_GAME = 300
+
+# Expected pitches per request by default: the row cap with a 20% safety margin
+DEFAULT_MAX_PITCHES = int(SAVANT_ROW_CAP * 0.8)
+
+MLB_SCHEDULE_URL = 'https://statsapi.mlb.com/api/v1/schedule'
+
+# Regular season, wild card, division series, league championship series, World Series
+MLB_GAME_TYPES = 'R,F,D,L,W'
+
+# Postponed and cancelled games stay on the schedule under their original date
+SKIPPED_GAME_STATES = ('C', 'D')
+
+# Cached schedules of the current season are refetched after this many seconds
+SCHEDULE_CACHE_TTL = 12 * 60 * 60
+
+
+def _date_key(value) -> date:
+    """Accept 'YYYY-MM-DD' strings, dates and datetimes."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def fetch_mlb_schedule(year: int, timeout: float = 30.0) -> Tuple[Dict[date, int], Dict[int, int]]:
+    """
+    Games per date of a season, and the order of each game on its date, from the MLB Stats API.
+
+    Args:
+        year: Season
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (game date -> number of games, game_pk -> start-time order of the game among its
+        home team's games that date, from 1). Postponed and cancelled games are left out.
+    """
+    res = requests.get(MLB_SCHEDULE_URL, params={'sportId': 1, 'season': year, 'gameType': MLB_GAME_TYPES},
+                       timeout=timeout)
+    res.raise_for_status()
+    games, game_order = {}, {}
+    for day in res.json().get('dates', []):
+        played = [game for game in day.get('games', [])
+                  if game.get('status', {}).get('codedGameState') not in SKIPPED_GAME_STATES]
+        if not played:
+            continue
+        games[_date_key(day['date'])] = len(played)
+
+        by_home_team = {}
+        for game in played:
+            by_home_team.setdefault(game['teams']['home']['team']['id'], []).append(game)
+        for home_games in by_home_team.values():
+            home_games.sort(key=lambda game: (game.get('gameDate', ''), game['gamePk']))
+            for order, game in enumerate(home_games, start=1):
+                game_order[int(game['gamePk'])] = order
+    return games, game_order
+
+
+def retrosheet_schedule(engine, year: int) -> Dict[date, int]:
+    """
+    Games per date of a season from the GAME_IDs in retrosheet.games (regular season only).
+
+    Args:
+        engine: SQLAlchemy engine for the retrosheet database
+        year: Season
+
+    Returns:
+        Dictionary of game date -> number of games (empty if the season is not loaded)
+    """
+    query = sqlalchemy.text("""
+        SELECT SUBSTRING(GAME_ID, 4, 8) AS game_day, COUNT(*) AS games
+        FROM retrosheet.games
+        WHERE YEAR_ID = :year
+        GROUP BY game_day
+    """)
+    with engine.connect() as connection:
+        rows = connection.execute(query, {'year': year}).fetchall()
+    return {datetime.strptime(game_day, '%Y%m%d').date(): int(games) for game_day, games in rows}
+
+
+class SeasonSchedule:
+    """Games per date of each season, cached as one JSON file per season and in memory."""
+
+    def __init__(self, cache_dir: Optional[str] = None, engine=None):
+        """
+        Args:
+            cache_dir: Directory of the cached schedules (created if missing); None disables the cache
+            engine: Optional SQLAlchemy engine, used to read retrosheet.games when the MLB Stats API
+                is not reachable
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.engine = engine
+        self._seasons = {}
+        self._lock = threading.Lock()
+
+    def cache_path(self, year: int) -> Optional[Path]:
+        """Path of the cached schedule of one season."""
+        return self.cache_dir / f'{year}.json' if self.cache_dir is not None else None
+
+    def _fresh(self, year: int, loaded_at: float) -> bool:
+        # Past seasons do not change; the current season's schedule does (postponements, postseason)
+        return year < date.today().year or time.time() - loaded_at <= SCHEDULE_CACHE_TTL
+
+    def _read_cache(self, year: int) -> Optional[Tuple[Dict[date, int], Dict[int, int]]]:
+        path = self.cache_path(year)
+        if path is None or not path.exists() or not self._fresh(year, path.stat().st_mtime):
+            return None
+        with open(path) as f:
+            cached = json.load(f)
+        if 'dates' not in cached:
+            return None  # written before game_order was cached
+        return ({_date_key(day): games for day, games in cached['dates'].items()},
+                {int(game_pk): order for game_pk, order in cached.get('game_order', {}).items()})
+
+    def _write_cache(self, year: int, games: Dict[date, int], game_order: Dict[int, int]) -> None:
+        path = self.cache_path(year)
+        if path is None:
+            return
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'dates': {day.isoformat(): count for day, count in sorted(games.items())},
+                       'game_order': {str(game_pk): order for game_pk, order in sorted(game_order.items())}},
+                      f, indent=0)
+        os.replace(tmp_path, path)
+
+    def _load(self, year: int) -> Tuple[Dict[date, int], Dict[int, int]]:
+        """Schedule of a season from memory, the cache file, the MLB Stats API or retrosheet.games."""
+        with self._lock:
+            if year in self._seasons and self._fresh(year, self._seasons[year][0]):
+                return self._seasons[year][1]
+
+            season = self._read_cache(year)
+            if season is None:
+                season = self._fetch(year)
+            self._seasons[year] = (time.time(), season)
+            return season
+
+    def _fetch(self, year: int) -> Tuple[Dict[date, int], Dict[int, int]]:
+        games, game_order = {}, {}
+        try:
+            games, game_order = fetch_mlb_schedule(year)
+            source = 'MLB Stats API'
+        except Exception as e:
+            logger.warning(f"Could not fetch the {year} schedule from the MLB Stats API: {e}")
+
+        if not games and self.engine is not None:
+            try:
+                games = retrosheet_schedule(self.engine, year)
+                source = 'retrosheet.games'
+            except Exception as e:
+                logger.warning(f"Could not read the {year} schedule from retrosheet.games: {e}")
+
+        if games:
+            logger.info(f"{year} schedule: {sum(games.values())} games on {len(games)} dates ({source})")
+            self._write_cache(year, games, game_order)
+        return games, game_order
+
+    def games_per_date(self, year: int) -> Dict[date, int]:
+        """
+        Number of games on each date of a season.
+
+        Tries the cached schedule, then the MLB Stats API, then retrosheet.games.
+
+        Args:
+            year: Season
+
+        Returns:
+            Dictionary of game date -> number of games (empty if no source knows the season)
+        """
+        return self._load(year)[0]
+
+    def game_order(self, year: int) -> Dict[int, int]:
+        """
+        Start-time order of each game among its home team's games on the same date.
+
+        1 for a single game, 1 and 2 for the games of a doubleheader.
+
+        Args:
+            year: Season
+
+        Returns:
+            Dictionary of game_pk -> order (empty unless the schedule came from the MLB Stats API)
+        """
+        return self._load(year)[1]
+
+
+def plan_batches(games_per_date: Dict[date, int], max_pitches: int = DEFAULT_MAX_PITCHES,
+                 max_days: Optional[int] = None, skip_dates: Iterable = (),
+                 until: Optional[date] = None) -> List[Tuple[str, str]]:
+    """
+    Pack game dates into request batches sized by expected pitch count.
+
+    A batch is a run of consecutive game dates. A new batch starts when the next date is not the
+    day after the previous one (off day, All-Star break, skipped date), when adding it would
+    take the batch past max_pitches expected pitches, or when the batch already has max_days
+    days. A single date is always its own batch, even above max_pitches.
+
+    Args:
+        games_per_date: Dictionary of game date -> number of games (see SeasonSchedule)
+        max_pitches: Most expected pitches per batch (games * PITCHES_PER_GAME)
+        max_days: Optional limit on the days per batch
+        skip_dates: Dates to leave out (already loaded)
+        until: Last date to plan (default: today; later games have not been played)
+
+    Returns:
+        List of (start_date, end_date) tuples (YYYY-MM-DD, inclusive)
+    """
+    until = until or date.today()
+    skip = {_date_key(day) for day in skip_dates}
+
+    batches = []
+    first = last = None
+    pitches = 0
+    for day in sorted(games_per_date):
+        if day > until or day in skip:
+            continue
+        expected = games_per_date[day] * PITCHES_PER_GAME
+        if (first is not None and day == last + timedelta(days=1) and pitches + expected <= max_pitches
+                and (max_days is None or (day - first).days < max_days)):
+            last = day
+            pitches += expected
+            continue
+        if first is not None:
+            batches.append((first.isoformat(), last.isoformat()))
+        first = last = day
+        pitches = expected
+    if first is not None:
+        batches.append((first.isoformat(), last.isoformat()))
+    return batches
@@ -1,29 +1,165 @@
+import csv
 import datetime as datetime
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
 
+import numpy as np
 import pandas as pd
 import polars as pl
+import pymysql
 import requests
 import sqlalchemy
 from bs4 import BeautifulSoup
-from pybaseball import playerid_reverse_lookup
-from pybaseball import statcast
+from pybaseball import chadwick_register
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:  # get_lineups falls back to BeautifulSoup
+    lxml_etree = lxml_html = None
+
+# Add the data preparation directory to path to share the Savant search parameters
+sys.path.append(str(Path(__file__).parent.parent / 'Data Preparation'))
+from savant_csv import SAVANT_CSV_PARAMS, SAVANT_CSV_URL
+
+logger = logging.getLogger(__name__)
+
+# Downloaded and cached data (pitch store, schedules, HTTP responses, player crosswalk), kept out of the source tree
+DATA_DIR = Path(os.environ.get('BASEBALL_DATA_DIR', Path.home() / '.cache' / 'baseball_project'))
+
+
+class _TimedQueuePool(sqlalchemy.pool.QueuePool):
+    """QueuePool that records how long each checkout waits for a connection (see Database.pool_stats)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = {'checkouts': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+        self._stats_lock = threading.Lock()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkout_stats['checkouts'] += 1
+                self.checkout_stats['wait_seconds'] += wait
+                self.checkout_stats['max_wait_seconds'] = max(self.checkout_stats['max_wait_seconds'], wait)
 
 
 class Database:
-    def __init__(self, uid, pwd, host, db, port):
+    # Pool settings of db_connect() engines, overridable per call
+    POOL_DEFAULTS = {'pool_size': 10, 'max_overflow': 10, 'pool_pre_ping': True, 'pool_recycle': 3600}
+
+    # Process-wide engines keyed by connection parameters and engine settings: {key: Engine}
+    _engines = {}
+    _engines_lock = threading.Lock()
+
+    # Size the db_pull result cache is trimmed to, least recently used results first
+    DEFAULT_RESULT_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+    _result_cache_lock = threading.Lock()
+
+    # Load counter per table, bumped by every write (see bump_table_versions); keys the db_pull result cache
+    LOAD_VERSION_TABLE = 'table_load_versions'
+
+    def __init__(self, uid, pwd, host, db, port, result_cache_dir=None,
+                 result_cache_max_bytes=DEFAULT_RESULT_CACHE_MAX_BYTES):
+        """
+        Args:
+            result_cache_dir (str): Directory of the db_pull result cache (None disables it).
+            result_cache_max_bytes (int): Size the result cache is trimmed to.
+        """
         self.uid = uid
         self.pwd = pwd
         self.host = host
         self.db = db
         self.port = port
+        self.result_cache_dir = Path(result_cache_dir) if result_cache_dir else None
+        self.result_cache_max_bytes = result_cache_max_bytes
 
-    def db_connect(self):
+    def db_connect(self, **engine_kwargs):
         """
-        Create a connection to a MySQL database using sqlalchemy.
+        Get the process-wide SQLAlchemy engine for this database.
+        Engines are kept in a registry keyed by the connection parameters and engine settings, so every
+        Database instance, loader and thread asking for the same connection shares one warm connection pool.
+        Engines and their pools are thread-safe.
+        Args:
+            **engine_kwargs: Extra arguments for sqlalchemy.create_engine (e.g. pool_size, max_overflow,
+                pool_pre_ping, pool_recycle, connect_args), on top of POOL_DEFAULTS.
         """
-        engine = sqlalchemy.create_engine('mysql+pymysql://{}:{}@{}/{}'.format(self.uid, self.pwd, self.host, self.db))
+        host = '{}:{}'.format(self.host, self.port) if self.port else self.host
+        url = 'mysql+pymysql://{}:{}@{}/{}'.format(self.uid, self.pwd, host, self.db)
+        return self._registered_engine(url, engine_kwargs)
+
+    @classmethod
+    def _registered_engine(cls, url, engine_kwargs):
+        """The registry's engine for a URL and engine settings, created on first use."""
+        engine_kwargs = dict(cls.POOL_DEFAULTS, **engine_kwargs)
+        key = (url, json.dumps(engine_kwargs, sort_keys=True, default=str))
+        with cls._engines_lock:
+            engine = cls._engines.get(key)
+            if engine is None:
+                engine_kwargs.setdefault('poolclass', _TimedQueuePool)
+                engine = sqlalchemy.create_engine(url, **engine_kwargs)
+                cls._engines[key] = engine
         return engine
 
+    def uri_engine(self, uri):
+        """
+        Registry engine of a db_pull URI (see db_connect_polars()), e.g. to read the load versions of the database
+        a pull reads. mysql:// URIs connect through pymysql, like db_connect().
+        """
+        url = sqlalchemy.engine.make_url(uri)
+        if url.drivername == 'mysql':
+            url = url.set(drivername='mysql+pymysql')
+        return self._registered_engine(url.render_as_string(hide_password=False), {})
+
+    @classmethod
+    def pool_stats(cls):
+        """
+        Pool usage of every engine in the registry.
+        Returns:
+            list of dict: One entry per engine with the URL (without password), pool_size, checked_out, overflow,
+            checkouts, wait_seconds (total time checkouts waited for a connection) and max_wait_seconds.
+        """
+        with cls._engines_lock:
+            engines = list(cls._engines.values())
+        stats = []
+        for engine in engines:
+            pool = engine.pool
+            checkout_stats = dict(getattr(pool, 'checkout_stats', {}))
+            stats.append({
+                'url': engine.url.render_as_string(hide_password=True),
+                'pool_size': pool.size() if hasattr(pool, 'size') else None,
+                'checked_out': pool.checkedout() if hasattr(pool, 'checkedout') else None,
+                'overflow': pool.overflow() if hasattr(pool, 'overflow') else None,
+                **checkout_stats,
+            })
+        return stats
+
+    @classmethod
+    def dispose_engines(cls):
+        """Close the pooled connections of every registered engine and empty the registry."""
+        with cls._engines_lock:
+            engines = list(cls._engines.values())
+            cls._engines.clear()
+        for engine in engines:
+            engine.dispose()
+
     def db_connect_polars(self):
         """
         Create a connection to a MySQL database to pull data for a Polars DataFrame.
@@ -31,16 +167,156 @@ class Database:
         uri = ('mysql://{}:{}@{}:{}/{}'.format(self.uid, self.pwd, self.host, self.port, self.db))
         return uri
 
-    def db_insert(self, df, table_name, engine):
+    def db_insert(self, df, table_name, engine, bulk=False, bump_version=True):
         """
         Insert a dataframe into a MySQL database.
         Args:
             df (pd.DataFrame): The dataframe to insert into the database.
             table_name (str): The name of the table to insert the data into.
             engine (sqlalchemy.engine.base.Engine): The sqlalchemy engine object to use to connect to the database.
+            bulk (bool): Load the rows with LOAD DATA LOCAL INFILE from a temporary CSV file, falling back to
+                chunked multi-row INSERTs when the server or client does not allow it. LOAD DATA needs an engine
+                created with db_connect(connect_args={'local_infile': True}).
+                Unlike to_sql, LOAD DATA LOCAL does not fail on bad rows: rows whose key already exists are
+                skipped (as with IGNORE), and values that do not convert are truncated or set to NULL with a
+                warning instead of an error. The multi-row INSERT fallback still raises on both. Use db_upsert to
+                replace existing keys, or bulk=False where duplicates and conversion errors must raise.
+            bump_version (bool): Record the load with bump_table_versions(); off for staging tables that are swapped
+                in afterwards.
+
+        Returns:
+            dict: method used ('to_sql', 'load_data' or 'executemany'), rows, seconds and rows_per_sec.
+        """
+        start = time.perf_counter()
+        if not bulk:
+            df.to_sql(table_name, engine, if_exists='append',
+                      index=False)  # if_exists='append' means that if the table already exists, the data will be appended to it
+            method = 'to_sql'
+        else:
+            connection = engine.raw_connection()
+            try:
+                method = self._bulk_load(df, table_name, connection)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                connection.close()
+        if bump_version:
+            self.bump_table_versions(engine, [table_name])
+        return self._load_stats(method, len(df), start)
+
+    def db_upsert(self, df, table_name, engine, key_columns=()):
+        """
+        Insert a dataframe, replacing rows whose primary/unique key already exists.
+        The rows are bulk-loaded into a temporary staging table on one connection and merged with a single
+        INSERT ... SELECT ... ON DUPLICATE KEY UPDATE, so rerunning an overlapping batch is safe.
+        Args:
+            df (pd.DataFrame): The dataframe to upsert.
+            table_name (str): The name of the table to upsert into.
+            engine (sqlalchemy.engine.base.Engine): The sqlalchemy engine object to use to connect to the database.
+            key_columns (iterable): Key columns, left out of the UPDATE list.
+
+        Returns:
+            dict: load method, rows, seconds and rows_per_sec (see db_insert).
+        """
+        start = time.perf_counter()
+        staging = f"{table_name.split('.')[-1]}_upsert_staging"
+        columns = ', '.join(f'`{column}`' for column in df.columns)
+        updates = ', '.join(f'`{column}` = VALUES(`{column}`)' for column in df.columns
+                            if column not in set(key_columns))
+        if not updates:
+            updates = f'`{df.columns[0]}` = `{df.columns[0]}`'  # every column is a key: keep existing rows
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                # Temporary tables are private to this connection, so parallel loaders do not collide.
+                # CREATE ... SELECT copies the column types without the target's partitioning or keys.
+                cursor.execute(f'DROP TEMPORARY TABLE IF EXISTS {staging}')
+                cursor.execute(f'CREATE TEMPORARY TABLE {staging} SELECT * FROM {table_name} WHERE 1 = 0')
+            method = self._bulk_load(df, staging, connection)
+            with connection.cursor() as cursor:
+                cursor.execute(f'INSERT INTO {table_name} ({columns}) SELECT {columns} FROM {staging} '
+                               f'ON DUPLICATE KEY UPDATE {updates}')
+                cursor.execute(f'DROP TEMPORARY TABLE {staging}')
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        self.bump_table_versions(engine, [table_name])
+        return self._load_stats(method, len(df), start)
+
+    @staticmethod
+    def _load_stats(method, rows, start):
+        seconds = time.perf_counter() - start
+        return {'method': method, 'rows': rows, 'seconds': seconds,
+                'rows_per_sec': rows / seconds if seconds > 0 else float('inf')}
+
+    def _bulk_load(self, df, table_name, connection):
         """
-        df.to_sql(table_name, engine, if_exists='append',
-                  index=False)  # if_exists='append' means that if the table already exists, the data will be appended to it
+        Load a dataframe on a raw DBAPI connection with LOAD DATA LOCAL INFILE, or with multi-row INSERTs
+        when local_infile is disabled. The caller commits.
+
+        Returns:
+            str: 'load_data' or 'executemany'
+        """
+        if df.empty:
+            return 'load_data'
+        try:
+            self._load_data_infile(df, table_name, connection)
+            return 'load_data'
+        except (pymysql.err.OperationalError, pymysql.err.ProgrammingError) as e:
+            # local_infile disabled on the server or the connection: nothing was loaded, use INSERTs instead
+            logger.warning(f'LOAD DATA LOCAL INFILE unavailable for {table_name} ({e}); using multi-row INSERTs')
+            self._insert_executemany(df, table_name, connection)
+            return 'executemany'
+
+    @staticmethod
+    def _bulk_chunk_rows(df, target_bytes=4 * 1024 * 1024):
+        """
+        Number of rows per INSERT so that one statement stays around target_bytes, well under the
+        default max_allowed_packet (16MB on MariaDB).
+        """
+        row_bytes = max(1, int(df.memory_usage(index=False, deep=True).sum() / max(len(df), 1)))
+        return max(1, min(len(df), target_bytes // row_bytes))
+
+    @staticmethod
+    def _bulk_frame(df):
+        """Booleans as 0/1 so MySQL accepts them from text."""
+        bool_columns = df.select_dtypes(include='bool').columns
+        if len(bool_columns):
+            df = df.astype({column: 'int8' for column in bool_columns})
+        return df
+
+    def _load_data_infile(self, df, table_name, connection):
+        """Write the dataframe to a temporary CSV file and load it with LOAD DATA LOCAL INFILE."""
+        columns = ', '.join(f'`{column}`' for column in df.columns)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'bulk_load.csv').replace(os.sep, '/')
+            # With ENCLOSED BY set, an unquoted NULL field is read as SQL NULL
+            self._bulk_frame(df).to_csv(path, index=False, header=False, na_rep='NULL', lineterminator='\n',
+                                        quoting=csv.QUOTE_MINIMAL, quotechar='"', doublequote=True,
+                                        date_format='%Y-%m-%d %H:%M:%S', encoding='utf-8')
+            statement = (f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table_name} CHARACTER SET utf8mb4 "
+                         f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                         f"LINES TERMINATED BY '\\n' ({columns})")
+            with connection.cursor() as cursor:
+                cursor.execute(statement)
+
+    def _insert_executemany(self, df, table_name, connection):
+        """Insert the dataframe in chunks; pymysql sends each executemany chunk as multi-row INSERTs."""
+        df = self._bulk_frame(df)
+        columns = ', '.join(f'`{column}`' for column in df.columns)
+        statement = (f'INSERT INTO {table_name} ({columns}) '
+                     f"VALUES ({', '.join(['%s'] * len(df.columns))})")
+        chunk_rows = self._bulk_chunk_rows(df)
+        with connection.cursor() as cursor:
+            for start in range(0, len(df), chunk_rows):
+                chunk = df.iloc[start:start + chunk_rows].astype(object)
+                chunk = chunk.where(chunk.notna(), None)
+                cursor.executemany(statement, list(chunk.itertuples(index=False, name=None)))
 
     def db_delete_rows(self, table_name, engine, where_clause):
         """
@@ -56,31 +332,555 @@ class Database:
             """
         with engine.connect() as con:
             con.execute(f'DELETE FROM {table_name} WHERE {where_clause}')
+        self.bump_table_versions(engine, [table_name])
 
-    def db_pull(self, query, uri):
+    def db_pull(self, query, uri, partition_column=None, partitions=None, max_workers=4, lazy=False, spill_dir=None,
+                cache=True):
         """
         Pull data from a MySQL database.
+        With partition_column and partitions, the query is read one partition at a time, each over its own
+        connection, up to max_workers partitions in parallel. A partition is either a value (partition_column = value)
+        or a (low, high) tuple (partition_column BETWEEN low AND high), e.g. range(2015, 2024) for YEAR_ID or
+        date_partitions(start, end) for GAME_DATE. partition_column must be a column of the query's result.
+        With a result_cache_dir, results are kept there as Parquet files keyed by the normalized SQL, the connection
+        and the version of the tables the query reads (see table_version()). A repeated pull of unchanged tables is
+        a memory-mapped read of the file instead of a database round trip. Queries whose tables have no version
+        (views, temporary tables, tables never loaded through bump_table_versions()) are not cached.
         Args:
             query (str): SQL query to define what data to populate the polars df with.
             uri (str): The uri object to use to connect to the database.
+            partition_column (str): Column to split the query on (e.g. YEAR_ID, GAME_DATE).
+            partitions (iterable): Partition values or (low, high) tuples; required with partition_column.
+            max_workers (int): Partitions read in parallel.
+            lazy (bool): Spill each partition to a Parquet file as soon as it is read and return a pl.LazyFrame
+                scanning the files, so the full result is never held in memory and projections and filters are
+                pushed down to the scan.
+            spill_dir (str): Directory of the spilled files (default: a new temporary directory). The files are read
+                whenever the LazyFrame is collected; delete the directory once it is no longer needed.
+            cache (bool): Use the result cache, if there is one.
 
         Returns:
-            Data from mysql table as a polars dataframe.
+            Data from mysql table as a polars dataframe, or a LazyFrame when lazy is True.
         """
-        df = pl.read_sql(query, uri)
-        return df
+        if partition_column is None:
+            queries = [query]
+        else:
+            if partitions is None:
+                raise ValueError('partitions is required with partition_column')
+            queries = [self._partition_query(query, partition_column, partition) for partition in partitions]
+            if not queries:
+                raise ValueError('partitions is empty')
+
+        cache_path = self._result_cache_path(queries, uri) if cache and self.result_cache_dir is not None else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                os.utime(cache_path)  # last use, for the LRU eviction
+                return pl.scan_parquet(cache_path) if lazy else pl.read_parquet(cache_path, memory_map=True)
+            except FileNotFoundError:
+                pass  # evicted by another process in between
+
+        temporary_spill_dir = lazy and not spill_dir
+        if lazy:
+            spill_dir = Path(spill_dir) if spill_dir else Path(tempfile.mkdtemp(prefix='db_pull_'))
+            spill_dir.mkdir(parents=True, exist_ok=True)
+
+        def read(numbered_query):
+            number, partition_query = numbered_query
+            df = pl.read_database_uri(partition_query, uri)
+            # Empty partitions are not spilled: their column types are unknown and would not match the others
+            if not lazy or df.height == 0:
+                return df
+            path = spill_dir / 'part_{:05d}.parquet'.format(number)
+            df.write_parquet(path)
+            return path
+
+        if len(queries) == 1:
+            results = [read((0, queries[0]))]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(read, enumerate(queries)))
+
+        if lazy:
+            paths = [str(path) for path in results if isinstance(path, Path)]
+            if not paths:
+                paths = [str(spill_dir / 'part_00000.parquet')]
+                results[0].write_parquet(paths[0])
+            result = pl.scan_parquet(paths)
+        else:
+            frames = [df for df in results if df.height > 0] or results[:1]
+            result = frames[0] if len(frames) == 1 else pl.concat(frames, how='vertical_relaxed')
+
+        if cache_path is not None:
+            self._store_result(cache_path, result)
+            if lazy:
+                # The cached file replaces the spilled partitions
+                if temporary_spill_dir:
+                    shutil.rmtree(spill_dir, ignore_errors=True)
+                return pl.scan_parquet(cache_path)
+        return result
+
+    @staticmethod
+    def normalize_sql(query):
+        """
+        Canonical text of a query for the result cache: comments removed, whitespace outside string literals
+        collapsed, trailing semicolons dropped. Letter case is kept, since it shows in column aliases and literals.
+        """
+        parts = re.split(r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*")""", query)
+        for i in range(0, len(parts), 2):
+            text = re.sub(r'/\*.*?\*/', ' ', parts[i], flags=re.S)
+            text = re.sub(r'(--\s|#)[^\n]*', ' ', text)
+            parts[i] = re.sub(r'\s+', ' ', text)
+        return ''.join(parts).strip().rstrip(';').strip()
+
+    def query_tables(self, query, database=None):
+        """
+        Tables a query reads, from its FROM and JOIN clauses.
+        Args:
+            database (str): Database of the tables without a schema (default: this instance's database).
+
+        Returns:
+            list of (schema, table) tuples.
+        """
+        tables = set()
+        names = re.findall(r'\b(?:FROM|JOIN)\s+(`?\w+`?(?:\s*\.\s*`?\w+`?)?)', self.normalize_sql(query), flags=re.I)
+        for name in names:
+            name = [part.strip().strip('`') for part in name.split('.')]
+            tables.add((name[0], name[1]) if len(name) == 2 else (database or self.db, name[0]))
+        return sorted(tables)
+
+    def table_version(self, tables, engine=None):
+        """
+        Version of a set of tables, for the result cache.
+        Made of each table's load version (see bump_table_versions()) and the partitions listed for it in
+        information_schema. The load version is what changes on every load: InnoDB row counts are estimates,
+        update times are often NULL, and neither moves on an ON DUPLICATE KEY UPDATE upsert. The partition list
+        adds tables dropped, recreated or repartitioned by hand.
+        Args:
+            tables (list): (schema, table) tuples (see query_tables()).
+            engine (sqlalchemy.engine.base.Engine): Engine of the database holding the tables (default: db_connect()).
+
+        Returns:
+            list of rows, or None when a table has no load version yet (never loaded since versions were kept,
+            views, temporary tables).
+        """
+        if not tables:
+            return None
+        conditions = ' OR '.join('(TABLE_SCHEMA = :schema{0} AND TABLE_NAME = :table{0})'.format(i)
+                                 for i in range(len(tables)))
+        params = {}
+        for i, (schema, table) in enumerate(tables):
+            params['schema{}'.format(i)] = schema
+            params['table{}'.format(i)] = table
+        versions_query = sqlalchemy.text(
+            'SELECT TABLE_SCHEMA, TABLE_NAME, version FROM {} WHERE {} '
+            'ORDER BY TABLE_SCHEMA, TABLE_NAME'.format(self.LOAD_VERSION_TABLE, conditions))
+        partitions_query = sqlalchemy.text(
+            'SELECT TABLE_SCHEMA, TABLE_NAME, PARTITION_NAME, CREATE_TIME '
+            'FROM information_schema.PARTITIONS WHERE {} '
+            'ORDER BY TABLE_SCHEMA, TABLE_NAME, PARTITION_NAME'.format(conditions))
+        with (engine or self.db_connect()).connect() as connection:
+            try:
+                versions = [tuple(row) for row in connection.execute(versions_query, params)]
+            except sqlalchemy.exc.ProgrammingError:
+                return None  # no load has created the version table yet
+            partitions = [tuple(row) for row in connection.execute(partitions_query, params)]
+        if len(versions) < len(tables):
+            return None
+        return versions + partitions
+
+    def bump_table_versions(self, engine, tables):
+        """
+        Record a load of the given tables, so db_pull results cached from them are not reused.
+        db_insert, db_upsert and db_delete_rows call this for their table, and the SQL stage runs for the tables
+        they write; other writes (manual loads, other tools) should call it too. Call it once for tables loaded
+        before versions were kept to make them cacheable.
+        Args:
+            engine (sqlalchemy.engine.base.Engine): Engine of the database holding the tables.
+            tables (iterable): Table names, optionally schema-qualified (default: the engine's database).
+        """
+        tables = list(tables)
+        names = [table.split('.', 1) if '.' in table else (None, table) for table in tables]
+        if not names:
+            return
+        try:
+            with engine.begin() as connection:
+                connection.execute(sqlalchemy.text(
+                    'CREATE TABLE IF NOT EXISTS {} ('
+                    'TABLE_SCHEMA VARCHAR(64) NOT NULL, TABLE_NAME VARCHAR(64) NOT NULL, '
+                    'version BIGINT NOT NULL, loaded_at DATETIME NOT NULL, '
+                    'PRIMARY KEY (TABLE_SCHEMA, TABLE_NAME))'.format(self.LOAD_VERSION_TABLE)))
+                for schema, table in names:
+                    connection.execute(sqlalchemy.text(
+                        'INSERT INTO {} (TABLE_SCHEMA, TABLE_NAME, version, loaded_at) '
+                        'VALUES (COALESCE(:schema, DATABASE()), :table, 1, NOW()) '
+                        'ON DUPLICATE KEY UPDATE version = version + 1, loaded_at = NOW()'.format(self.LOAD_VERSION_TABLE)),
+                        {'schema': schema, 'table': table})
+        except Exception as e:
+            logger.warning(f'Could not record the load of {", ".join(tables)} ({e}); cached db_pull results of these '
+                           f'tables may be stale')
+
+    def _result_cache_path(self, queries, uri):
+        """
+        Cache file of a pull, or None when the tables it reads have no version.
+        The versions are read over uri itself, so they belong to the database the pull reads, whatever this
+        instance's own connection parameters are.
+        """
+        engine = self.uri_engine(uri)
+        version = self.table_version(self.query_tables(' '.join(queries), engine.url.database), engine)
+        if version is None:
+            return None
+        key = json.dumps({'uri': uri, 'queries': [self.normalize_sql(query) for query in queries], 'version': version},
+                         default=str)
+        return self.result_cache_dir / '{}.parquet'.format(hashlib.sha256(key.encode()).hexdigest())
+
+    def _store_result(self, path, result):
+        """Write a pull result (DataFrame or LazyFrame) to the result cache, then trim the cache."""
+        self.result_cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name('.{}.{}.{}.tmp'.format(path.name, os.getpid(), threading.get_ident()))
+        if isinstance(result, pl.LazyFrame):
+            result.sink_parquet(tmp_path)
+        else:
+            result.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        self._evict_results(keep=path)
+
+    def _evict_results(self, keep=None):
+        """Delete the least recently used results until the cache fits result_cache_max_bytes."""
+        with self._result_cache_lock:
+            files = []
+            for path in self.result_cache_dir.glob('*.parquet'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.result_cache_max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    @staticmethod
+    def _partition_query(query, partition_column, partition):
+        """Wrap a query in a filter on one partition of partition_column."""
+        if not re.fullmatch(r'\w+', partition_column):
+            raise ValueError('Invalid partition column: {}'.format(partition_column))
+
+        def literal(value):
+            if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+                return str(value)
+            if isinstance(value, (datetime.date, datetime.datetime)):
+                value = value.isoformat()
+            return "'{}'".format(str(value).replace('\\', '\\\\').replace("'", "''"))
+
+        if isinstance(partition, tuple):
+            low, high = partition
+            condition = '{} BETWEEN {} AND {}'.format(partition_column, literal(low), literal(high))
+        else:
+            condition = '{} = {}'.format(partition_column, literal(partition))
+        return 'SELECT * FROM ({}) AS db_pull_partition WHERE {}'.format(query.strip().rstrip(';'), condition)
+
+    @staticmethod
+    def date_partitions(start, end, days=7):
+        """
+        Split a date range into (low, high) partitions of db_pull.
+        Args:
+            start: First date (datetime.date or YYYY-MM-DD).
+            end: Last date, inclusive.
+            days (int): Days per partition.
+
+        Returns:
+            list of (low, high) datetime.date tuples covering start through end.
+        """
+        start, end = (datetime.date.fromisoformat(str(day)[:10]) for day in (start, end))
+        partitions = []
+        while start <= end:
+            high = min(end, start + datetime.timedelta(days=days - 1))
+            partitions.append((start, high))
+            start = high + datetime.timedelta(days=1)
+        return partitions
+
+
+class PlayerCrosswalk:
+    """
+    MLBAM -> Retrosheet player ID crosswalk built from the Chadwick register.
+    The register is kept on disk and loaded once per process (see shared()) into a hash index, so whole ID
+    arrays are mapped in one vectorized call. The disk copy is refreshed from the register only when IDs
+    that are not in it show up, at most once per process. IDs in the register without a Retrosheet key
+    (e.g. players who never reached the majors) do not trigger a refresh.
+    """
+    DEFAULT_PATH = DATA_DIR / 'player_crosswalk.parquet'
+    COLUMNS = ['name_last', 'name_first', 'key_mlbam', 'key_retro', 'key_bbref', 'key_fangraphs',
+               'mlb_played_first', 'mlb_played_last']
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Parquet copy of the crosswalk (default: player_crosswalk.parquet in DATA_DIR).
+        """
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self._lock = threading.Lock()
+        self._refreshed = False
+        if self.path.exists():
+            self._set_table(pd.read_parquet(self.path))
+        else:
+            self.refresh()
+
+    @classmethod
+    def shared(cls, path=None):
+        """The process-wide crosswalk for a path, loaded on first use."""
+        key = Path(path) if path else cls.DEFAULT_PATH
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+    def _set_table(self, table):
+        table = table.drop_duplicates('key_mlbam').reset_index(drop=True)
+        # Swapped as one tuple so threads mapping IDs during a refresh see a consistent index
+        self._state = (table, pd.Index(table['key_mlbam']), table['key_retro'].to_numpy(dtype=object, na_value=None))
+
+    def refresh(self, once=False):
+        """
+        Reload the Chadwick register and rewrite the disk copy.
+        Args:
+            once (bool): Skip the reload if this process has already refreshed the crosswalk.
+        """
+        with self._lock:
+            if once and self._refreshed:
+                return
+            register = chadwick_register()
+            register = register[register['key_mlbam'].notna()].copy()
+            register['key_mlbam'] = register['key_mlbam'].astype('int64')
+            # Same name format as pybaseball.playerid_reverse_lookup
+            register['name_last'] = register['name_last'].str.lower()
+            register['name_first'] = register['name_first'].str.lower()
+            register = register[[column for column in self.COLUMNS if column in register.columns]]
+            register['key_retro'] = register['key_retro'].where(register['key_retro'].notna(), None)
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f'.{self.path.name}.{os.getpid()}.tmp')
+            register.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self.path)
+
+            self._set_table(register)
+            self._refreshed = True
+
+    def _positions(self, mlb_ids):
+        """
+        Row of each ID in the table (-1 if unknown), refreshing once if some IDs are not in the table.
+
+        Returns:
+            tuple: (table, retro_ids, positions)
+        """
+        ids = pd.to_numeric(pd.Series(mlb_ids), errors='coerce').astype('Int64')
+        table, index, retro_ids = self._state
+        positions = index.get_indexer(ids)
+        unknown = ids.notna().to_numpy() & (positions == -1)
+        if unknown.any() and not self._refreshed:
+            logger.info(f'{int(unknown.sum())} player IDs not in {self.path.name}; refreshing from the Chadwick register')
+            self.refresh(once=True)
+            table, index, retro_ids = self._state
+            positions = index.get_indexer(ids)
+        return table, retro_ids, positions
+
+    def to_retro(self, mlb_ids):
+        """
+        Map MLBAM IDs to Retrosheet IDs.
+        Args:
+            mlb_ids (array-like): MLBAM player IDs (NaN allowed).
+
+        Returns:
+            np.ndarray: Retrosheet IDs aligned with mlb_ids, None where there is no mapping.
+        """
+        _, retro_ids, positions = self._positions(mlb_ids)
+        return np.where(positions >= 0, retro_ids[positions], None)
+
+    def lookup(self, mlb_ids):
+        """
+        Register rows for a set of MLBAM IDs, in the format of pybaseball.playerid_reverse_lookup.
+        Args:
+            mlb_ids (array-like): MLBAM player IDs.
+
+        Returns:
+            pd.DataFrame: One row per known ID.
+        """
+        table, _, positions = self._positions(pd.unique(pd.Series(mlb_ids).dropna()))
+        return table.iloc[positions[positions >= 0]].reset_index(drop=True)
 
 
 class WebScrape(Database):
-    def __init__(self, uid, pwd, host, db, port):
+    # Search page holding the weather card; point it at a local server to replay saved pages
+    WEATHER_URL = ('https://www.google.com/search?q={query}&oq={query}'
+                   '&aqs=chrome.0.35i39l2j0l4j46j69i60.6128j1j7&sourceid=chrome&ie=UTF-8')
+
+    # Pitch-level Statcast search CSV for one date (the search savant_csv.fetch_savant_csv runs)
+    STATCAST_CSV_URL = f'{SAVANT_CSV_URL}?{urlencode(SAVANT_CSV_PARAMS)}&game_date_gt={{date}}&game_date_lt={{date}}'
+
+    DEFAULT_HTTP_CACHE_DIR = DATA_DIR / 'http_cache'
+
+    # Lineup page position -> Retrosheet fielding code (0: no position found)
+    LINEUP_POSITIONS = {
+        'P': 1,
+        'C': 2,
+        '1B': 3,
+        '2B': 4,
+        '3B': 5,
+        'SS': 6,
+        'LF': 7,
+        'CF': 8,
+        'RF': 9,
+        'DH': 10,
+        0: 999
+    }
+
+    # Lineup page team name -> Retrosheet team code
+    LINEUP_TEAMS = {
+        "Angels": "ANA",
+        "Astros": "HOU",
+        "Athletics": "OAK",
+        "Blue Jays": "TOR",
+        "Braves": "ATL",
+        "Brewers": "MIL",
+        "Cardinals": "SLN",
+        "Cubs": "CHI",
+        "Diamondbacks": "ARI",
+        "Dodgers": "LAN",
+        "Giants": "SFN",
+        "Guardians": "CLE",
+        "Mariners": "SEA",
+        "Marlins": "MIA",
+        "Mets": "NYN",
+        "Nationals": "WAS",
+        "Orioles": "BAL",
+        "Padres": "SDN",
+        "Phillies": "PHI",
+        "Pirates": "PIT",
+        "Rangers": "TEX",
+        "Rays": "TBA",
+        "Red Sox": "BOS",
+        "Reds": "CIN",
+        "Rockies": "COL",
+        "Royals": "KCA",
+        "Tigers": "DET",
+        "Twins": "MIN",
+        "White Sox": "CHA",
+        "Yankees": "NYA",
+    }
+
+    # Parsed weather per (URL, city), shared by every instance in the process: {key: (fetched_at, df)}
+    _weather_cache = {}
+    _weather_cache_lock = threading.Lock()
+
+    def __init__(self, uid, pwd, host, db, port, weather_ttl=3600, max_workers=8, http_cache_dir=DEFAULT_HTTP_CACHE_DIR):
+        """
+        Args:
+            weather_ttl (float): Seconds a city's weather is reused before it is fetched again (0 disables the cache).
+            max_workers (int): Concurrent requests of get_weathers(), and keep-alive connections per host.
+            http_cache_dir (str): On-disk response cache revalidated with ETag/Last-Modified (None disables it).
+        """
         super().__init__(uid, pwd, host, db, port)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
         }
+        self.weather_ttl = weather_ttl
+        self.max_workers = max_workers
+        # One keep-alive session for every request, with a connection per worker thread
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.http_cache_dir = Path(http_cache_dir) if http_cache_dir else None
+        # Parsed pages per URL, reused while the server answers 304: {url: (validator, result)}
+        self._parsed = {}
+
+    def _get(self, url):
+        """
+        GET a page through the session and the on-disk response cache.
+
+        A cached response is revalidated with If-None-Match / If-Modified-Since; on 304 the cached body is
+        returned without downloading it again. Responses without an ETag or Last-Modified header are not cached.
+
+        Args:
+            url (str): Page to fetch.
+
+        Returns:
+            tuple: (body text, validator) where validator is the ETag or Last-Modified value of the body
+            (None if the server sends neither).
+        """
+        if self.http_cache_dir is None:
+            res = self.session.get(url, timeout=30)
+            res.raise_for_status()
+            return res.text, None
+
+        key = hashlib.sha256(url.encode()).hexdigest()
+        body_path = self.http_cache_dir / f'{key}.body'
+        meta_path = self.http_cache_dir / f'{key}.json'
+        meta = None
+        headers = {}
+        if meta_path.exists() and body_path.exists():
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        res = self.session.get(url, headers=headers, timeout=30)
+        if res.status_code == 304 and meta is not None:
+            return body_path.read_bytes().decode(meta.get('encoding') or 'utf-8', errors='replace'), \
+                meta.get('etag') or meta.get('last_modified')
+        res.raise_for_status()
+
+        etag, last_modified = res.headers.get('ETag'), res.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.http_cache_dir.mkdir(parents=True, exist_ok=True)
+            suffix = f'{os.getpid()}.{threading.get_ident()}.tmp'
+            body_tmp, meta_tmp = body_path.with_name(f'.{body_path.name}.{suffix}'), meta_path.with_name(f'.{meta_path.name}.{suffix}')
+            body_tmp.write_bytes(res.content)
+            with open(meta_tmp, 'w') as f:
+                json.dump({'url': url, 'etag': etag, 'last_modified': last_modified, 'encoding': res.encoding}, f)
+            os.replace(body_tmp, body_path)
+            os.replace(meta_tmp, meta_path)
+        return res.text, etag or last_modified
+
+    def _get_parsed(self, url, parse):
+        """
+        Fetch a page with _get() and parse it, reusing the last parse of the URL while the page is unchanged.
+
+        Args:
+            url (str): Page to fetch.
+            parse (callable): Function of the page text returning the result.
+
+        Returns:
+            The parsed result (a copy of tuples of DataFrames / DataFrames when reused).
+        """
+        text, validator = self._get(url)
+        cached = self._parsed.get(url)
+        if validator is not None and cached is not None and cached[0] == validator:
+            result = cached[1]
+        else:
+            result = parse(text)
+            if validator is not None:
+                self._parsed[url] = (validator, result)
+        if isinstance(result, tuple):
+            return tuple(part.copy() for part in result)
+        return result.copy()
 
     def get_weather(self, city):
         """
         This function takes a city name as input and returns a dataframe containing the weather information for that city.
+        Results are reused for weather_ttl seconds.
 
         city: str
             The name of the city for which to get weather information.
@@ -92,11 +892,56 @@ class WebScrape(Database):
         if not isinstance(city, str):
             raise TypeError("'city' must be a string")
 
-        city = city + " weather"
-        res = requests.get(
-            f'https://www.google.com/search?q={city}&oq={city}&aqs=chrome.0.35i39l2j0l4j46j69i60.6128j1j7&sourceid=chrome&ie=UTF-8',
-            headers=self.headers)
-        soup = BeautifulSoup(res.text, 'html.parser')
+        key = (self.WEATHER_URL, city)
+        with self._weather_cache_lock:
+            cached = self._weather_cache.get(key)
+        if cached is not None and time.time() - cached[0] < self.weather_ttl:
+            return cached[1].copy()
+
+        df = self._fetch_weather(city)
+        with self._weather_cache_lock:
+            self._weather_cache[key] = (time.time(), df)
+        return df.copy()
+
+    def get_weathers(self, cities):
+        """
+        Weather for several cities (e.g. every park on a slate), fetched and parsed concurrently.
+        Requests share the keep-alive session, and cities fetched within weather_ttl seconds are not requested again.
+
+        cities: list of str
+            The names of the cities for which to get weather information.
+
+        returns: pd.DataFrame
+            One row per city, in the order given, with a CITY column. Cities whose page could not be fetched or
+            parsed are left out with a warning.
+        """
+        cities = list(dict.fromkeys(cities))
+
+        def fetch(city):
+            try:
+                return city, self.get_weather(city), None
+            except Exception as e:
+                return city, None, e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(cities)))) as executor:
+            results = list(executor.map(fetch, cities))
+
+        frames = []
+        for city, df, error in results:
+            if error is not None:
+                logger.warning(f'Weather for {city} unavailable: {error}')
+                continue
+            df.insert(0, 'CITY', city)
+            frames.append(df)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def _fetch_weather(self, city):
+        """Download and parse one city's weather card (see get_weather)."""
+        query = city + " weather"
+        text, _ = self._get(self.WEATHER_URL.format(query=query))
+        soup = BeautifulSoup(text, 'html.parser')
         Location = soup.select('#wob_loc')[0].getText()
         TIME = soup.select('#wob_dts')[0].getText()
         WEATHER_PARK_CD = soup.select('#wob_dc')[0].getText()
@@ -118,6 +963,8 @@ class WebScrape(Database):
 
         """
             Scrape the lineup information for a given date from the baseballpress.com website.
+            The page is revalidated against the response cache, so polling an unchanged page costs a 304
+            and no parse.
 
             Parameters:
             date (str): The date of the game for which the lineup is being scraped.
@@ -128,11 +975,87 @@ class WebScrape(Database):
         if not isinstance(date, str):
             raise TypeError("'date' must be a string in the format 'YYYYMMDD'")
 
-        res = requests.get(f"https://www.baseballpress.com/lineups/{date}", headers=self.headers)
+        return self._get_parsed(f"https://www.baseballpress.com/lineups/{date}",
+                                lambda text: self._parse_lineups(text, date))
+
+    # Lineup row text, e.g. "1. Mookie Betts (R) RF": batters start with their slot, pitchers have none
+    _LINEUP_SLOT = re.compile(r'^\d\. ')
+    _ANY_SLOT = re.compile(r'\d\. ')
+    _DIGIT = re.compile(r'(\d)')
+    _HAND = re.compile(r'\b(R|L|S)\b')
+    _POSITION = re.compile(r'\b(CF|RF|LF|1B|2B|3B|SS|C|DH)\b')
 
-        soup = BeautifulSoup(res.text, 'html.parser')
+    def _parse_lineups(self, text, date):
+        """
+        Parse a baseballpress.com lineup page (see get_lineups).
+
+        One pass over the lxml tree collects the player rows, player ids and team logos in document order, and each
+        row's slot, position and handedness come from precompiled regexes. Same output as _parse_lineups_soup(),
+        which is used when lxml is not installed.
+        """
+        if lxml_html is None:
+            return self._parse_lineups_soup(text, date)
 
-        date_obj = datetime.strptime(date, '%Y-%m-%d')
+        yyyymmdd = datetime.datetime.strptime(date, '%Y-%m-%d').strftime('%Y%m%d')
+        player_ids, player_rows, teams = [], [], []
+        for element in lxml_html.fromstring(text).iter(lxml_etree.Element):
+            classes = element.get('class')
+            if not classes:
+                continue
+            classes = classes.split()
+            if 'player-link' in classes:
+                player_ids.append(element.attrib['data-bref'])
+            if element.tag == 'div' and 'player' in classes:
+                player_rows.append(element.text_content())
+            elif element.tag == 'a' and 'mlb-team-logo' in classes and 'bc' in classes:
+                teams.append(element.text_content().strip())
+        if len(player_ids) != len(player_rows):
+            raise ValueError(f'{len(player_ids)} player links but {len(player_rows)} player rows')
+
+        batters = {column: [] for column in ('BAT_ID', 'BAT_LINEUP_ID', 'POSITION', 'BAT_HAND_CD', 'BAT_FLD_CD')}
+        pitchers = {'PIT_ID': [], 'PIT_HAND_CD': []}
+        batter_index, pitcher_index = [], []
+        for row, (player_id, player_row) in enumerate(zip(player_ids, player_rows)):
+            hand = self._HAND.search(player_row)
+            if self._LINEUP_SLOT.match(player_row):
+                position = self._POSITION.search(player_row)
+                position = position.group(1) if position else 0
+                batters['BAT_ID'].append(player_id)
+                batters['BAT_LINEUP_ID'].append(self._DIGIT.search(player_row).group(1))
+                batters['POSITION'].append(position)
+                batters['BAT_HAND_CD'].append(hand.group(1) if hand else 0)
+                batters['BAT_FLD_CD'].append(self.LINEUP_POSITIONS[position])
+                batter_index.append(row)
+            elif not self._ANY_SLOT.search(player_row):
+                pitchers['PIT_ID'].append(player_id)
+                pitchers['PIT_HAND_CD'].append(hand.group(1) if hand else np.nan)
+                pitcher_index.append(row)
+
+        away_teams = teams[::2]
+        home_teams = [team for team in teams if team not in away_teams]
+        game_ids = [self.LINEUP_TEAMS[team] + yyyymmdd for team in home_teams]
+
+        # Each frame is built in one constructor call: adding columns one at a time costs more than the parse
+        batters = pd.DataFrame({
+            'BAT_ID': batters['BAT_ID'],
+            'TEAM': [team for team in teams for i in range(9)],
+            **{column: values for column, values in batters.items() if column != 'BAT_ID'},
+            'AWAY_TEAM_ID': [team for team in away_teams for i in range(18)],
+            'HOME_TEAM_ID': [team for team in home_teams for i in range(18)],
+            'GAME_ID': [game_id for game_id in game_ids for i in range(18)],
+        }, index=batter_index)
+        pitchers = pd.DataFrame(dict(pitchers, **{
+            'AWAY_TEAM_ID': [team for team in away_teams for i in range(2)],
+            'HOME_TEAM_ID': [team for team in home_teams for i in range(2)],
+            'GAME_ID': [game_id for game_id in game_ids for i in range(2)],
+        }), index=pitcher_index)
+        return batters, pitchers
+
+    def _parse_lineups_soup(self, text, date):
+        """Parse a baseballpress.com lineup page with BeautifulSoup (see _parse_lineups)."""
+        soup = BeautifulSoup(text, 'html.parser')
+
+        date_obj = datetime.datetime.strptime(date, '%Y-%m-%d')
         yyyymmdd = date_obj.strftime('%Y%m%d')
 
         player_long = soup.find_all('div', attrs={'class': 'player'})
@@ -157,56 +1080,11 @@ class WebScrape(Database):
         batters['POSITION'] = batters['player_long'].str.extract(r'\b(CF|RF|LF|1B|2B|3B|SS|C|DH)\b')
         batters['BAT_HAND_CD'] = batters['player_long'].str.extract(r'\b(R|L|S)\b')
 
-        position_mapping = {
-            'P': 1,
-            'C': 2,
-            '1B': 3,
-            '2B': 4,
-            '3B': 5,
-            'SS': 6,
-            'LF': 7,
-            'CF': 8,
-            'RF': 9,
-            'DH': 10,
-            0: 999
-        }
-
-        mlb_teams = {
-            "Angels": "ANA",
-            "Astros": "HOU",
-            "Athletics": "OAK",
-            "Blue Jays": "TOR",
-            "Braves": "ATL",
-            "Brewers": "MIL",
-            "Cardinals": "SLN",
-            "Cubs": "CHI",
-            "Diamondbacks": "ARI",
-            "Dodgers": "LAN",
-            "Giants": "SFN",
-            "Guardians": "CLE",
-            "Mariners": "SEA",
-            "Marlins": "MIA",
-            "Mets": "NYN",
-            "Nationals": "WAS",
-            "Orioles": "BAL",
-            "Padres": "SDN",
-            "Phillies": "PHI",
-            "Pirates": "PIT",
-            "Rangers": "TEX",
-            "Rays": "TBA",
-            "Red Sox": "BOS",
-            "Reds": "CIN",
-            "Rockies": "COL",
-            "Royals": "KCA",
-            "Tigers": "DET",
-            "Twins": "MIN",
-            "White Sox": "CHA",
-            "Yankees": "NYA",
-        }
 
-        batters.fillna(0, inplace=True)
+        # object first: pandas 3 string columns do not take the integer placeholder
+        batters = batters.astype(object).fillna(0)
 
-        batters['BAT_FLD_CD'] = [position_mapping[POSITION] for POSITION in batters['POSITION']]
+        batters['BAT_FLD_CD'] = [self.LINEUP_POSITIONS[POSITION] for POSITION in batters['POSITION']]
 
         batters.rename(columns={'players': 'BAT_ID'}, inplace=True)
         pitchers.rename(columns={'players': 'PIT_ID'}, inplace=True)
@@ -220,20 +1098,21 @@ class WebScrape(Database):
         pitchers['AWAY_TEAM_ID'] = [team for team in AWAY_TEAM_ID for i in range(2)]
         pitchers['HOME_TEAM_ID'] = [team for team in HOME_TEAM_ID for i in range(2)]
 
-        batters['GAME_ID'] = [mlb_teams[team] for team in batters['HOME_TEAM_ID']]
+        batters['GAME_ID'] = [self.LINEUP_TEAMS[team] for team in batters['HOME_TEAM_ID']]
         batters['GAME_ID'] = batters['GAME_ID'] + yyyymmdd
 
-        pitchers['GAME_ID'] = [mlb_teams[team] for team in pitchers['HOME_TEAM_ID']]
+        pitchers['GAME_ID'] = [self.LINEUP_TEAMS[team] for team in pitchers['HOME_TEAM_ID']]
         pitchers['GAME_ID'] = pitchers['GAME_ID'] + yyyymmdd
 
-        batters.drop(columns=['player_long'], axis=1, inplace=True)
-        pitchers.drop(columns=['player_long'], axis=1, inplace=True)
+        batters.drop(columns=['player_long'], inplace=True)
+        pitchers.drop(columns=['player_long'], inplace=True)
 
         return batters, pitchers
 
     def get_stats(self, date):
         """
-        Use the pybaseball package to get the stats for a given date.
+        Get the pitch-level Statcast data for a given date from Baseball Savant (the search pybaseball's
+        statcast() runs), through the session and the response cache.
         :param date:
         :return stats:
         """
@@ -241,10 +1120,10 @@ class WebScrape(Database):
         if not isinstance(date, str):
             raise TypeError("'date' must be a string in the format 'YYYYMMDD'")
 
-        date_obj = datetime.strptime(date, '%Y-%m-%d')
+        date_obj = datetime.datetime.strptime(date, '%Y-%m-%d')
         yyyymmdd = date_obj.strftime('%Y%m%d')
 
-        stats = statcast(date, date)
+        stats = self._get_parsed(self.STATCAST_CSV_URL.format(date=date), lambda text: pd.read_csv(io.StringIO(text)))
 
         stats.columns = stats.columns.str.upper()
 
@@ -297,8 +1176,9 @@ class WebScrape(Database):
         pitcher_ids = list(stats['PITCHER'].unique())
         batter_ids = list(stats['BATTER'].unique())
 
-        pitchers = playerid_reverse_lookup(pitcher_ids, key_type='mlbam')
-        batters = playerid_reverse_lookup(batter_ids, key_type='mlbam')
+        crosswalk = PlayerCrosswalk.shared()
+        pitchers = crosswalk.lookup(pitcher_ids)
+        batters = crosswalk.lookup(batter_ids)
 
         stats = pd.merge(stats, pitchers, left_on='PITCHER', right_on='key_mlbam', how='left')
         stats = pd.merge(stats, batters, left_on='BATTER', right_on='key_mlbam', how='left')
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lineup-page parsers of WebScrape.get_lineups on saved pages.
+
+Runs the single-pass lxml parser (WebScrape._parse_lineups) and the BeautifulSoup parser
+(WebScrape._parse_lineups_soup) on each page, checks that they return the same batters and
+pitchers, and prints the per-page and total parse times.
+
+Pages are baseballpress.com lineup pages saved as <YYYY-MM-DD>.html (the date is taken from the
+file name). By default the anonymized corpus the tests use, tests/fixtures/lineups, is read (a full
+15-game slate per page, players replaced); more pages can be saved from the response cache or with:
+    curl -o 2024-06-01.html https://www.baseballpress.com/lineups/2024-06-01
+
+Usage:
+    python lineup_parser_benchmark.py
+    python lineup_parser_benchmark.py --pages saved_lineups/
+    python lineup_parser_benchmark.py --pages saved_lineups/2024-06-01.html --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent))
+from create_model_ready import WebScrape, lxml_html
+
+DEFAULT_PAGES = Path(__file__).resolve().parent.parent.parent / 'tests' / 'fixtures' / 'lineups'
+
+
+def _timed(function, repeat):
+    """Best time of repeat runs, and the result of the last one."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the get_lineups parsers on saved lineup pages')
+    parser.add_argument('--pages', default=str(DEFAULT_PAGES),
+                        help='Saved lineup page (<YYYY-MM-DD>.html) or a directory of them '
+                             '(default: tests/fixtures/lineups)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per page; the best time is kept (default: 5)')
+    args = parser.parse_args()
+
+    if lxml_html is None:
+        sys.exit('lxml is not installed; get_lineups uses the BeautifulSoup parser')
+
+    path = Path(args.pages)
+    pages = sorted(path.glob('*.html')) if path.is_dir() else [path]
+    if not pages:
+        sys.exit(f'No .html pages in {path}')
+
+    scraper = WebScrape('', '', '', '', 0, http_cache_dir=None)
+    print('=' * 60)
+    print(f'Lineup parser benchmark: {len(pages)} pages, best of {args.repeat}')
+    print('=' * 60)
+
+    totals = {'lxml': 0.0, 'soup': 0.0}
+    mismatches = 0
+    for page in pages:
+        text = page.read_text(encoding='utf-8', errors='replace')
+        date = page.stem
+        fast_seconds, fast = _timed(lambda: scraper._parse_lineups(text, date), args.repeat)
+        soup_seconds, soup = _timed(lambda: scraper._parse_lineups_soup(text, date), args.repeat)
+        totals['lxml'] += fast_seconds
+        totals['soup'] += soup_seconds
+
+        try:
+            for fast_frame, soup_frame in zip(fast, soup):
+                pd.testing.assert_frame_equal(fast_frame, soup_frame, check_dtype=False)
+            status = '✓'
+        except AssertionError as e:
+            status = '✗'
+            mismatches += 1
+            print(f'  {page.name}: outputs differ: {e}')
+
+        print(f'{status} {page.name}: {len(fast[0])} batters, {len(fast[1])} pitchers | '
+              f'lxml {fast_seconds * 1000:.2f} ms | BeautifulSoup {soup_seconds * 1000:.2f} ms')
+
+    print('=' * 60)
+    print(f"Total: lxml {totals['lxml'] * 1000:.1f} ms | BeautifulSoup {totals['soup'] * 1000:.1f} ms | "
+          f"speedup {totals['soup'] / totals['lxml']:.1f}x")
+    if mismatches:
+        print(f'✗ {mismatches} pages where the parsers disagree')
+        sys.exit(1)
+    print('✓ Parsers agree on every page')
+
+
+if __name__ == '__main__':
+    main()
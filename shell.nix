@@ -14,6 +14,7 @@ pkgs.mkShell {
     # Database
     python311Packages.sqlalchemy
     python311Packages.pymysql
+    python311Packages.connectorx
 
     # Web scraping
     python311Packages.requests
@@ -27,6 +28,9 @@ pkgs.mkShell {
     # Visualization
     python311Packages.matplotlib
 
+    # Tests
+    python311Packages.pytest
+
     # MySQL/MariaDB CLI tool
     mariadb
     # Jupyter lab
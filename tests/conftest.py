@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The scripts import each other by module name from their own directories
+for directory in (ROOT / 'Code' / 'Data Preparation', ROOT / 'Code' / 'Production'):
+    sys.path.insert(0, str(directory))
+
+
+@pytest.fixture
+def fixtures_dir():
+    """Saved pages and files the tests read instead of the network."""
+    return Path(__file__).resolve().parent / 'fixtures'
+
+
+@pytest.fixture
+def statcast_loader_class(tmp_path, monkeypatch):
+    """StatcastGameLevelLoader, imported from tmp_path: the module opens its log file on import."""
+    monkeypatch.chdir(tmp_path)
+    from pull_statcast_advanced_metrics import StatcastGameLevelLoader
+    return StatcastGameLevelLoader
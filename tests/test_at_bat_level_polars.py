@@ -0,0 +1,114 @@
+import re
+import sqlite3
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from at_bat_level_polars import build_at_bat_level, compare_frames, update_watermark
+from generate_at_bat_level_sql import EVENT_COLUMNS, generate_insert_sql
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'Code' / 'Data Preparation' / 'Data_Processing_DV.sql'
+
+
+def test_update_watermark_skips_games_without_events():
+    empty = pl.DataFrame(schema={'GAME_DATE': pl.Date, 'GAME_ID': pl.Utf8})
+
+    # No rows to take the watermark from: the engine must not be touched
+    assert update_watermark(None, 2024, empty) is None
+
+
+def sql_at_bat_level(events, games, year):
+    """
+    Run the generated at_bat_level SELECT against SQLite, emulating the MariaDB pieces it relies on:
+    the SET @ variables of Data_Processing_DV.sql (in script order) and DECIMAL(5,4) division.
+    """
+    variables = dict(re.findall(r'^SET @(\w+)\s*=\s*([-\d.]+)\s*;', SCRIPT.read_text(), re.MULTILINE))
+    variables['process_year'] = str(year)
+    select = generate_insert_sql().split('\n', 1)[1].rstrip(';')
+    select = re.sub(r'@(\w+)', lambda match: variables[match.group(1)], select)
+    select = re.sub(r'(SUM\(\w+\) OVER \w+) / (NULLIF\(SUM\(\w+\) OVER \w+, 0\))', r'DECIMAL_DIV(\1, \2)', select)
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute("ATTACH DATABASE ':memory:' AS retrosheet")
+    connection.create_function(
+        'STR_TO_DATE', 2, lambda text, fmt: datetime.strptime(text, fmt).date().isoformat())
+    connection.create_function(
+        'DECIMAL_DIV', 2, lambda numerator, denominator: None if denominator is None else float(
+            (Decimal(numerator) / Decimal(denominator)).quantize(Decimal('0.0001'), ROUND_HALF_UP)))
+    for table, frame in (('events', events), ('games', games)):
+        connection.execute(f"CREATE TABLE retrosheet.{table} ({', '.join(frame.columns)})")
+        connection.executemany(f"INSERT INTO retrosheet.{table} VALUES ({', '.join('?' * frame.width)})",
+                               frame.rows())
+    cursor = connection.execute(select)
+    return pl.DataFrame(cursor.fetchall(), schema=[column[0] for column in cursor.description], orient='row',
+                        infer_schema_length=None)
+
+
+def plate_appearance(game_id, inning, bat_id, event_cd, **columns):
+    """One retrosheet.events row with the columns the build reads."""
+    row = dict.fromkeys(EVENT_COLUMNS)
+    row.update(YEAR_ID=2023, GAME_ID=game_id, bat_id=bat_id, INN_CT=inning, EVENT_CD=event_cd, RBI_CT=0,
+               PA_BALL_CT=1, PA_SWINGMISS_STRIKE_CT=0, BAT_HAND_CD='R', PIT_HAND_CD='L',
+               ab_fl='T' if event_cd in (2, 3, 20, 21, 22, 23) else 'F',
+               RUN1_SB_FL='F', RUN2_SB_FL='F', RUN3_SB_FL='F')
+    row.update(columns)
+    return row
+
+
+@pytest.fixture
+def season():
+    """
+    Four games of one season: b1 goes 1 for 32 (season_ba .03125, rounded half up), often batting
+    twice in one inning (window peers), and walks in a run; b2 has no ball counts outside the BOS games.
+    """
+    # GAME_ID order is home team first, so SEA's earlier game sorts after BOS's later one
+    game_ids = ['SEA202304010', 'BOS202304020', 'BOS202304030', 'NYA202304040']
+    rows = []
+    for game_id in game_ids:
+        for inning in range(1, 5):
+            rows.append(plate_appearance(game_id, inning, 'b1', 2, PA_BALL_CT=inning % 3))
+            rows.append(plate_appearance(game_id, inning, 'b1', 3, PA_SWINGMISS_STRIKE_CT=2))
+    rows[0]['EVENT_CD'] = 20
+    rows += [
+        plate_appearance(game_ids[0], 5, 'b1', 14, RBI_CT=1),
+        plate_appearance(game_ids[2], 5, 'b1', 16, PIT_HAND_CD='R'),
+        plate_appearance(game_ids[0], 1, 'b2', 21, RBI_CT=2, PA_BALL_CT=None),
+        plate_appearance(game_ids[0], 2, 'b2', 2, PA_BALL_CT=None),
+        plate_appearance(game_ids[1], 1, 'b2', 14, PA_BALL_CT=4),
+        plate_appearance(game_ids[3], 1, 'b2', 23, RBI_CT=1, BAT_HAND_CD='L', PA_BALL_CT=None),
+    ]
+    for seq, row in enumerate(rows, start=1):
+        row['seq_events'] = seq
+    events = pl.DataFrame(rows, schema_overrides={'PA_BALL_CT': pl.Int64})
+    games = pl.DataFrame({
+        'GAME_ID': game_ids, 'YEAR_ID': 2023, 'TEMP_PARK_CT': [60, 71, 68, 75], 'WIND_DIRECTION_PARK_CD': 'ltor',
+        'WIND_SPEED_PARK_CT': [5, 0, 12, 8], 'PRECIP_PARK_CD': 'none', 'SKY_PARK_CD': 'sunny',
+        'WIN_PIT_ID': 'p1', 'park_id': ['SEA03', 'BOS07', 'BOS07', 'NYC21'], 'DAYNIGHT_PARK_CD': 'N',
+    })
+    return events, games
+
+
+def test_polars_build_matches_sql_semantics(season):
+    events, games = season
+    expected = sql_at_bat_level(events, games, 2023)
+
+    at_bat_level = build_at_bat_level(events, games)
+
+    comparison = compare_frames(expected, at_bat_level, ['YEAR_ID', 'GAME_ID', 'seq_events'])
+    assert comparison['expected_rows'] == comparison['actual_rows'] == events.height
+    assert comparison['missing_rows'] == comparison['extra_rows'] == 0
+    assert comparison['column_mismatches'] == {}
+
+    b1 = at_bat_level.filter(pl.col('bat_id') == 'b1').sort('GAME_ID', 'INN_CT')
+    # Both plate appearances of an inning are peers and share the inning's running totals
+    assert b1['game_ab'].head(2).to_list() == [2, 2]
+    assert b1['season_ab'].max() == 32 and b1['season_hits'].max() == 1
+    assert b1['season_ba'][-1] == pytest.approx(0.0313)
+    # Walks score @walk as it stands after the pitcher points block
+    assert b1.filter(pl.col('EVENT_CD') == 14)['batting_points'].item() == pytest.approx(-0.6 + 2)
+    b2 = at_bat_level.filter(pl.col('bat_id') == 'b2').sort('GAME_ID', 'INN_CT')
+    assert b2['game_balls'].to_list() == [4, None, None, None]
+    assert b2['season_balls'].to_list() == [4, 4, 4, 4]
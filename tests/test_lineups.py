@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from create_model_ready import WebScrape, lxml_html
+
+# Anonymized baseballpress.com pages in fixtures/lineups, each a full 15-game slate
+PAGES = ['2024-06-01', '2024-06-02', '2024-06-03']
+
+
+@pytest.mark.skipif(lxml_html is None, reason='lxml is not installed')
+@pytest.mark.parametrize('date', PAGES)
+def test_lxml_parser_matches_soup_parser(date, fixtures_dir):
+    scraper = WebScrape('', '', '', '', 0, http_cache_dir=None)
+    text = (fixtures_dir / 'lineups' / f'{date}.html').read_text(encoding='utf-8')
+
+    batters, pitchers = scraper._parse_lineups(text, date)
+    soup_batters, soup_pitchers = scraper._parse_lineups_soup(text, date)
+
+    assert len(batters) == 270 and len(pitchers) == 30
+    pd.testing.assert_frame_equal(batters, soup_batters, check_dtype=False)
+    pd.testing.assert_frame_equal(pitchers, soup_pitchers, check_dtype=False)
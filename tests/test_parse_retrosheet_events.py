@@ -0,0 +1,134 @@
+import datetime
+
+import polars as pl
+import pytest
+
+from parse_retrosheet_events import (
+    EVENT_CAUGHT_STEALING, EVENT_DOUBLE, EVENT_ERROR, EVENT_GENERIC_OUT, EVENT_HIT_BY_PITCH, EVENT_SINGLE,
+    EVENT_WALK, EVENT_WILD_PITCH, EVENTS_SCHEMA, iter_games, load_rosters, parse_event_file, parse_game,
+)
+
+
+@pytest.fixture
+def retrosheet_dir(fixtures_dir):
+    return fixtures_dir / 'retrosheet'
+
+
+@pytest.fixture
+def game(retrosheet_dir):
+    """Game row and event rows of the single game in the fixture event file."""
+    hands = load_rosters(str(retrosheet_dir), 2023)
+    (game_id, records), = iter_games(retrosheet_dir / '2023TST.EVN')
+    return parse_game(game_id, records, hands)
+
+
+def column(rows, name):
+    return [row[name] for row in rows]
+
+
+def test_walks_and_hit_by_pitch_force_runners(game):
+    _, rows = game
+    walks = rows[:4]
+
+    assert column(walks, 'EVENT_CD') == [EVENT_WALK, EVENT_HIT_BY_PITCH, EVENT_WALK, EVENT_WALK]
+    assert column(walks, 'BASE1_RUN_ID') == [None, 'aw001', 'aw002', 'aw003']
+    assert column(walks, 'BASE2_RUN_ID') == [None, None, 'aw001', 'aw002']
+    assert column(walks, 'BASE3_RUN_ID') == [None, None, None, 'aw001']
+    # Only the bases-loaded walk forces a run in
+    assert column(walks, 'RBI_CT') == [0, 0, 0, 1]
+    assert rows[4]['AWAY_SCORE_CT'] == 1
+
+
+def test_explicit_advances_and_rbi_parameters(game):
+    _, rows = game
+    wild_pitch, single, double_play, _, error = rows[4:9]
+
+    assert wild_pitch['EVENT_CD'] == EVENT_WILD_PITCH and wild_pitch['RBI_CT'] == 0
+    assert (single['BASE1_RUN_ID'], single['BASE2_RUN_ID'], single['BASE3_RUN_ID']) == (None, 'pr001', 'aw003')
+    # S8.3-H(NR);2-3: the run scores without an RBI and the trail runner stops at third
+    assert single['EVENT_CD'] == EVENT_SINGLE and single['RBI_CT'] == 0
+    assert double_play['AWAY_SCORE_CT'] == 3 and double_play['BASE3_RUN_ID'] == 'pr001'
+    # E6.3-H(RBI): errors credit no RBI unless the advance says so
+    assert error['EVENT_CD'] == EVENT_ERROR and error['RBI_CT'] == 1
+
+
+def test_double_play_suppresses_rbi(game):
+    _, rows = game
+    double_play, triple = rows[6:8]
+
+    assert double_play['EVENT_CD'] == EVENT_GENERIC_OUT
+    assert double_play['RBI_CT'] == 0
+    assert triple['OUTS_CT'] == 2
+    assert triple['AWAY_SCORE_CT'] == 4
+
+
+def test_pinch_runner_takes_over_base_and_fate(game):
+    _, rows = game
+    wild_pitch = rows[4]
+
+    assert wild_pitch['BASE1_RUN_ID'] == 'pr001'
+    assert wild_pitch['PR_Run1_fl'] == 'T'
+    assert rows[6]['PR_Run3_fl'] == 'T'
+    assert rows[8]['bat_id'] == 'pr001' and rows[8]['BAT_LINEUP_ID'] == 4
+    # aw004 reached on the walk and the pinch runner scored
+    assert rows[3]['BAT_FATE_ID'] == 4
+
+
+def test_bat_fate_id(game):
+    _, rows = game
+
+    # Walks and HBP that scored, the single thrown out at second, the triple that scored, the outs
+    assert column(rows[:10], 'BAT_FATE_ID') == [4, 4, 4, 4, 0, 1, 0, 4, 1, 0]
+
+
+def test_radj_places_runner_on_base(game):
+    game_row, rows = game
+    double, strikeout = rows[10:]
+
+    assert double['EVENT_CD'] == EVENT_DOUBLE
+    assert double['BASE2_RUN_ID'] == 'hm002'
+    assert double['RBI_CT'] == 1
+    assert strikeout['HOME_SCORE_CT'] == 1
+    assert game_row['GAME_DT'] == datetime.date(2023, 4, 1)
+    assert game_row['TEMP_PARK_CT'] == 68
+
+
+def test_hand_adjustments_last_the_plate_appearance(game):
+    _, rows = game
+    wild_pitch, single = rows[4:6]
+
+    # aw001 is a switch hitter, so aw001 bats left against the right-handed hp001 by default
+    assert (rows[0]['BAT_HAND_CD'], rows[0]['PIT_HAND_CD']) == ('L', 'R')
+    # badj/padj hold through the mid-PA wild pitch until the single ends the plate appearance
+    assert (wild_pitch['BAT_HAND_CD'], wild_pitch['PIT_HAND_CD']) == ('R', 'L')
+    assert (single['BAT_HAND_CD'], single['PIT_HAND_CD']) == ('R', 'L')
+    assert (rows[9]['BAT_HAND_CD'], rows[9]['PIT_HAND_CD']) == ('L', 'R')
+
+
+def test_hand_adjustments_end_when_the_next_batter_comes_up():
+    hands = {'b1': ('B', 'R'), 'b2': ('B', 'R'), 'p1': ('R', 'R'), 'r1': ('R', 'R')}
+    records = [
+        ('start', ['p1', 'Pitcher', '1', '0', '1']),
+        ('start', ['b1', 'One', '0', '1', '8']),
+        ('start', ['b2', 'Two', '0', '2', '6']),
+        ('radj', ['r1', '1']),
+        ('badj', ['b1', 'R']),
+        ('play', ['1', '0', 'b1', '00', 'B', 'CS2(26)']),
+        ('play', ['2', '0', 'b2', '00', 'X', 'S7']),
+    ]
+
+    _, rows = parse_game('TST202304020', records, hands)
+
+    assert rows[0]['EVENT_CD'] == EVENT_CAUGHT_STEALING
+    assert rows[0]['BAT_HAND_CD'] == 'R'
+    assert rows[1]['BAT_HAND_CD'] == 'L'
+
+
+def test_parse_event_file_writes_partitions(retrosheet_dir, tmp_path):
+    path, year, games, events = parse_event_file(retrosheet_dir / '2023TST.EVN', retrosheet_dir, tmp_path)
+
+    assert (year, games, events) == (2023, 1, 12)
+    written = pl.read_parquet(tmp_path / 'events' / '2023' / 'TST.parquet')
+    assert written.schema == pl.Schema(EVENTS_SCHEMA)
+    assert written['RBI_CT'].sum() == 3
+    assert pl.read_parquet(tmp_path / 'games' / '2023' / 'TST.parquet')['GAME_ID'].to_list() == ['TST202304010']
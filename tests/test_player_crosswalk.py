@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+import create_model_ready
+from create_model_ready import PlayerCrosswalk
+
+
+@pytest.fixture
+def register_calls(monkeypatch):
+    """Stand-in for pybaseball.chadwick_register; returns the list of calls made to it."""
+    calls = []
+
+    def chadwick_register():
+        calls.append(None)
+        return pd.DataFrame({
+            'name_last': ['Cole', 'Prospect', 'Rookie'], 'name_first': ['Gerrit', 'Minor', 'New'],
+            'key_mlbam': [543037.0, 700001.0, 700002.0], 'key_retro': ['coleg001', None, 'rookn001'],
+            'key_bbref': None, 'key_fangraphs': None, 'mlb_played_first': None, 'mlb_played_last': None,
+        })
+
+    monkeypatch.setattr(create_model_ready, 'chadwick_register', chadwick_register)
+    return calls
+
+
+@pytest.fixture
+def crosswalk(register_calls, tmp_path):
+    """Crosswalk whose disk copy predates the rookie."""
+    path = tmp_path / 'player_crosswalk.parquet'
+    PlayerCrosswalk(path)
+    table = pd.read_parquet(path)
+    table[table['key_mlbam'] != 700002].to_parquet(path, index=False)
+    register_calls.clear()
+    return PlayerCrosswalk(path)
+
+
+def test_ids_without_retrosheet_key_do_not_refresh(crosswalk, register_calls):
+    assert list(crosswalk.to_retro([543037, 700001, None])) == ['coleg001', None, None]
+    assert register_calls == []
+
+
+def test_unknown_ids_refresh_once(crosswalk, register_calls):
+    assert list(crosswalk.to_retro([700002, 543037])) == ['rookn001', 'coleg001']
+    assert list(crosswalk.to_retro([999999])) == [None]
+    assert len(register_calls) == 1
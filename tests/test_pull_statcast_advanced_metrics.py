@@ -0,0 +1,81 @@
+import logging
+
+import pandas as pd
+import pytest
+import sqlalchemy
+
+
+class FixedSchedule:
+    """SeasonSchedule stand-in with known doubleheader start-time order."""
+
+    def __init__(self, game_order):
+        self._game_order = game_order
+
+    def game_order(self, year):
+        return self._game_order
+
+
+@pytest.fixture
+def loader(statcast_loader_class, tmp_path):
+    """Loader whose retrosheet.games lives in SQLite, with NYY's 202 starting before 201 on 2023-04-15."""
+    path = tmp_path / 'retrosheet.db'
+    engine = sqlalchemy.create_engine('sqlite://')
+
+    @sqlalchemy.event.listens_for(engine, 'connect')
+    def attach_retrosheet(connection, record):
+        connection.execute(f"ATTACH DATABASE '{path}' AS retrosheet")
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql('CREATE TABLE retrosheet.games (GAME_ID TEXT, YEAR_ID INTEGER)')
+        connection.exec_driver_sql("INSERT INTO retrosheet.games VALUES ('BOS202304150', 2023), "
+                                   "('NYA202304151', 2023), ('NYA202304152', 2023), ('SEA202304150', 2023)")
+
+    loader = statcast_loader_class('', '', '', '', 0, enable_cache=False)
+    loader.engine = engine
+    loader.schedule = FixedSchedule({100: 1, 201: 2, 202: 1})
+    return loader
+
+
+def pitches(games):
+    """Two pitch rows per (game_pk, home_team, game_date)."""
+    return pd.DataFrame([{'game_pk': game_pk, 'home_team': home_team, 'game_date': game_date, 'batter': batter}
+                         for game_pk, home_team, game_date in games for batter in (1, 2)])
+
+
+def test_retrosheet_game_index_numbers_doubleheaders(loader):
+    index = loader.retrosheet_game_index(2023)
+
+    assert index['game_id'].tolist() == ['BOS202304150', 'NYA202304151', 'NYA202304152', 'SEA202304150']
+    assert index['game_order'].tolist() == [1, 1, 2, 1]
+    assert index['home_team_rs'].tolist() == ['BOS', 'NYA', 'NYA', 'SEA']
+    # Read once per season
+    loader.engine = None
+    assert loader.retrosheet_game_index(2023) is index
+
+
+def test_doubleheader_games_are_matched_by_start_time(loader):
+    df = pitches([(100, 'BOS', '2023-04-15'), (201, 'NYY', '2023-04-15'), (202, 'NYY', '2023-04-15'),
+                  (300, 'SEA', '2023-04-15')])
+
+    result = loader.create_retrosheet_game_ids(df)
+
+    game_ids = result.drop_duplicates('game_pk').set_index('game_pk')['game_id']
+    assert game_ids.to_dict() == {100: 'BOS202304150', 201: 'NYA202304152', 202: 'NYA202304151',
+                                  300: 'SEA202304150'}
+
+
+def test_unmatched_games_are_reported(loader, caplog):
+    # A postseason date retrosheet.games does not have yet, with a doubleheader missing from the schedule
+    df = pitches([(100, 'BOS', '2023-04-15'), (402, 'LAD', '2023-10-07'), (401, 'LAD', '2023-10-07'),
+                  (500, 'CWS', '2023-10-07')])
+
+    with caplog.at_level(logging.WARNING):
+        result = loader.create_retrosheet_game_ids(df)
+
+    game_ids = result.drop_duplicates('game_pk').set_index('game_pk')['game_id']
+    # Unverified GAME_IDs: the doubleheader in game_pk order, a single game as 0
+    assert game_ids.to_dict() == {100: 'BOS202304150', 401: 'LAN202310071', 402: 'LAN202310072',
+                                  500: 'CHA202310070'}
+    warning, = [record.getMessage() for record in caplog.records if 'not in retrosheet.games' in record.getMessage()]
+    assert '3 of 4 games (6 rows)' in warning
+    assert 'LAN202310072' in warning
@@ -0,0 +1,88 @@
+import pytest
+
+import rate_limiter
+from rate_limiter import TokenBucket, backoff_delay, call_with_retry
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that time.sleep advances; records each sleep."""
+    state = {'now': 0.0, 'sleeps': []}
+
+    def sleep(seconds):
+        state['sleeps'].append(seconds)
+        state['now'] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', lambda: state['now'])
+    monkeypatch.setattr(rate_limiter.time, 'sleep', sleep)
+    monkeypatch.setattr(rate_limiter.random, 'uniform', lambda low, high: 1.0)
+    return state
+
+
+def test_throttled_halves_the_rate_down_to_min_rate(clock):
+    limiter = TokenBucket(rate=8.0)
+
+    rates = []
+    for _ in range(6):
+        limiter.throttled()
+        rates.append(limiter.rate)
+
+    assert rates == [4.0, 2.0, 1.0, 0.5, 0.5, 0.5]
+    # Successes give back a tenth of the configured rate at a time, up to it
+    for _ in range(20):
+        limiter.succeeded()
+    assert limiter.rate == 8.0
+
+
+def test_acquire_waits_at_the_throttled_rate(clock):
+    limiter = TokenBucket(rate=2.0, capacity=1)
+    assert limiter.acquire() == 0.0
+
+    limiter.throttled()
+
+    assert limiter.acquire() == pytest.approx(1.0)
+    assert limiter.acquire(tokens=3) == pytest.approx(3.0)
+    assert limiter.wait_seconds == pytest.approx(4.0)
+
+
+def test_call_with_retry_backs_off_exponentially(clock):
+    limiter = TokenBucket(rate=100.0)
+    responses = iter([RuntimeError('429'), RuntimeError('429'), None, ['pitch']])
+    retries = []
+
+    def request():
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    response, stats = call_with_retry(request, limiter, retries=3, empty_retries=1, base_delay=1.0,
+                                      on_retry=lambda attempt, reason, delay: retries.append((attempt, reason, delay)))
+
+    assert response == ['pitch']
+    assert stats['attempts'] == 4
+    assert [delay for _, _, delay in retries] == [1.0, 2.0, 4.0]
+    assert [reason for _, reason, _ in retries] == ['error: 429', 'error: 429', 'empty response']
+    assert stats['backoff_wait'] == pytest.approx(7.0)
+    assert clock['sleeps'] == [1.0, 2.0, 4.0]
+    # Two throttles, then one success
+    assert limiter.rate == pytest.approx(25.0 + 10.0)
+
+
+def test_call_with_retry_gives_up(clock):
+    limiter = TokenBucket(rate=100.0)
+
+    def failing():
+        raise ConnectionError('reset')
+
+    with pytest.raises(ConnectionError):
+        call_with_retry(failing, limiter, retries=2)
+    assert len(clock['sleeps']) == 2
+
+    response, stats = call_with_retry(lambda: None, limiter, empty_retries=1)
+    assert response is None and stats['attempts'] == 2
+
+
+def test_backoff_delay_is_capped():
+    assert backoff_delay(10, base_delay=1.0, max_delay=60.0) <= 90.0
+    assert 0.5 <= backoff_delay(0, base_delay=1.0) <= 1.5
@@ -0,0 +1,80 @@
+import io
+
+import pandas as pd
+import pytest
+
+import savant_csv
+from savant_csv import PITCH_SCHEMA, compact_pitches, fetch_savant_csv, read_savant_csv
+
+
+@pytest.fixture
+def savant_file(fixtures_dir):
+    return fixtures_dir / 'savant_2023-04-01.csv'
+
+
+def assert_compact_types(df):
+    for column in ('game_pk', 'batter', 'pitcher'):
+        assert df[column].dtype == 'int32'
+    for column in ('pitch_number', 'at_bat_number'):
+        assert df[column].dtype == 'Int16'
+    for column in ('release_speed', 'release_spin_rate', 'launch_speed', 'launch_angle',
+                   'estimated_ba_using_speedangle', 'estimated_woba_using_speedangle',
+                   'estimated_slg_using_speedangle'):
+        assert df[column].dtype == 'float32'
+    for column in ('player_name', 'home_team', 'away_team', 'type'):
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df['game_date'])
+
+
+def test_read_savant_csv_prunes_columns_and_compacts_types(savant_file):
+    pitches = read_savant_csv(savant_file)
+
+    assert list(pitches.columns) == list(PITCH_SCHEMA)
+    assert len(pitches) == 6
+    assert_compact_types(pitches)
+    assert pitches['game_date'].iloc[0] == pd.Timestamp('2023-04-01')
+    assert pitches['player_name'].iloc[0] == 'Cole, Gerrit'
+    # Pitches without contact have no batted-ball values
+    assert pitches['launch_speed'].isna().sum() == 2
+    assert pitches['estimated_ba_using_speedangle'].isna().sum() == 3
+
+
+def test_read_savant_csv_reads_only_requested_columns(savant_file):
+    pitches = read_savant_csv(savant_file, columns=['game_pk', 'launch_speed', 'not_in_csv'])
+
+    assert list(pitches.columns) == ['game_pk', 'launch_speed']
+    assert pitches['launch_speed'].dtype == 'float32'
+
+
+def test_compact_pitches_matches_direct_read(savant_file):
+    # Full-width, loosely typed data as pybaseball returns it
+    wide = pd.read_csv(savant_file)
+    assert 'pitch_type' in wide.columns
+
+    compact = compact_pitches(wide)
+
+    assert_compact_types(compact)
+    pd.testing.assert_frame_equal(compact, read_savant_csv(savant_file), check_dtype=False)
+
+
+class EmptyResponse:
+    """Streamed response with an empty body, as Savant sends for dates without games."""
+    raw = io.BytesIO(b'')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+def test_fetch_savant_csv_empty_response(monkeypatch):
+    monkeypatch.setattr(savant_csv.requests, 'get', lambda *args, **kwargs: EmptyResponse())
+
+    pitches = fetch_savant_csv('2023-12-25', '2023-12-25')
+
+    assert pitches.empty
+    assert list(pitches.columns) == list(PITCH_SCHEMA)
@@ -0,0 +1,46 @@
+import sqlalchemy
+from sqlalchemy import event
+
+from sql_stage_executor import StageExecutor
+
+SCRIPT = """
+CREATE TABLE IF NOT EXISTS game_dates (GAME_DATE TEXT);
+
+-- @stage: game_dates
+DELETE FROM game_dates;
+INSERT INTO game_dates SELECT strftime('%Y%m%d', '2023-04-01');
+SELECT COUNT(*) FROM game_dates;
+"""
+
+
+def pymysql_formatting_engine(path):
+    """
+    SQLite engine that formats statements the way pymysql does: `statement % parameters`
+    whenever the driver receives a parameter collection, even an empty one.
+    """
+    engine = sqlalchemy.create_engine(f'sqlite:///{path}')
+
+    @event.listens_for(engine, 'do_execute', retval=True)
+    def do_execute(cursor, statement, parameters, context):
+        if statement.startswith('SET @'):
+            return True  # user variables are MySQL only
+        statement % parameters
+        cursor.execute(statement, parameters)
+        return True
+
+    return engine
+
+
+def test_run_stage_sends_percent_literals_unformatted(tmp_path):
+    script = tmp_path / 'script.sql'
+    script.write_text(SCRIPT)
+    engine = pymysql_formatting_engine(tmp_path / 'stage.db')
+
+    result = StageExecutor(engine, script, echo=False).run_stage(2023, 'game_dates')
+
+    assert result['success'], result['error']
+    assert result['rows'] == 1
+    assert result['tables'] == ['game_dates']
+    assert result['output'] == ['1']
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql('SELECT GAME_DATE FROM game_dates').scalar() == '20230401'
@@ -0,0 +1,26 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+from at_bat_level_polars import compare_frames
+from savant_csv import read_savant_csv
+from statcast_game_polars import aggregate_game_stats, pitches_from_pandas
+
+
+@pytest.mark.parametrize('reader', [read_savant_csv, pd.read_csv], ids=['pitch_store', 'pybaseball'])
+def test_polars_aggregations_match_pandas(statcast_loader_class, fixtures_dir, reader):
+    df = reader(fixtures_dir / 'savant_2023-04-01.csv')
+
+    loader = statcast_loader_class
+    pitches = loader.derive_pitch_flags(df)
+    pandas_stats = (loader.aggregate_batter_pitches(pitches), loader.aggregate_pitcher_pitches(pitches))
+    polars_stats = aggregate_game_stats(pitches_from_pandas(df))
+
+    keys = (['game_pk', 'batter_id'], ['game_pk', 'pitcher_id'])
+    for expected, actual, key_columns in zip(pandas_stats, polars_stats, keys):
+        assert len(actual) > 0
+        expected = pl.from_pandas(expected[actual.columns].astype({'game_date': 'datetime64[us]'}))
+        result = compare_frames(expected, actual, key_columns)
+        assert result['expected_rows'] == result['actual_rows']
+        assert result['missing_rows'] == result['extra_rows'] == 0
+        assert result['column_mismatches'] == {}
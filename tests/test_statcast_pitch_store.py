@@ -0,0 +1,45 @@
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from statcast_pitch_store import SETTLE_DAYS, StatcastPitchStore
+
+
+def fake_savant(calls):
+    """Fetch function returning one pitch per date of the requested range."""
+    def fetch(start_dt, end_dt):
+        calls.append((start_dt, end_dt))
+        days = pd.date_range(start_dt, end_dt)
+        return pd.DataFrame({'game_pk': range(len(days)), 'game_date': days, 'release_speed': 95.0})
+    return fetch
+
+
+def test_unsettled_dates_are_read_live_and_not_stored(tmp_path):
+    calls = []
+    store = StatcastPitchStore(tmp_path, fetch=fake_savant(calls))
+    today = date.today()
+    start = today - timedelta(days=SETTLE_DAYS + 2)
+    yesterday = today - timedelta(days=1)
+
+    pitches = store.load_range(start, yesterday)
+
+    assert len(pitches) == (yesterday - start).days + 1
+    stored = sorted(path.stem for path in tmp_path.rglob('*.parquet'))
+    assert stored == [(start + timedelta(days=offset)).isoformat() for offset in range(3)]
+    assert calls[-1] == ((today - timedelta(days=SETTLE_DAYS - 1)).isoformat(), yesterday.isoformat())
+
+
+def test_files_written_before_their_date_settled_are_fetched_again(tmp_path):
+    calls = []
+    store = StatcastPitchStore(tmp_path, fetch=fake_savant(calls))
+    day = date.today() - timedelta(days=10)
+    store.write_date(day, pd.DataFrame())
+    written = time.mktime(datetime.combine(day, datetime.min.time()).timetuple()) + 3600
+    os.utime(store.date_path(day), (written, written))
+
+    assert store.missing_dates(day, day) == [day]
+    store.fetch_missing(day, day)
+    assert calls == [(day.isoformat(), day.isoformat())]
+    assert store.missing_dates(day, day) == []
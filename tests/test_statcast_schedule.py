@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+from statcast_schedule import DEFAULT_MAX_PITCHES, PITCHES_PER_GAME, SAVANT_ROW_CAP, plan_batches
+
+OPENING_DAY = date(2023, 3, 30)
+
+
+def season(days=40, games=15, off_days=()):
+    """games_per_date for consecutive dates from opening day, without the given off days."""
+    dates = (OPENING_DAY + timedelta(days=offset) for offset in range(days))
+    return {day: games for day in dates if day not in off_days}
+
+
+def batch_dates(batch):
+    first, last = (date.fromisoformat(day) for day in batch)
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def test_batches_stay_under_the_savant_row_cap():
+    games_per_date = season(off_days={date(2023, 4, 10)})
+    games_per_date[date(2023, 4, 20)] = 16  # a doubleheader day
+
+    batches = plan_batches(games_per_date, until=date(2023, 12, 31))
+
+    covered = [day for batch in batches for day in batch_dates(batch)]
+    assert covered == sorted(games_per_date)
+    for batch in batches:
+        pitches = sum(games_per_date[day] for day in batch_dates(batch)) * PITCHES_PER_GAME
+        assert pitches <= DEFAULT_MAX_PITCHES < SAVANT_ROW_CAP
+    # 15 games a day: four days (18,000 expected pitches) per request
+    assert batches[0] == ('2023-03-30', '2023-04-02')
+
+
+def test_a_date_above_the_limit_is_its_own_batch():
+    batches = plan_batches({OPENING_DAY: 15, OPENING_DAY + timedelta(days=1): 15}, max_pitches=4000,
+                           until=date(2023, 12, 31))
+
+    assert batches == [('2023-03-30', '2023-03-30'), ('2023-03-31', '2023-03-31')]
+
+
+def test_loaded_and_future_dates_are_skipped():
+    games_per_date = season(days=10)
+    loaded = [date(2023, 3, 30), '2023-03-31', date(2023, 4, 4)]
+
+    batches = plan_batches(games_per_date, max_days=3, skip_dates=loaded, until=date(2023, 4, 7))
+
+    # Loaded dates split the runs they fall in; nothing after `until` is requested
+    assert batches == [('2023-04-01', '2023-04-03'), ('2023-04-05', '2023-04-07')]
+    assert plan_batches(games_per_date, skip_dates=games_per_date, until=date(2023, 12, 31)) == []
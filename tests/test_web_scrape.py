@@ -0,0 +1,89 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from create_model_ready import WebScrape
+from savant_csv import SAVANT_CSV_PARAMS, SAVANT_CSV_URL
+
+
+@pytest.fixture
+def weather_server(fixtures_dir):
+    """Local stand-in for the weather search: serves the saved page of each city, 404 for others."""
+    pages = {path.stem: path.read_bytes() for path in (fixtures_dir / 'weather').glob('*.html')}
+    state = {'requests': [], 'in_flight': 0, 'max_in_flight': 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            city = parse_qs(urlparse(self.path).query)['q'][0].replace(' weather', '').lower()
+            with lock:
+                state['requests'].append(city)
+                state['in_flight'] += 1
+                state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            time.sleep(0.2)
+            with lock:
+                state['in_flight'] -= 1
+            body = pages.get(city)
+            self.send_response(200 if body else 404)
+            body = body or b'Not found'
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state['url'] = f'http://127.0.0.1:{server.server_port}/search?q={{query}}'
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def scraper(weather_server, monkeypatch):
+    monkeypatch.setattr(WebScrape, 'WEATHER_URL', weather_server['url'])
+    return WebScrape('', '', '', '', 0, weather_ttl=60, http_cache_dir=None)
+
+
+def test_get_weathers_fetches_cities_concurrently(scraper, weather_server):
+    weather = scraper.get_weathers(['Boston', 'Denver', 'Nowhere'])
+
+    assert weather_server['max_in_flight'] > 1
+    assert list(weather['CITY']) == ['Boston', 'Denver']
+    assert list(weather['Location']) == ['Boston, MA', 'Denver, CO']
+    assert list(weather['WEATHER_PARK_CD']) == ['Partly cloudy', 'Sunny']
+    assert list(weather['TEMP_PARK_CT']) == ['68', '81']
+    assert list(weather['WIND_SPEED_PARK_CT']) == [12, 7]
+    assert list(weather['HUMIDITY_PARK_CT']) == ['54', '18']
+
+
+def test_get_weathers_reuses_weather_within_ttl(scraper, weather_server):
+    first = scraper.get_weathers(['Boston', 'Denver'])
+    requests = len(weather_server['requests'])
+
+    second = scraper.get_weathers(['Denver', 'Boston'])
+
+    assert len(weather_server['requests']) == requests
+    assert list(second['CITY']) == ['Denver', 'Boston']
+    assert second.set_index('CITY').loc['Boston'].equals(first.set_index('CITY').loc['Boston'])
+
+    scraper.weather_ttl = 0
+    scraper.get_weathers(['Boston'])
+    assert len(weather_server['requests']) == requests + 1
+
+
+def test_statcast_csv_url_uses_the_savant_search_parameters():
+    url = urlparse(WebScrape.STATCAST_CSV_URL.format(date='2023-04-01'))
+
+    assert f'{url.scheme}://{url.netloc}{url.path}' == SAVANT_CSV_URL
+    params = dict(SAVANT_CSV_PARAMS, game_date_gt='2023-04-01', game_date_lt='2023-04-01')
+    assert parse_qs(url.query) == {name: [str(value)] for name, value in params.items()}
+    # Regular season and postseason only
+    assert parse_qs(url.query)['hfGT'] == ['R|PO|']